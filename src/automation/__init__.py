@@ -5,6 +5,16 @@ Módulo responsável pela automação web usando Playwright.
 Contém engines de automação, gerenciamento de browser e conexões.
 """
 
+from .page_state import PageState
+from .selectors import SelectorRegistry, get_selector_registry
+from .step_outcome import StepOutcome
 from .web_engine import WebAutomationEngine, get_web_engine
 
-__all__ = ['WebAutomationEngine', 'get_web_engine']
+__all__ = [
+    'PageState',
+    'SelectorRegistry',
+    'StepOutcome',
+    'WebAutomationEngine',
+    'get_selector_registry',
+    'get_web_engine',
+]
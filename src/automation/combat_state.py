@@ -0,0 +1,88 @@
+"""
+⚔️ Combat State Snapshot for SimpleMMO Bot
+
+Typed result of a single in-page read of the combat page's Alpine data
+(enemy and player HP). Replaces reading the HP bar's style attribute and
+text content with separate round trips and parsing them in Python.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+SOURCE_ALPINE = "alpine"  # read from the Alpine component state
+SOURCE_DOM = "dom"  # Alpine data unavailable, read from the HP bar element
+
+# Conditions reported by the in-page combat waiter
+COMBAT_EVENT_ATTACK = "attack"  # attack button ready again
+COMBAT_EVENT_DEFEATED = "defeated"  # enemy HP reached 0
+COMBAT_EVENT_LEAVE = "leave"  # leave button shown (combat over)
+COMBAT_EVENT_TIMEOUT = "timeout"  # nothing happened before the timeout
+
+
+def _number(value: Any) -> float | None:
+    """Convert a payload value to float (None if missing)"""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+@dataclass(frozen=True)
+class CombatState:
+    """Enemy and player HP on the combat page, captured in one round trip"""
+
+    source: str = SOURCE_ALPINE
+    enemy_hp_percentage: float | None = None
+    enemy_current_hp: float | None = None
+    enemy_max_hp: float | None = None
+    player_hp_percentage: float | None = None
+    player_current_hp: float | None = None
+    player_max_hp: float | None = None
+    captured_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def enemy_defeated(self) -> bool:
+        """True if the enemy HP is known and has reached zero"""
+        if self.enemy_current_hp is not None:
+            return self.enemy_current_hp <= 0
+        return self.enemy_hp_percentage is not None and self.enemy_hp_percentage <= 0
+
+    @property
+    def player_dead(self) -> bool:
+        """True if the player HP is known and has reached zero"""
+        if self.player_current_hp is not None:
+            return self.player_current_hp <= 0
+        return self.player_hp_percentage is not None and self.player_hp_percentage <= 0
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "CombatState":
+        """Build a CombatState from the dict returned by the in-page reader"""
+        return cls(
+            source=str(payload.get("source") or SOURCE_ALPINE),
+            enemy_hp_percentage=_number(payload.get("enemy_hp_percentage")),
+            enemy_current_hp=_number(payload.get("enemy_current_hp")),
+            enemy_max_hp=_number(payload.get("enemy_max_hp")),
+            player_hp_percentage=_number(payload.get("player_hp_percentage")),
+            player_current_hp=_number(payload.get("player_current_hp")),
+            player_max_hp=_number(payload.get("player_max_hp")),
+        )
+
+
+@dataclass(frozen=True)
+class CombatEvent:
+    """Condition that ended a combat wait, with the HP snapshot taken at that moment"""
+
+    event: str = COMBAT_EVENT_TIMEOUT
+    state: CombatState | None = None
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "CombatEvent":
+        """Build a CombatEvent from the dict resolved by the in-page waiter"""
+        state = payload.get("state")
+        return cls(
+            event=str(payload.get("event") or COMBAT_EVENT_TIMEOUT),
+            state=CombatState.from_payload(state) if isinstance(state, dict) else None,
+        )
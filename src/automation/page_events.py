@@ -0,0 +1,159 @@
+"""
+📡 Page Event Bus for SimpleMMO Bot
+
+Receives PageState snapshots pushed by the in-page MutationObserver
+(through a Playwright binding) and wakes the bot loop only when the
+relevant page elements actually changed. Long actions can run under a
+watcher that cancels them as soon as a pushed state shows a captcha or
+death.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from loguru import logger
+
+from .page_state import PageState
+
+INTERRUPT_POLL_INTERVAL = 1.0  # seconds between state reads when nothing is pushed
+
+
+class PageEventBus:
+    """Push-based page state notifications for the bot loop"""
+
+    def __init__(self):
+        """Initialize Page Event Bus"""
+        self.active = False
+        self.latest_state: PageState | None = None
+        self._fresh = False
+        self._event: asyncio.Event | None = None
+        self._event_loop: asyncio.AbstractEventLoop | None = None
+        self._watchers: list[asyncio.Future] = []
+        self.stats = {
+            "events_received": 0,
+            "wakeups": 0,
+            "timeouts": 0,
+            "interrupts": 0,
+        }
+
+    def _get_event(self) -> asyncio.Event:
+        """Get the wake-up event bound to the running loop (GUI restarts use new loops)"""
+        loop = asyncio.get_running_loop()
+        if self._event is None or self._event_loop is not loop:
+            self._event = asyncio.Event()
+            self._event_loop = loop
+        return self._event
+
+    def publish(self, payload: dict[str, Any]) -> None:
+        """Binding callback - store the pushed snapshot and wake any waiter"""
+        try:
+            state = PageState.from_payload(payload)
+        except Exception as e:
+            logger.debug(f"Invalid page event payload: {e}")
+            return
+
+        self.latest_state = state
+        self._fresh = True
+        self.stats["events_received"] += 1
+        self._get_event().set()
+        self.check_interrupts(state)
+
+    def check_interrupts(self, state: PageState) -> None:
+        """Signal every running watcher if the state requires stopping the action"""
+        reason = state.interrupt_reason
+        if reason is None:
+            return
+
+        for watcher in self._watchers:
+            if not watcher.done():
+                watcher.set_result(reason)
+                self.stats["interrupts"] += 1
+
+    async def run_until_interrupt(
+        self,
+        awaitable: Awaitable[Any],
+        poll: Callable[[], Awaitable[PageState | None]] | None = None,
+        poll_interval: float = INTERRUPT_POLL_INTERVAL,
+    ) -> tuple[Any, str | None]:
+        """Run an action, cancelling it the moment a captcha or death appears
+
+        Args:
+            awaitable: The action (e.g. a combat or gathering run)
+            poll: State reader used when the page does not push changes
+            poll_interval: Seconds between poll reads
+
+        Returns:
+            (result, None) if the action finished, (None, reason) if interrupted
+        """
+        watcher = asyncio.get_running_loop().create_future()
+        self._watchers.append(watcher)
+        action = asyncio.ensure_future(awaitable)
+        poller = asyncio.ensure_future(self._poll_interrupts(poll, poll_interval)) if poll else None
+
+        try:
+            await asyncio.wait({action, watcher}, return_when=asyncio.FIRST_COMPLETED)
+            if action.done():
+                return action.result(), None
+
+            action.cancel()
+            await asyncio.wait({action})
+            reason = watcher.result()
+            logger.warning(f"⚠️ Action interrupted: {reason}")
+            return None, reason
+        finally:
+            self._watchers.remove(watcher)
+            for task in (action, poller):
+                if task is not None and not task.done():
+                    task.cancel()
+
+    async def _poll_interrupts(
+        self, poll: Callable[[], Awaitable[PageState | None]], interval: float
+    ) -> None:
+        """Fallback watcher - read the state periodically when nothing is pushed"""
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                state = await poll()
+            except Exception as e:
+                logger.debug(f"Interrupt poll failed: {e}")
+                continue
+            if state is not None:
+                self.check_interrupts(state)
+
+    def wake(self) -> None:
+        """Wake any waiter without a new snapshot (e.g. a step response arrived)"""
+        self._get_event().set()
+
+    def pop_state(self) -> PageState | None:
+        """Return the latest pushed snapshot if it was not consumed yet"""
+        if not self._fresh:
+            return None
+
+        self._fresh = False
+        return self.latest_state
+
+    async def wait_for_change(self, timeout: float) -> bool:
+        """Wait until the page pushes a change or the timeout expires
+
+        Returns:
+            True if woken by a page event, False on timeout
+        """
+        if self._fresh:
+            return True
+
+        event = self._get_event()
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            self.stats["wakeups"] += 1
+            return True
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            return False
+        finally:
+            event.clear()
+
+    def reset(self) -> None:
+        """Forget pushed state (e.g. after the page was replaced)"""
+        self.latest_state = None
+        self._fresh = False
@@ -0,0 +1,624 @@
+"""
+📜 In-page scripts for SimpleMMO Bot
+
+JavaScript sources evaluated inside the game page by the web engine.
+Keeping them in one module lets every system share the same DOM helpers
+instead of issuing one Playwright round trip per selector.
+"""
+
+# Shared DOM helpers + page state snapshot.
+# Installed once per document (init script) and exposed as window.__botPageState().
+PAGE_STATE_SCRIPT = """
+(() => {
+    if (window.__botPageState) {
+        return;
+    }
+
+    const isVisible = (el) => {
+        if (!el || !el.isConnected) {
+            return false;
+        }
+        const style = window.getComputedStyle(el);
+        if (style.visibility === "hidden" || style.display === "none") {
+            return false;
+        }
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+
+    const isEnabled = (el) => !el.disabled && el.getAttribute("aria-disabled") !== "true";
+
+    const textOf = (el) => (el.textContent || "").replace(/\\s+/g, " ").trim().toLowerCase();
+
+    const findByText = (selector, needles) => {
+        for (const el of document.querySelectorAll(selector)) {
+            const text = textOf(el);
+            if (needles.some((needle) => text.includes(needle)) && isVisible(el)) {
+                return el;
+            }
+        }
+        return null;
+    };
+
+    const findByXPath = (xpath) => {
+        const result = document.evaluate(
+            xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+        );
+        for (let i = 0; i < result.snapshotLength; i++) {
+            const el = result.snapshotItem(i);
+            if (isVisible(el)) {
+                return el;
+            }
+        }
+        return null;
+    };
+
+    const hasDisabledStyling = (el) => {
+        const classes = (el.getAttribute("class") || "").toLowerCase();
+        const style = (el.getAttribute("style") || "").replace(/\\s+/g, "");
+        return classes.includes("disabled") || classes.includes("opacity-40") || style.includes("opacity:0.4");
+    };
+
+    const snapshot = () => {
+        const travelCaptcha =
+            document.querySelector('a[href*="i-am-not-a-bot"][href*="new_page"]') ||
+            findByText("a", ["i'm a person!"]);
+
+        const combatCaptcha =
+            findByXPath('//a[@href="/i-am-not-a-bot" and (contains(@class, "btn-primary") or @target="_blank")]') ||
+            findByText("a", ["press here to verify"]);
+
+        const gatherButton = findByText("button", ["chop", "mine", "salvage", "catch"]);
+
+        const attackButton =
+            findByText("a, button", ["attack"]) ||
+            document.querySelector('a[href*="/npcs/attack/"]');
+
+        const stepButton = findByText("button", ["take a step"]) || findByText("a", ["take a step"]);
+
+        const leaveButton = findByText("button", ["leave"]);
+
+        const deathIndicator =
+            findByXPath('//a[contains(text(), "How do I heal?")]') ||
+            findByXPath('//div[contains(text(), "You have died")]') ||
+            findByXPath('//button[contains(text(), "Heal Character")]');
+
+        const amountElement = document.querySelector('[x-text="available_amount"]');
+        const amount = amountElement ? parseInt((amountElement.textContent || "").trim(), 10) : NaN;
+
+        return {
+            url: window.location.href,
+            travel_captcha: Boolean(travelCaptcha && isVisible(travelCaptcha)),
+            combat_captcha: Boolean(combatCaptcha),
+            gather_available: Boolean(gatherButton && isEnabled(gatherButton)),
+            gather_type: gatherButton ? textOf(gatherButton) : "",
+            attack_available: Boolean(attackButton && isVisible(attackButton) && isEnabled(attackButton)),
+            step_found: Boolean(stepButton),
+            step_available: Boolean(stepButton && isEnabled(stepButton)),
+            step_disabled_styling: Boolean(stepButton && hasDisabledStyling(stepButton)),
+            leave_available: Boolean(leaveButton),
+            is_dead: Boolean(deathIndicator),
+            available_amount: Number.isNaN(amount) ? null : amount,
+        };
+    };
+
+    window.__botDom = { isVisible, isEnabled, textOf, findByText, findByXPath, hasDisabledStyling };
+    window.__botPageState = snapshot;
+})();
+"""
+
+# Cheap call into the installed helper (returns null when the document has no helper yet)
+PAGE_STATE_EVAL = "() => (window.__botPageState ? window.__botPageState() : null)"
+
+# MutationObserver that pushes a fresh snapshot into Python (window.__botPageEvent binding)
+# whenever the relevant page flags change. Requires PAGE_STATE_SCRIPT to be installed first.
+PAGE_OBSERVER_SCRIPT = """
+(() => {
+    if (window.__botObserverInstalled) {
+        return;
+    }
+    window.__botObserverInstalled = true;
+
+    let lastSignature = null;
+    let scheduled = false;
+
+    const emit = () => {
+        scheduled = false;
+        if (!window.__botPageState || !window.__botPageEvent) {
+            return;
+        }
+        const state = window.__botPageState();
+        const signature = JSON.stringify(state);
+        if (signature === lastSignature) {
+            return;
+        }
+        lastSignature = signature;
+        window.__botPageEvent(state);
+    };
+
+    // Coalesce mutation bursts (Alpine re-renders) into one snapshot per task
+    const schedule = () => {
+        if (!scheduled) {
+            scheduled = true;
+            setTimeout(emit, 0);
+        }
+    };
+
+    const start = () => {
+        new MutationObserver(schedule).observe(document.documentElement, {
+            subtree: true,
+            childList: true,
+            characterData: true,
+            attributes: true,
+            attributeFilter: ["class", "style", "disabled", "aria-disabled", "href", "hidden"],
+        });
+        emit();
+    };
+
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", start, { once: true });
+    } else {
+        start();
+    }
+})();
+"""
+
+# Evaluate-side sweep over a compiled fallback selector list (see compile_selector_list).
+# Tries alternatives in order and returns the first one with an element satisfying the
+# visible/enabled requirements; optionally tags that element so Python can fetch it.
+SELECTOR_SWEEP_SCRIPT = """
+(args) => {
+    const isVisible = (el) => {
+        if (!el || !el.isConnected) {
+            return false;
+        }
+        const style = window.getComputedStyle(el);
+        if (style.visibility === "hidden" || style.display === "none") {
+            return false;
+        }
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+
+    const isEnabled = (el) => !el.disabled && el.getAttribute("aria-disabled") !== "true";
+
+    const textOf = (el) => (el.textContent || "").replace(/\\s+/g, " ").trim().toLowerCase();
+
+    const candidates = (alt) => {
+        if (alt.kind === "xpath") {
+            const result = document.evaluate(
+                alt.query, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+            );
+            const nodes = [];
+            for (let i = 0; i < result.snapshotLength; i++) {
+                nodes.push(result.snapshotItem(i));
+            }
+            return nodes;
+        }
+        const nodes = Array.from(document.querySelectorAll(alt.query));
+        if (alt.kind === "text") {
+            return nodes.filter((el) => textOf(el).includes(alt.text));
+        }
+        return nodes;
+    };
+
+    if (args.mark) {
+        for (const el of document.querySelectorAll("[" + args.attribute + "]")) {
+            el.removeAttribute(args.attribute);
+        }
+    }
+
+    const errors = [];
+    for (let index = 0; index < args.alternatives.length; index++) {
+        let nodes;
+        try {
+            nodes = candidates(args.alternatives[index]);
+        } catch (e) {
+            errors.push(index);
+            continue;
+        }
+
+        for (const el of nodes) {
+            if (!(el instanceof Element)) {
+                continue;
+            }
+            const visible = isVisible(el);
+            const enabled = isEnabled(el);
+            if ((args.visible && !visible) || (args.enabled && !enabled)) {
+                continue;
+            }
+            if (args.mark) {
+                el.setAttribute(args.attribute, args.mark);
+            }
+            return { index, visible, enabled, errors };
+        }
+    }
+    return { index: -1, visible: false, enabled: false, errors };
+}
+"""
+
+# Syntax check for compiled selectors: returns the indices the browser refuses to parse.
+# Nothing is matched against the document, so the check is cheap and side-effect free.
+SELECTOR_VALIDATE_SCRIPT = """
+(alternatives) => {
+    const invalid = [];
+    alternatives.forEach((alt, index) => {
+        try {
+            if (alt.kind === "xpath") {
+                document.createExpression(alt.query, null);
+            } else {
+                document.createDocumentFragment().querySelector(alt.query);
+            }
+        } catch (e) {
+            invalid.push(index);
+        }
+    });
+    return invalid;
+}
+"""
+
+# Combat HP snapshot read straight from the combat page's Alpine component
+# (enemy/player objects), with a DOM fallback evaluated in the same round trip.
+COMBAT_STATE_SCRIPT = """
+() => {
+    const num = (value) => {
+        if (value === null || value === undefined || value === "") {
+            return null;
+        }
+        const n = Number(typeof value === "string" ? value.replace(/[^0-9.\\-]/g, "") : value);
+        return Number.isFinite(n) ? n : null;
+    };
+
+    const percentage = (unit) => {
+        if (!unit) {
+            return null;
+        }
+        const direct = num(unit.hp_percentage);
+        if (direct !== null) {
+            return direct;
+        }
+        const current = num(unit.current_hp);
+        const max = num(unit.max_hp);
+        return current !== null && max ? (100 * current) / max : null;
+    };
+
+    // Alpine v3 keeps the scope stack on _x_dataStack, Alpine v2 on __x.$data
+    const scopeOf = (el) => {
+        for (let node = el; node; node = node.parentElement) {
+            for (const data of node._x_dataStack || []) {
+                if (data && data.enemy) {
+                    return data;
+                }
+            }
+            if (node.__x && node.__x.$data && node.__x.$data.enemy) {
+                return node.__x.$data;
+            }
+        }
+        return null;
+    };
+
+    const hpNode = document.querySelector('[x-text*="enemy.current_hp"]');
+    let scope = scopeOf(hpNode);
+    if (!scope) {
+        for (const el of document.querySelectorAll("[x-data]")) {
+            scope = scopeOf(el);
+            if (scope) {
+                break;
+            }
+        }
+    }
+
+    if (scope) {
+        const enemy = scope.enemy || null;
+        const player = scope.player || null;
+        return {
+            source: "alpine",
+            enemy_hp_percentage: percentage(enemy),
+            enemy_current_hp: enemy ? num(enemy.current_hp) : null,
+            enemy_max_hp: enemy ? num(enemy.max_hp) : null,
+            player_hp_percentage: percentage(player),
+            player_current_hp: player ? num(player.current_hp) : null,
+            player_max_hp: player ? num(player.max_hp) : null,
+        };
+    }
+
+    if (hpNode) {
+        return {
+            source: "dom",
+            enemy_hp_percentage: num(hpNode.style.width),
+            enemy_current_hp: num(hpNode.textContent),
+        };
+    }
+
+    return null;
+}
+"""
+
+# Resolves (single evaluate, no polling round trips) as soon as the combat page reaches
+# one of: enemy HP 0 ("defeated"), Leave button shown ("leave"), Attack button ready
+# again ("attack"), or the timeout ("timeout"). Woken by DOM mutations, with an
+# in-page interval as a safety net. When armed (right after clicking Attack), "attack"
+# is only reported once the button went through its cooldown, the enemy HP changed,
+# or the settle time passed - so the click that was just made is not seen as ready.
+COMBAT_WAIT_SCRIPT = """
+(args) => new Promise((resolve) => {
+    const readCombatState = __COMBAT_STATE_SCRIPT__;
+
+    const isVisible = (el) => {
+        if (!el || !el.isConnected) {
+            return false;
+        }
+        const style = window.getComputedStyle(el);
+        if (style.visibility === "hidden" || style.display === "none") {
+            return false;
+        }
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+
+    const isEnabled = (el) => !el.disabled && el.getAttribute("aria-disabled") !== "true";
+
+    const textOf = (el) => (el.textContent || "").replace(/\\s+/g, " ").trim().toLowerCase();
+
+    const findButton = (needle) => {
+        for (const el of document.querySelectorAll("button")) {
+            if (textOf(el).includes(needle) && isVisible(el)) {
+                return el;
+            }
+        }
+        return null;
+    };
+
+    const hpOf = (state) => {
+        if (!state) {
+            return null;
+        }
+        return state.enemy_current_hp !== null ? state.enemy_current_hp : state.enemy_hp_percentage;
+    };
+
+    const started = Date.now();
+    const initialHp = hpOf(readCombatState());
+    let armed = !args.armed;
+    let done = false;
+    let observer = null;
+    let timer = null;
+    let deadline = null;
+
+    const finish = (event, state) => {
+        if (done) {
+            return;
+        }
+        done = true;
+        if (observer) {
+            observer.disconnect();
+        }
+        clearInterval(timer);
+        clearTimeout(deadline);
+        resolve({ event, state: state === undefined ? readCombatState() : state });
+    };
+
+    const check = () => {
+        if (done) {
+            return;
+        }
+        const state = readCombatState();
+        const hp = hpOf(state);
+        if (hp !== null && hp <= 0) {
+            finish("defeated", state);
+            return;
+        }
+        if (hp !== null && initialHp !== null && hp !== initialHp) {
+            armed = true;
+        }
+
+        if (findButton("leave")) {
+            finish("leave", state);
+            return;
+        }
+
+        const attack = findButton("attack");
+        if (!attack || !isEnabled(attack)) {
+            armed = true;  // cooldown observed
+            return;
+        }
+        if (armed || Date.now() - started >= args.settle) {
+            finish("attack", state);
+        }
+    };
+
+    observer = new MutationObserver(check);
+    observer.observe(document.documentElement, {
+        subtree: true,
+        childList: true,
+        characterData: true,
+        attributes: true,
+    });
+    timer = setInterval(check, args.polling);
+    deadline = setTimeout(() => finish("timeout"), args.timeout);
+    check();
+})
+""".replace("__COMBAT_STATE_SCRIPT__", COMBAT_STATE_SCRIPT.strip())
+
+# Resolves when a bound button finishes one click cycle (disabled -> enabled edge).
+# Called through Locator.evaluate, so the button is passed in directly and never
+# re-resolved. Watches only the button's own attributes, with an in-page interval as
+# a safety net. Events: "enabled" (edge seen), "idle" (never went disabled within
+# args.arm), "detached" (button removed from the document), "timeout".
+BUTTON_CYCLE_SCRIPT = """
+(button, args) => new Promise((resolve) => {
+    const isDisabled = (el) => el.disabled || el.getAttribute("aria-disabled") === "true";
+
+    const started = Date.now();
+    let disabledSeen = false;
+    let done = false;
+    let observer = null;
+    let timer = null;
+    let deadline = null;
+
+    const finish = (event) => {
+        if (done) {
+            return;
+        }
+        done = true;
+        if (observer) {
+            observer.disconnect();
+        }
+        clearInterval(timer);
+        clearTimeout(deadline);
+        resolve({ event, disabled_seen: disabledSeen, elapsed: Date.now() - started });
+    };
+
+    const check = () => {
+        if (done) {
+            return;
+        }
+        if (!button.isConnected) {
+            finish("detached");
+            return;
+        }
+        if (isDisabled(button)) {
+            disabledSeen = true;
+            return;
+        }
+        if (disabledSeen) {
+            finish("enabled");
+            return;
+        }
+        if (Date.now() - started >= args.arm) {
+            finish("idle");
+        }
+    };
+
+    observer = new MutationObserver(check);
+    observer.observe(button, {
+        attributes: true,
+        attributeFilter: ["disabled", "aria-disabled", "class"],
+    });
+    timer = setInterval(check, args.polling);
+    deadline = setTimeout(() => finish("timeout"), args.timeout);
+    check();
+})
+"""
+
+# Gathers a whole node inside the page: click the bound button, wait for its
+# disabled -> enabled edge (BUTTON_CYCLE_SCRIPT), report progress through the
+# args.binding callback and sleep args.delay between items. Only completed cycles
+# count as gathered. Stops early when the binding returns false,
+# window.__botGatherAbort is set, the button is replaced or a cycle times out.
+BULK_GATHER_SCRIPT = """
+async (button, args) => {
+    const waitCycle = __BUTTON_CYCLE_SCRIPT__;
+    const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+    const report = async (progress) => {
+        const callback = args.binding ? window[args.binding] : null;
+        if (typeof callback !== "function") {
+            return true;
+        }
+        try {
+            return (await callback(progress)) !== false;
+        } catch (e) {
+            return true;
+        }
+    };
+
+    window.__botGatherAbort = false;
+    let gathered = 0;
+    let last = null;
+    const result = (aborted) => ({ gathered, total: args.count, aborted, event: last });
+
+    for (let i = 0; i < args.count; i++) {
+        if (window.__botGatherAbort) {
+            return result(true);
+        }
+        if (!button.isConnected) {
+            last = "detached";
+            break;
+        }
+
+        button.click();
+        last = (await waitCycle(button, args)).event;
+        if (last === "detached" || last === "timeout") {
+            break;  // button replaced or stuck disabled - the caller falls back
+        }
+        if (last === "enabled") {
+            gathered += 1;  // "idle": the click did not start a cycle, nothing gathered
+        }
+
+        const keepGoing = await report({ done: gathered, total: args.count, event: last });
+        if (!keepGoing || window.__botGatherAbort) {
+            return result(true);
+        }
+        if (i < args.count - 1 && args.delay > 0) {
+            await sleep(args.delay);
+        }
+    }
+    return result(false);
+}
+""".replace("__BUTTON_CYCLE_SCRIPT__", BUTTON_CYCLE_SCRIPT.strip())
+
+# Resolves when the "Take a step" button (or link) is visible, enabled and has lost its
+# cooldown styling. Installs the shared DOM helpers if the document does not have them.
+# Events: "ready", "missing" (no step element for args.missing ms), "waiting" (still on
+# cooldown after args.timeout ms - the caller simply waits again).
+STEP_READY_SCRIPT = """
+(args) => new Promise((resolve) => {
+    __PAGE_STATE_SCRIPT__
+    const dom = window.__botDom;
+
+    const findStep = () => {
+        for (const el of document.querySelectorAll("button, a")) {
+            if (dom.textOf(el).includes("take a step")) {
+                return el;
+            }
+        }
+        return null;
+    };
+
+    const started = Date.now();
+    let done = false;
+    let observer = null;
+    let timer = null;
+    let deadline = null;
+
+    const finish = (event, found) => {
+        if (done) {
+            return;
+        }
+        done = true;
+        if (observer) {
+            observer.disconnect();
+        }
+        clearInterval(timer);
+        clearTimeout(deadline);
+        resolve({ event, found, elapsed: Date.now() - started });
+    };
+
+    const check = () => {
+        if (done) {
+            return;
+        }
+        const step = findStep();
+        if (step) {
+            if (dom.isVisible(step) && dom.isEnabled(step) && !dom.hasDisabledStyling(step)) {
+                finish("ready", true);
+            }
+            return;
+        }
+        if (Date.now() - started >= args.missing) {
+            finish("missing", false);
+        }
+    };
+
+    observer = new MutationObserver(check);
+    observer.observe(document.documentElement, {
+        subtree: true,
+        childList: true,
+        attributes: true,
+        attributeFilter: ["class", "style", "disabled", "aria-disabled"],
+    });
+    timer = setInterval(check, args.polling);
+    deadline = setTimeout(() => finish("waiting", Boolean(findStep())), args.timeout);
+    check();
+})
+""".replace("__PAGE_STATE_SCRIPT__", PAGE_STATE_SCRIPT.strip())
@@ -0,0 +1,112 @@
+"""
+📸 Page State Snapshot for SimpleMMO Bot
+
+Typed result of a single in-page evaluation describing everything the
+gameplay systems need to decide what to do next (captcha, gathering,
+combat, healing and steps) without issuing one round trip per selector.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+# Route names derived from the page URL
+ROUTE_TRAVEL = "travel"
+ROUTE_COMBAT = "combat"
+ROUTE_GATHER = "gather"
+ROUTE_HEALER = "healer"
+ROUTE_QUESTS = "quests"
+ROUTE_CAPTCHA = "i-am-not-a-bot"
+ROUTE_OTHER = "other"
+
+# Reasons a long action (combat, gathering) is interrupted
+INTERRUPT_CAPTCHA = "captcha"
+INTERRUPT_DEATH = "death"
+
+# Ordered URL fragments -> route (first match wins)
+_ROUTE_PATTERNS = (
+    ("/npcs/attack/", ROUTE_COMBAT),
+    ("crafting/material/gather", ROUTE_GATHER),
+    ("i-am-not-a-bot", ROUTE_CAPTCHA),
+    ("/healer", ROUTE_HEALER),
+    ("/quests", ROUTE_QUESTS),
+    ("/travel", ROUTE_TRAVEL),
+)
+
+
+def route_from_url(url: str | None) -> str:
+    """Classify a SimpleMMO URL into a route name"""
+    if not url:
+        return ROUTE_OTHER
+
+    lowered = url.lower()
+    for fragment, route in _ROUTE_PATTERNS:
+        if fragment in lowered:
+            return route
+    return ROUTE_OTHER
+
+
+@dataclass(frozen=True)
+class PageState:
+    """Snapshot of the current game page taken in one round trip"""
+
+    url: str = ""
+    route: str = ROUTE_OTHER
+    travel_captcha: bool = False
+    combat_captcha: bool = False
+    gather_available: bool = False
+    gather_type: str = ""
+    attack_available: bool = False
+    step_found: bool = False
+    step_available: bool = False
+    step_disabled_styling: bool = False
+    leave_available: bool = False
+    is_dead: bool = False
+    available_amount: int | None = None
+    captured_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def captcha_present(self) -> bool:
+        """True if any captcha (travel link or combat popup) is visible"""
+        return self.travel_captcha or self.combat_captcha
+
+    @property
+    def interrupt_reason(self) -> str | None:
+        """Why an action in flight must stop (captcha or death), None to keep going"""
+        if self.captcha_present:
+            return INTERRUPT_CAPTCHA
+        if self.is_dead:
+            return INTERRUPT_DEATH
+        return None
+
+    @property
+    def step_ready(self) -> bool:
+        """True if the step button can be clicked right now (no cooldown styling)"""
+        return self.step_available and not self.step_disabled_styling
+
+    @property
+    def age(self) -> float:
+        """Seconds since this snapshot was captured"""
+        return time.monotonic() - self.captured_at
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "PageState":
+        """Build a PageState from the dict returned by the in-page helper"""
+        url = str(payload.get("url") or "")
+        amount = payload.get("available_amount")
+
+        return cls(
+            url=url,
+            route=route_from_url(url),
+            travel_captcha=bool(payload.get("travel_captcha")),
+            combat_captcha=bool(payload.get("combat_captcha")),
+            gather_available=bool(payload.get("gather_available")),
+            gather_type=str(payload.get("gather_type") or ""),
+            attack_available=bool(payload.get("attack_available")),
+            step_found=bool(payload.get("step_found")),
+            step_available=bool(payload.get("step_available")),
+            step_disabled_styling=bool(payload.get("step_disabled_styling")),
+            leave_available=bool(payload.get("leave_available")),
+            is_dead=bool(payload.get("is_dead")),
+            available_amount=int(amount) if amount is not None else None,
+        )
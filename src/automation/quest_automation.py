@@ -4,9 +4,12 @@ Handles quest detection, execution, and management.
 """
 
 from typing import Dict, List, Optional, Tuple, Any
-from automation.web_engine import get_page, get_web_engine
+from automation.selectors import get_selector_registry
+from automation.web_engine import get_page, get_web_engine, navigate_to_travel
+from utils.deadlines import Deadline, current_deadline
 import asyncio
 import re
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,7 +26,7 @@ class QuestAutomation:
             "span[x-text='number_format(quest_points)']"
         ],
         "quest_tabs": [
-            "px-3 py-2 font-medium text-sm rounded-md",
+            ".px-3.py-2.font-medium.text-sm.rounded-md",
             "button:has-text('All')",
             "button:has-text('Not Completed')",
             "button:has-text('Completed')"
@@ -44,7 +47,14 @@ class QuestAutomation:
         "perform_buttons": [
             "button:has-text('Perform')",
             ".bg-indigo-600:has-text('Perform')",
-            "button[onclick*='perform']"
+            "button[onclick*='perform']",
+            "*:has-text('1x Perform')",
+            ".bg-indigo-600.text-white:has-text('Perform')"
+        ],
+        "not_completed_tab": [
+            "button:has-text('Not Completed')",
+            ".px-3.py-2:has-text('Not Completed')",
+            "*:has-text('Not Completed')"
         ],
         "popup_elements": [
             "*[style*='z-index']",
@@ -65,6 +75,17 @@ class QuestAutomation:
         self.current_quest_points = 0
         self.max_quest_points = 0
         self.available_quests: List[Dict[str, Any]] = []
+        # Quests left by a cycle that ran out of its time slice (resumed next cycle)
+        self.pending_quests = 0
+        # Registry reorders each SELECTORS list by observed hit rate
+        self.selectors = get_selector_registry()
+        for key, selectors in self.SELECTORS.items():
+            self.selectors.register(f"quests.{key}", selectors)
+
+    async def _locator(self, page, selector: str):
+        """Locator reutilizável para o seletor (não cria ElementHandles remotos)."""
+        engine = await get_web_engine()
+        return engine.locator(selector, page)
 
     async def navigate_to_quests(self) -> bool:
         """Navega para a página de quests."""
@@ -100,11 +121,12 @@ class QuestAutomation:
                 return 0, 0
 
             # Tenta diferentes seletores para quest points
-            for selector in self.SELECTORS["quest_points"]:
+            for selector in self.selectors.ordered("quests.quest_points"):
+                start = time.perf_counter()
                 try:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements:
-                        text = await element.text_content()
+                    # Um único round trip para todos os textos do seletor
+                    locator = await self._locator(page, selector)
+                    for text in await locator.all_text_contents():
                         if text and text.strip():
                             # Procura por padrão X/Y
                             match = re.search(r'(\d+)/(\d+)', text)
@@ -113,6 +135,10 @@ class QuestAutomation:
                                 maximum = int(match.group(2))
                                 self.current_quest_points = current
                                 self.max_quest_points = maximum
+                                self.selectors.record(
+                                    "quests.quest_points", selector, True,
+                                    time.perf_counter() - start
+                                )
                                 logger.info(f"🎯 Quest Points: {current}/{maximum}")
                                 return current, maximum
 
@@ -122,10 +148,17 @@ class QuestAutomation:
                                 points = int(match.group(1))
                                 if points > 0:
                                     self.current_quest_points = points
+                                    self.selectors.record(
+                                        "quests.quest_points", selector, True,
+                                        time.perf_counter() - start
+                                    )
                                     logger.info(f"🎯 Quest Points encontrados: {points}")
                                     return points, points
-                except:
-                    continue
+                except Exception:
+                    pass
+                self.selectors.record(
+                    "quests.quest_points", selector, False, time.perf_counter() - start
+                )
 
             logger.warning("⚠️ Quest points não encontrados")
             return 0, 0
@@ -142,22 +175,14 @@ class QuestAutomation:
                 return False
 
             # Procura pelo botão "Not Completed"
-            selectors_to_try = [
-                "button:has-text('Not Completed')",
-                ".px-3.py-2:has-text('Not Completed')",
-                "*:has-text('Not Completed')"
-            ]
-
-            for selector in selectors_to_try:
-                try:
-                    element = await page.query_selector(selector)
-                    if element:
-                        await element.click()
-                        await page.wait_for_timeout(1000)
-                        logger.info("✅ Mudou para aba 'Not Completed'")
-                        return True
-                except:
-                    continue
+            element = await self.selectors.find_first(
+                page, "quests.not_completed_tab", visible=False
+            )
+            if element:
+                await element.click()
+                await page.wait_for_timeout(1000)
+                logger.info("✅ Mudou para aba 'Not Completed'")
+                return True
 
             logger.warning("⚠️ Aba 'Not Completed' não encontrada")
             return False
@@ -178,11 +203,11 @@ class QuestAutomation:
             # Procura por elementos que contêm quests
             for selector in self.SELECTORS["quest_items"]:
                 try:
-                    elements = await page.query_selector_all(selector)
+                    locator = await self._locator(page, selector)
+                    texts = await locator.all_text_contents()
 
-                    for i, element in enumerate(elements):
+                    for i, text in enumerate(texts):
                         try:
-                            text = await element.text_content()
                             if not text or len(text.strip()) < 10:
                                 continue
 
@@ -190,7 +215,7 @@ class QuestAutomation:
                             quest_info = {
                                 "index": i,
                                 "selector": selector,
-                                "element": element,
+                                "element": locator.nth(i),
                                 "text": text.strip(),
                                 "name": "",
                                 "level": 0,
@@ -217,10 +242,10 @@ class QuestAutomation:
                             if quest_info["name"] and quest_info["level"] > 0:
                                 quests.append(quest_info)
 
-                        except:
+                        except Exception:
                             continue
 
-                except:
+                except Exception:
                     continue
 
             # Remove duplicatas baseado no nome
@@ -272,27 +297,27 @@ class QuestAutomation:
             if not page:
                 return None
 
-            # Tenta diferentes seletores para o botão Perform
-            perform_selectors = [
-                "button:has-text('Perform')",
-                ".bg-indigo-600:has-text('Perform')",
-                "button[onclick*='perform']",
-                "*:has-text('1x Perform')",
-                ".bg-indigo-600.text-white:has-text('Perform')"
-            ]
-
-            for selector in perform_selectors:
+            # Tenta diferentes seletores para o botão Perform (ordem adaptativa)
+            for selector in self.selectors.ordered("quests.perform_buttons"):
+                start = time.perf_counter()
                 try:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements:
+                    locator = await self._locator(page, selector)
+                    for element in await locator.all():
                         is_visible = await element.is_visible()
                         if is_visible:
                             text = await element.text_content()
                             if text and 'perform' in text.lower():
+                                self.selectors.record(
+                                    "quests.perform_buttons", selector, True,
+                                    time.perf_counter() - start
+                                )
                                 logger.info(f"✅ Botão Perform encontrado: {text.strip()}")
                                 return element
-                except:
-                    continue
+                except Exception:
+                    pass
+                self.selectors.record(
+                    "quests.perform_buttons", selector, False, time.perf_counter() - start
+                )
 
             logger.warning("⚠️ Botão Perform não encontrado")
             return None
@@ -329,16 +354,15 @@ class QuestAutomation:
 
                 for selector in result_selectors:
                     try:
-                        elements = await page.query_selector_all(selector)
-                        if elements:
-                            element = elements[0]
+                        element = (await self._locator(page, selector)).first
+                        if await element.count():
                             is_visible = await element.is_visible()
                             if is_visible:
                                 text = await element.text_content()
                                 if text:
                                     logger.info(f"📊 Resultado: {text[:100]}...")
                                 break
-                    except:
+                    except Exception:
                         continue
 
             logger.info("✅ Quest executado")
@@ -368,15 +392,15 @@ class QuestAutomation:
 
             for method in close_methods[:-1]:  # Não inclui o body ainda
                 try:
-                    elements = await page.query_selector_all(method)
-                    for element in elements:
+                    locator = await self._locator(page, method)
+                    for element in await locator.all():
                         is_visible = await element.is_visible()
                         if is_visible:
                             await element.click()
                             await asyncio.sleep(0.5)
                             logger.info(f"✅ Popup fechado com {method}")
                             return True
-                except:
+                except Exception:
                     continue
 
             # Tenta pressionar ESC
@@ -385,7 +409,7 @@ class QuestAutomation:
                 await asyncio.sleep(0.5)
                 logger.info("✅ Popup fechado com ESC")
                 return True
-            except:
+            except Exception:
                 pass
 
             logger.warning("⚠️ Não foi possível fechar popup")
@@ -395,12 +419,25 @@ class QuestAutomation:
             logger.error(f"❌ Erro ao fechar popup: {str(e)}")
             return False
 
-    async def execute_quests_cycle(self, max_quests: int = 5) -> Dict[str, Any]:
-        """Executa um ciclo completo de quests."""
+    async def execute_quests_cycle(
+        self, max_quests: int = 5, deadline: Optional[Deadline] = None
+    ) -> Dict[str, Any]:
+        """Executa um ciclo completo de quests.
+
+        Quando o deadline (por padrão o time slice do BotRunner) expira entre dois
+        quests, o ciclo cede: volta para a página de travel e os quests restantes
+        ficam em pending_quests para o próximo ciclo.
+        """
+        deadline = deadline or current_deadline()
+        if self.pending_quests > 0:
+            max_quests = self.pending_quests
+        self.pending_quests = 0
+
         results = {
             "quests_attempted": 0,
             "quests_successful": 0,
             "quest_points_used": 0,
+            "yielded": False,
             "errors": []
         }
 
@@ -434,6 +471,14 @@ class QuestAutomation:
                 if i >= len(quests):
                     break
 
+                if i > 0 and deadline and deadline.expired:
+                    # Time slice esgotado - retoma os quests restantes no próximo ciclo
+                    self.pending_quests = quests_to_execute - i
+                    results["yielded"] = True
+                    logger.info(f"⏱️ Time slice esgotado - {self.pending_quests} quests pendentes")
+                    await navigate_to_travel()
+                    break
+
                 quest = quests[i]
                 logger.info(f"🎯 Executando quest {i+1}/{quests_to_execute}: {quest['name']}")
 
@@ -0,0 +1,385 @@
+"""
+🎯 Adaptive Selector Registry for SimpleMMO Bot
+
+Every system keeps fallback selector lists that used to be walked in a fixed
+order, paying a full round trip for each miss. The registry records hits,
+misses and latency per selector, returns each list ordered so the selector
+that usually wins is tried first, and persists the ranking between sessions.
+
+Selectors are validated once: statically when a group is registered and by the
+browser's own parser at startup (validate()). Invalid entries are dropped from
+every ranked list so no cycle pays a round trip for a selector that cannot match.
+"""
+
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+try:
+    from ..config.paths import SELECTOR_RANKING_FILE
+    from .web_engine import (
+        LocatorCache,
+        SelectorSweep,
+        find_invalid_selectors,
+        match_selector_list,
+    )
+except ImportError:
+    try:
+        from automation.web_engine import (
+            LocatorCache,
+            SelectorSweep,
+            find_invalid_selectors,
+            match_selector_list,
+        )
+        from config.paths import SELECTOR_RANKING_FILE
+    except ImportError:
+        from src.automation.web_engine import (
+            LocatorCache,
+            SelectorSweep,
+            find_invalid_selectors,
+            match_selector_list,
+        )
+        from src.config.paths import SELECTOR_RANKING_FILE
+
+RANKING_FILE_VERSION = 1
+SAVE_INTERVAL = 60.0  # seconds between automatic ranking saves
+MAX_SELECTOR_ERRORS = 3  # a selector that keeps throwing is disabled for the session
+ENABLED_CHECK_TIMEOUT_MS = 1000  # locator.is_enabled waits for the element otherwise
+
+# Playwright error messages that mean the selector itself is malformed
+_SELECTOR_SYNTAX_ERROR_PATTERN = re.compile(
+    r"not a valid selector|unexpected token|syntaxerror|unknown engine|failed to parse",
+    re.IGNORECASE,
+)
+
+# jQuery-only pseudo-class (neither CSS nor Playwright) - always throws
+_UNSUPPORTED_PSEUDO_PATTERN = re.compile(r":contains\(")
+
+# Tags that may legitimately appear in a bare "tag tag" descendant selector
+_KNOWN_TAGS = frozenset(
+    "a abbr article aside b body button div em fieldset footer form h1 h2 h3 h4 h5 h6 header "
+    "html i img input label li main nav ol option p path section select small span strong "
+    "svg table tbody td textarea th thead tr ul".split()
+)
+
+
+def validate_selector(selector: str) -> str | None:
+    """Static validation of one selector
+
+    Returns:
+        Reason the selector can never match, or None if it looks valid
+    """
+    if not selector or not selector.strip():
+        return "empty selector"
+
+    if selector.startswith("//") or selector.startswith("xpath="):
+        return None
+
+    if _UNSUPPORTED_PSEUDO_PATTERN.search(selector):
+        return ":contains() is not a Playwright/CSS pseudo-class"
+
+    # "px-3 py-2 font-medium" - a class attribute pasted as a selector
+    tokens = selector.split()
+    if len(tokens) > 1 and all(re.fullmatch(r"[a-z][a-z0-9-]*", token) for token in tokens):
+        if not all(token in _KNOWN_TAGS for token in tokens):
+            return "bare class list (missing '.' prefixes)"
+
+    return None
+
+
+def to_playwright_selector(selector: str) -> str:
+    """Convert the repo's bare XPath notation (//...) into a Playwright selector"""
+    if selector.startswith("//"):
+        return f"xpath={selector}"
+    return selector
+
+
+class SelectorRegistry:
+    """Hit/miss/latency bookkeeping and adaptive ordering of fallback selector lists"""
+
+    def __init__(self, path: Path | None = SELECTOR_RANKING_FILE):
+        """Initialize Selector Registry
+
+        Args:
+            path: Ranking file (None disables persistence)
+        """
+        self.path = path
+        self.groups: dict[str, list[str]] = {}
+        self.selector_stats: dict[str, dict[str, dict[str, float]]] = {}
+        self.invalid: dict[str, str] = {}  # selector -> reason (skipped everywhere)
+        self.locators = LocatorCache()  # fallback path queries (no ElementHandles)
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self.load()
+
+    def register(self, group: str, selectors: list[str]) -> None:
+        """Declare the fallback list of a group (declared order is the tie-breaker)"""
+        self.groups[group] = list(selectors)
+
+        for selector in selectors:
+            reason = validate_selector(selector)
+            if reason:
+                self.disable(group, selector, reason)
+
+    def disable(self, group: str, selector: str, reason: str) -> None:
+        """Drop a selector from every ranked list for the rest of the session"""
+        if selector not in self.invalid:
+            self.invalid[selector] = reason
+            logger.warning(f"🎯 Dropping invalid selector {selector!r} ({group}): {reason}")
+
+    async def validate(self, page: Any) -> int:
+        """Validate every registered selector with the browser's parser (one round trip)
+
+        Returns:
+            Number of selectors dropped by the in-page check
+        """
+        owners: dict[str, str] = {}
+        for group, selectors in self.groups.items():
+            for selector in selectors:
+                if selector not in self.invalid:
+                    owners.setdefault(selector, group)
+
+        if not owners:
+            return 0
+
+        invalid = await find_invalid_selectors(page, list(owners))
+        if invalid is None:
+            return 0
+
+        for selector in invalid:
+            self.disable(owners[selector], selector, "rejected by the browser selector parser")
+
+        logger.debug(f"🎯 Validated {len(owners)} selectors ({len(self.invalid)} invalid)")
+        return len(invalid)
+
+    def _entry(self, group: str, selector: str) -> dict[str, float]:
+        """Get (or create) the stats entry of a selector"""
+        group_stats = self.selector_stats.setdefault(group, {})
+        entry = group_stats.setdefault(selector, {"hits": 0, "misses": 0, "total_latency": 0.0})
+        entry.setdefault("errors", 0)
+        return entry
+
+    def ordered(self, group: str, selectors: list[str] | None = None) -> list[str]:
+        """Return the valid selectors of a group, most likely winner first
+
+        Ranking: smoothed hit rate (desc), mean latency (asc), declared order.
+        """
+        declared = list(selectors) if selectors is not None else self.groups.get(group, [])
+        declared = [selector for selector in declared if selector not in self.invalid]
+        group_stats = self.selector_stats.get(group, {})
+
+        def sort_key(item: tuple[int, str]) -> tuple[float, float, int]:
+            index, selector = item
+            entry = group_stats.get(selector)
+            if not entry:
+                return (0.0, 0.0, index)
+
+            attempts = entry["hits"] + entry["misses"]
+            hit_rate = entry["hits"] / (attempts + 1)
+            mean_latency = entry["total_latency"] / attempts if attempts else 0.0
+            return (-hit_rate, mean_latency, index)
+
+        return [selector for _, selector in sorted(enumerate(declared), key=sort_key)]
+
+    def record(self, group: str, selector: str, hit: bool, elapsed: float) -> None:
+        """Record the outcome of trying one selector"""
+        entry = self._entry(group, selector)
+        entry["hits" if hit else "misses"] += 1
+        entry["total_latency"] += elapsed
+        self._dirty = True
+        self.maybe_save()
+
+    def record_error(self, group: str, selector: str, error: Any) -> None:
+        """Record a selector that threw (disabled after MAX_SELECTOR_ERRORS)"""
+        entry = self._entry(group, selector)
+        entry["errors"] += 1
+        self._dirty = True
+        if entry["errors"] >= MAX_SELECTOR_ERRORS:
+            self.disable(group, selector, f"failed {int(entry['errors'])} times: {error}")
+
+    def _record_sweep(
+        self, group: str, ranked: list[str], sweep: SelectorSweep, elapsed: float
+    ) -> None:
+        """Record the outcome of a single-round-trip sweep over a ranked list"""
+        tried = ranked[: sweep.index + 1] if sweep.found else ranked
+        share = elapsed / max(1, len(tried))
+        for index in sweep.errors:
+            if 0 <= index < len(ranked):
+                self.record_error(group, ranked[index], "in-page query failed")
+        for selector in tried:
+            self.record(group, selector, selector == sweep.selector, share)
+
+    async def sweep(
+        self,
+        page: Any,
+        group: str,
+        selectors: list[str] | None = None,
+        *,
+        visible: bool = True,
+        enabled: bool = False,
+        mark: bool = False,
+    ) -> SelectorSweep | None:
+        """Evaluate the group's ranked list in one round trip and record the outcome
+
+        Returns:
+            SelectorSweep, or None if the page could not evaluate the sweep
+        """
+        ranked = self.ordered(group, selectors)
+        start = time.perf_counter()
+        result = await match_selector_list(
+            page, ranked, visible=visible, enabled=enabled, mark=mark
+        )
+        if result is not None:
+            self._record_sweep(group, ranked, result, time.perf_counter() - start)
+        return result
+
+    async def detect(
+        self,
+        page: Any,
+        group: str,
+        selectors: list[str] | None = None,
+        *,
+        visible: bool = True,
+        enabled: bool = False,
+    ) -> bool:
+        """Check whether any alternative of the group matches (one round trip when possible)"""
+        result = await self.sweep(page, group, selectors, visible=visible, enabled=enabled)
+        if result is not None:
+            return result.found
+
+        element = await self._find_first_sequential(page, group, selectors, visible, enabled)
+        return element is not None
+
+    async def find_first(
+        self,
+        page: Any,
+        group: str,
+        selectors: list[str] | None = None,
+        *,
+        visible: bool = True,
+        enabled: bool = False,
+    ) -> Any | None:
+        """Return a Locator for the first matching element of the group's ranked selectors
+
+        The whole list is resolved with one in-page sweep which tags the winning
+        element; the returned Locator points at that tag, so no remote handle is
+        created. Pages that cannot evaluate the sweep fall back to querying the
+        selectors one by one.
+
+        Args:
+            page: Playwright page (or frame) to query
+            group: Registry group name
+            selectors: Fallback list (defaults to the registered list)
+            visible: Require the element to be visible
+            enabled: Require the element to be enabled
+        """
+        result = await self.sweep(
+            page, group, selectors, visible=visible, enabled=enabled, mark=True
+        )
+        if result is not None:
+            return page.locator(result.marker) if result.found else None
+
+        return await self._find_first_sequential(page, group, selectors, visible, enabled)
+
+    async def _find_first_sequential(
+        self,
+        page: Any,
+        group: str,
+        selectors: list[str] | None,
+        visible: bool,
+        enabled: bool,
+    ) -> Any | None:
+        """Query the ranked selectors one round trip at a time (fallback path)"""
+        for selector in self.ordered(group, selectors):
+            start = time.perf_counter()
+            hit = False
+            try:
+                element = self.locators.get(page, to_playwright_selector(selector)).first
+                if visible:
+                    hit = await element.is_visible()
+                else:
+                    hit = await element.count() > 0
+                if hit and enabled:
+                    hit = await element.is_enabled(timeout=ENABLED_CHECK_TIMEOUT_MS)
+            except Exception as e:
+                logger.debug(f"Selector {selector} ({group}) failed: {e}")
+                # Only malformed selectors count - a closed page makes every selector throw
+                if _SELECTOR_SYNTAX_ERROR_PATTERN.search(str(e)):
+                    self.record_error(group, selector, e)
+
+            self.record(group, selector, hit, time.perf_counter() - start)
+            if hit:
+                return element
+
+        return None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get per-group ranking statistics"""
+        stats: dict[str, Any] = {}
+        for group, group_stats in self.selector_stats.items():
+            stats[group] = {
+                selector: {
+                    "hits": int(entry["hits"]),
+                    "misses": int(entry["misses"]),
+                    "mean_latency_ms": round(
+                        1000 * entry["total_latency"] / max(1, entry["hits"] + entry["misses"]), 2
+                    ),
+                    "errors": int(entry.get("errors", 0)),
+                    "disabled": selector in self.invalid,
+                }
+                for selector, entry in group_stats.items()
+            }
+        return stats
+
+    def get_invalid_selectors(self) -> dict[str, str]:
+        """Get the selectors dropped this session and why"""
+        return dict(self.invalid)
+
+    def load(self) -> None:
+        """Load a persisted ranking (missing or corrupt files are ignored)"""
+        if not self.path or not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == RANKING_FILE_VERSION:
+                self.selector_stats = data.get("groups", {})
+                logger.debug(f"🎯 Loaded selector ranking for {len(self.selector_stats)} groups")
+        except Exception as e:
+            logger.debug(f"Could not load selector ranking: {e}")
+
+    def save(self) -> None:
+        """Persist the ranking to disk (atomic replace)"""
+        self._last_save = time.monotonic()
+        if not self.path or not self._dirty:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            payload = {"version": RANKING_FILE_VERSION, "groups": self.selector_stats}
+            tmp_path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+            tmp_path.replace(self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.debug(f"Could not save selector ranking: {e}")
+
+    def maybe_save(self) -> None:
+        """Save if the automatic save interval elapsed"""
+        if time.monotonic() - self._last_save >= SAVE_INTERVAL:
+            self.save()
+
+
+_registry: SelectorRegistry | None = None
+
+
+def get_selector_registry() -> SelectorRegistry:
+    """Get the global selector registry"""
+    global _registry
+    if _registry is None:
+        _registry = SelectorRegistry()
+    return _registry
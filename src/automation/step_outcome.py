@@ -0,0 +1,127 @@
+"""
+👣 Step Outcome for SimpleMMO Bot
+
+Typed result of a travel step, parsed from the JSON response of the step
+request. The response already says what the step produced (an NPC, a
+material node, an item or just text) and how long the step cooldown is, so
+the bot can act on it without scraping the page.
+"""
+
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+# What a step produced
+OUTCOME_NPC = "npc"
+OUTCOME_MATERIAL = "material"
+OUTCOME_ITEM = "item"
+OUTCOME_PLAYER = "player"
+OUTCOME_TEXT = "text"
+OUTCOME_CAPTCHA = "captcha"
+OUTCOME_UNKNOWN = "unknown"
+
+_KNOWN_OUTCOMES = (OUTCOME_NPC, OUTCOME_MATERIAL, OUTCOME_ITEM, OUTCOME_PLAYER, OUTCOME_TEXT)
+
+# URL fragments of the travel step endpoint (web and api hosts)
+STEP_ENDPOINT_PATTERN = re.compile(r"/api/(?:action/)?travel(?:/perform)?(?:/|\?|$)", re.I)
+
+# Links embedded in the step text that reveal the outcome when no type is given
+_NPC_LINK_PATTERN = re.compile(r"/npcs/attack/[\w-]+", re.I)
+_MATERIAL_LINK_PATTERN = re.compile(r"/crafting/material/gather/[\w-]+", re.I)
+_CAPTCHA_PATTERN = re.compile(r"i-am-not-a-bot", re.I)
+
+# Cooldown keys: seconds first, then milliseconds
+_WAIT_SECONDS_KEYS = ("wait_length", "wait_time", "waitLength")
+_WAIT_MILLISECONDS_KEYS = ("nextwait", "next_wait", "wait_ms")
+
+
+def is_step_response_url(url: str | None) -> bool:
+    """True if the URL is the travel step endpoint"""
+    return bool(url) and STEP_ENDPOINT_PATTERN.search(url) is not None
+
+
+def _wait_seconds(payload: dict[str, Any]) -> float | None:
+    """Step cooldown in seconds from whichever wait field the response carries"""
+    for keys, scale in ((_WAIT_SECONDS_KEYS, 1.0), (_WAIT_MILLISECONDS_KEYS, 0.001)):
+        for key in keys:
+            value = payload.get(key)
+            try:
+                if value is not None and value != "":
+                    return max(0.0, float(value) * scale)
+            except (TypeError, ValueError):
+                continue
+    return None
+
+
+def _text_of(payload: dict[str, Any]) -> str:
+    """All human readable text of the step (used for link/captcha detection)"""
+    parts = [payload.get(key) for key in ("heading", "text", "resultText", "result_text")]
+    return " ".join(str(part) for part in parts if part)
+
+
+@dataclass(frozen=True)
+class StepOutcome:
+    """What a single travel step produced and when the next step is allowed"""
+
+    kind: str = OUTCOME_UNKNOWN
+    wait_seconds: float | None = None
+    text: str = ""
+    target_url: str | None = None  # attack / gather link when the step found one
+    reward_type: str | None = None
+    reward_amount: int | None = None
+    received_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def ready_at(self) -> float | None:
+        """time.monotonic() value at which the step cooldown ends"""
+        if self.wait_seconds is None:
+            return None
+        return self.received_at + self.wait_seconds
+
+    @property
+    def cooldown_remaining(self) -> float:
+        """Seconds left until the next step may be taken (0 if unknown or over)"""
+        ready_at = self.ready_at
+        if ready_at is None:
+            return 0.0
+        return max(0.0, ready_at - time.monotonic())
+
+    @property
+    def needs_action(self) -> bool:
+        """True if the step opened something the bot should handle before stepping again"""
+        return self.kind in (OUTCOME_NPC, OUTCOME_MATERIAL, OUTCOME_CAPTCHA)
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "StepOutcome":
+        """Build a StepOutcome from the step response JSON"""
+        text = _text_of(payload)
+        npc_link = _NPC_LINK_PATTERN.search(text)
+        material_link = _MATERIAL_LINK_PATTERN.search(text)
+
+        kind = str(payload.get("step_type") or payload.get("type") or "").lower()
+        if _CAPTCHA_PATTERN.search(text) or payload.get("is_bot_check"):
+            kind = OUTCOME_CAPTCHA
+        elif kind not in _KNOWN_OUTCOMES:
+            if npc_link:
+                kind = OUTCOME_NPC
+            elif material_link:
+                kind = OUTCOME_MATERIAL
+            else:
+                kind = OUTCOME_TEXT if text else OUTCOME_UNKNOWN
+
+        target = npc_link if kind == OUTCOME_NPC else material_link
+        amount = payload.get("rewardAmount", payload.get("reward_amount"))
+        try:
+            reward_amount = int(amount) if amount not in (None, "") else None
+        except (TypeError, ValueError):
+            reward_amount = None
+
+        return cls(
+            kind=kind,
+            wait_seconds=_wait_seconds(payload),
+            text=text,
+            target_url=target.group(0) if target else None,
+            reward_type=payload.get("rewardType") or payload.get("reward_type") or None,
+            reward_amount=reward_amount,
+        )
@@ -6,15 +6,544 @@ Simplified and clean implementation for better maintainability.
 """
 
 import asyncio
+import itertools
+import json
 import os
 import platform
+import re
 import subprocess
 import time
+import weakref
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
-from playwright.async_api import Browser, BrowserContext, Page, Playwright, async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Locator,
+    Page,
+    Playwright,
+    async_playwright,
+)
+
+from .combat_state import CombatEvent, CombatState
+from .page_events import PageEventBus
+from .page_scripts import (
+    BULK_GATHER_SCRIPT,
+    BUTTON_CYCLE_SCRIPT,
+    COMBAT_STATE_SCRIPT,
+    COMBAT_WAIT_SCRIPT,
+    PAGE_OBSERVER_SCRIPT,
+    PAGE_STATE_EVAL,
+    PAGE_STATE_SCRIPT,
+    SELECTOR_SWEEP_SCRIPT,
+    SELECTOR_VALIDATE_SCRIPT,
+    STEP_READY_SCRIPT,
+)
+from .page_state import ROUTE_OTHER, PageState, route_from_url
+from .step_outcome import StepOutcome, is_step_response_url
+
+# Attribute used to tag the element matched by a selector sweep
+SELECTOR_MATCH_ATTRIBUTE = "data-bot-match"
+
+# Results of wait_for_button_cycle
+BUTTON_CYCLE_ENABLED = "enabled"  # disabled -> enabled edge seen
+BUTTON_CYCLE_IDLE = "idle"  # button never went disabled (action finished instantly)
+BUTTON_CYCLE_DETACHED = "detached"  # button was removed from the document
+BUTTON_CYCLE_TIMEOUT = "timeout"
+
+# Results of wait_for_step_ready
+STEP_READY = "ready"  # step button clickable
+STEP_MISSING = "missing"  # no step button before the missing timeout
+STEP_WAITING = "waiting"  # still on cooldown when the wait chunk ended
+
+# Prefetched PageState (read during post-action settle delays)
+PREFETCH_MAX_AGE = 2.0  # seconds a prefetched snapshot stays usable
+STATE_LATENCY_SMOOTHING = 0.2  # EWMA weight of the newest get_page_state duration
+
+# Re-attach after the page was lost (tab crash, stray navigation, CDP drop)
+RECOVERY_ATTEMPTS = 3
+RECOVERY_BACKOFF = 1.0  # seconds, multiplied by the attempt number
+RECOVERY_PROBE_TIMEOUT = 5.0  # seconds for the round trip confirming a re-attached page
+
+# Readiness of a freshly started browser (raw HTTP probe of DevTools /json/version)
+BROWSER_READY_TIMEOUT = 10.0  # seconds
+BROWSER_PROBE_INTERVAL = 0.1  # seconds between probes
+BROWSER_PROBE_TIMEOUT = 0.5  # seconds per probe
+
+# Binding the in-page bulk gather runner reports progress through
+GATHER_PROGRESS_BINDING = "__botGatherProgress"
+
+# Trailing Playwright text pseudo-class: base:has-text("X") / base:text('X')
+_TEXT_PSEUDO_PATTERN = re.compile(
+    r"^(?P<base>.*?):(?:has-text|text)\((?P<quote>['\"])(?P<text>.*)(?P=quote)\)$"
+)
+
+_match_tokens = itertools.count(1)
+
+# Remote ElementHandle bookkeeping (handles pin DOM nodes in the renderer until disposed)
+handle_stats = {"live_handles": 0, "handles_created": 0, "handles_disposed": 0}
+_live_handles: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+# In-page evaluations issued by the engine helpers (snapshots, sweeps, waiters)
+rpc_stats = {"page_calls": 0}
+
+
+async def _evaluate(target: Any, *args: Any, **kwargs: Any) -> Any:
+    """page/locator.evaluate with round trip accounting"""
+    rpc_stats["page_calls"] += 1
+    return await target.evaluate(*args, **kwargs)
+
+
+class LocatorCache:
+    """Reusable Locator objects for one page (rebuilt when the page object changes)
+
+    Locators are lazy descriptions resolved on every action, so unlike
+    ElementHandles they never pin a remote object in the renderer.
+    """
+
+    def __init__(self):
+        """Initialize Locator Cache"""
+        self._page: Any = None
+        self._locators: dict[str, Locator] = {}
+
+    def get(self, page: Any, selector: str) -> Locator:
+        """Get the cached locator of a selector on a page"""
+        if page is not self._page:
+            self._page = page
+            self._locators = {}
+
+        locator = self._locators.get(selector)
+        if locator is None:
+            locator = page.locator(selector)
+            self._locators[selector] = locator
+        return locator
+
+    def clear(self) -> None:
+        """Forget every cached locator"""
+        self._page = None
+        self._locators = {}
+
+    def __len__(self) -> int:
+        return len(self._locators)
+
+
+def track_handles(handles: Any) -> Any:
+    """Count ElementHandles created by the engine and return them unchanged
+
+    Every handle stays in live_handles until its dispose() is awaited, whoever
+    disposes it, so handles that escape to callers and are never disposed show up.
+    """
+    items = handles if isinstance(handles, list) else [handles]
+    for handle in items:
+        if handle is None or handle in _live_handles:
+            continue
+
+        _live_handles.add(handle)
+        handle_stats["handles_created"] += 1
+        handle_stats["live_handles"] += 1
+        original_dispose = handle.dispose
+
+        async def dispose(handle: Any = handle, original_dispose: Any = original_dispose) -> None:
+            try:
+                await original_dispose()
+            finally:
+                if handle in _live_handles:
+                    _live_handles.discard(handle)
+                    handle_stats["handles_disposed"] += 1
+                    handle_stats["live_handles"] -= 1
+
+        handle.dispose = dispose
+    return handles
+
+
+class HandleScope:
+    """Tracks the ElementHandles created inside a block so they can be disposed together"""
+
+    def __init__(self):
+        """Initialize Handle Scope"""
+        self._handles: list[Any] = []
+
+    def track(self, handles: Any) -> Any:
+        """Track a handle (or list of handles) and return it unchanged"""
+        items = handles if isinstance(handles, list) else [handles]
+        track_handles(items)
+        self._handles.extend(handle for handle in items if handle is not None)
+        return handles
+
+    async def dispose(self) -> None:
+        """Dispose every tracked handle"""
+        handles, self._handles = self._handles, []
+        for handle in handles:
+            try:
+                await handle.dispose()  # uncounted by track_handles even if it fails
+            except Exception:
+                pass  # Already gone with its document
+
+
+@asynccontextmanager
+async def scoped_handles() -> AsyncIterator[HandleScope]:
+    """Dispose every handle tracked in the block on exit (use where handles are unavoidable)"""
+    scope = HandleScope()
+    try:
+        yield scope
+    finally:
+        await scope.dispose()
+
+
+@dataclass(frozen=True)
+class SelectorSweep:
+    """Result of evaluating a whole fallback selector list in one round trip"""
+
+    index: int  # matched alternative (-1 if none matched)
+    selector: str | None
+    visible: bool = False
+    enabled: bool = False
+    errors: tuple[int, ...] = ()  # alternatives that could not be evaluated
+    marker: str | None = None  # selector of the tagged element (when marking was requested)
+
+    @property
+    def found(self) -> bool:
+        """True if one of the alternatives matched"""
+        return self.index >= 0
+
+
+@dataclass(frozen=True)
+class BulkGatherResult:
+    """Outcome of an in-page bulk gather run"""
+
+    gathered: int
+    total: int
+    aborted: bool = False
+    event: str | None = None  # last BUTTON_CYCLE_* event
+
+    @property
+    def completed(self) -> bool:
+        """True if every item was gathered"""
+        return not self.aborted and self.gathered >= self.total
+
+
+def compile_selector(selector: str) -> dict[str, str]:
+    """Translate one Playwright-style selector into an in-page query
+
+    Bare XPath (//...) and xpath= become document.evaluate queries, a trailing
+    :has-text()/:text() becomes a querySelectorAll + text filter, and anything
+    else is passed to querySelectorAll as plain CSS.
+    """
+    if selector.startswith("xpath="):
+        return {"kind": "xpath", "query": selector[len("xpath=") :], "text": ""}
+    if selector.startswith("//") or selector.startswith("(//"):
+        return {"kind": "xpath", "query": selector, "text": ""}
+
+    match = _TEXT_PSEUDO_PATTERN.match(selector)
+    if match:
+        text = " ".join(match.group("text").split()).lower()
+        return {"kind": "text", "query": match.group("base") or "*", "text": text}
+
+    return {"kind": "css", "query": selector, "text": ""}
+
+
+@lru_cache(maxsize=256)
+def compile_selector_list(selectors: tuple[str, ...]) -> tuple[dict[str, str], ...]:
+    """Compile a fallback selector list once (cached per distinct list)"""
+    return tuple(compile_selector(selector) for selector in selectors)
+
+
+async def match_selector_list(
+    page: Any,
+    selectors: list[str],
+    *,
+    visible: bool = True,
+    enabled: bool = False,
+    mark: bool = False,
+) -> SelectorSweep | None:
+    """Evaluate a whole fallback selector list with a single page.evaluate call
+
+    Args:
+        page: Playwright page (or frame) to query
+        selectors: Alternatives in the order they should be tried
+        visible: Require the matched element to be visible
+        enabled: Require the matched element to be enabled
+        mark: Tag the matched element so it can be fetched via SelectorSweep.marker
+
+    Returns:
+        SelectorSweep, or None if the sweep itself could not run
+    """
+    token = str(next(_match_tokens)) if mark else ""
+    args = {
+        "alternatives": list(compile_selector_list(tuple(selectors))),
+        "visible": visible,
+        "enabled": enabled,
+        "mark": token,
+        "attribute": SELECTOR_MATCH_ATTRIBUTE,
+    }
+
+    try:
+        result = await _evaluate(page, SELECTOR_SWEEP_SCRIPT, args)
+    except Exception as e:
+        logger.debug(f"Selector sweep failed: {e}")
+        return None
+
+    if not isinstance(result, dict):
+        return None
+
+    index = int(result.get("index", -1))
+    found = 0 <= index < len(selectors)
+    return SelectorSweep(
+        index=index if found else -1,
+        selector=selectors[index] if found else None,
+        visible=bool(result.get("visible")),
+        enabled=bool(result.get("enabled")),
+        errors=tuple(int(i) for i in result.get("errors", ())),
+        marker=f'[{SELECTOR_MATCH_ATTRIBUTE}="{token}"]' if found and mark else None,
+    )
+
+
+async def find_invalid_selectors(page: Any, selectors: list[str]) -> list[str] | None:
+    """Ask the browser which selectors it cannot parse (single round trip, no matching)
+
+    Returns:
+        The invalid selectors, or None if the check could not run
+    """
+    alternatives = list(compile_selector_list(tuple(selectors)))
+    try:
+        invalid = await _evaluate(page, SELECTOR_VALIDATE_SCRIPT, alternatives)
+    except Exception as e:
+        logger.debug(f"Selector validation failed: {e}")
+        return None
+
+    if not isinstance(invalid, list):
+        return None
+
+    return [selectors[int(i)] for i in invalid if 0 <= int(i) < len(selectors)]
+
+
+async def read_combat_state(page: Any) -> CombatState | None:
+    """Read enemy/player HP from the combat page's Alpine data (single round trip)"""
+    try:
+        payload = await _evaluate(page, COMBAT_STATE_SCRIPT)
+    except Exception as e:
+        logger.debug(f"Could not read combat state: {e}")
+        return None
+
+    return CombatState.from_payload(payload) if isinstance(payload, dict) else None
+
+
+async def wait_for_combat_event(
+    page: Any,
+    *,
+    timeout: float,
+    polling: float,
+    armed: bool = True,
+    settle: float = 0.5,
+) -> CombatEvent | None:
+    """Wait in the page until attack is ready, the enemy is defeated or Leave appears
+
+    One page.evaluate call for the whole wait: the condition is checked in the
+    page on every DOM mutation (and every `polling` seconds as a safety net).
+
+    Args:
+        page: Combat page
+        timeout: Seconds before resolving with COMBAT_EVENT_TIMEOUT
+        polling: Seconds between in-page safety checks
+        armed: Called right after an attack click (wait for the cooldown first)
+        settle: Seconds after which a ready Attack button counts even if no cooldown was seen
+
+    Returns:
+        CombatEvent, or None if the wait could not run (e.g. navigation)
+    """
+    args = {
+        "timeout": int(timeout * 1000),
+        "polling": max(10, int(polling * 1000)),
+        "armed": armed,
+        "settle": int(settle * 1000),
+    }
+
+    try:
+        payload = await _evaluate(page, COMBAT_WAIT_SCRIPT, args)
+    except Exception as e:
+        logger.debug(f"Combat wait interrupted: {e}")
+        return None
+
+    return CombatEvent.from_payload(payload) if isinstance(payload, dict) else None
+
+
+async def wait_for_button_cycle(
+    button: Any,
+    *,
+    timeout: float,
+    polling: float,
+    arm: float = 1.0,
+    lookup_timeout_ms: int = 1000,
+) -> str | None:
+    """Wait in the page for a bound button to go disabled and back to enabled
+
+    One Locator.evaluate call per click: the button is resolved once and the
+    edge is detected in the page, so no per-poll round trips are made.
+
+    Args:
+        button: Locator of the button that was just clicked
+        timeout: Seconds before resolving with BUTTON_CYCLE_TIMEOUT
+        polling: Seconds between in-page safety checks
+        arm: Seconds to wait for the button to go disabled before reporting BUTTON_CYCLE_IDLE
+        lookup_timeout_ms: How long Playwright may wait for the button to exist
+
+    Returns:
+        One of the BUTTON_CYCLE_* events, or None if the wait could not run
+    """
+    args = {
+        "timeout": int(timeout * 1000),
+        "polling": max(10, int(polling * 1000)),
+        "arm": int(arm * 1000),
+    }
+
+    try:
+        result = await _evaluate(button, BUTTON_CYCLE_SCRIPT, args, timeout=lookup_timeout_ms)
+    except Exception as e:
+        logger.debug(f"Button cycle wait interrupted: {e}")
+        return None
+
+    if not isinstance(result, dict):
+        return None
+    return str(result.get("event") or BUTTON_CYCLE_TIMEOUT)
+
+
+async def run_bulk_gather(
+    button: Any,
+    *,
+    count: int,
+    delay: float,
+    timeout: float,
+    polling: float,
+    arm: float = 1.0,
+    binding: str | None = GATHER_PROGRESS_BINDING,
+    lookup_timeout_ms: int = 1000,
+) -> BulkGatherResult | None:
+    """Gather `count` items in the page with a single Locator.evaluate call
+
+    Args:
+        button: Locator of the gather button
+        count: Items to gather
+        delay: Seconds to wait between items (gather_delay)
+        timeout: Seconds allowed for each click cycle
+        polling: Seconds between in-page safety checks
+        arm: Seconds for the button to go disabled after a click
+        binding: Exposed progress callback name (None to run without progress)
+        lookup_timeout_ms: How long Playwright may wait for the button to exist
+
+    Returns:
+        BulkGatherResult, or None if the runner could not run
+    """
+    args = {
+        "count": int(count),
+        "delay": int(delay * 1000),
+        "timeout": int(timeout * 1000),
+        "polling": max(10, int(polling * 1000)),
+        "arm": int(arm * 1000),
+        "binding": binding,
+    }
+
+    try:
+        result = await _evaluate(button, BULK_GATHER_SCRIPT, args, timeout=lookup_timeout_ms)
+    except Exception as e:
+        logger.debug(f"Bulk gather interrupted: {e}")
+        return None
+
+    if not isinstance(result, dict):
+        return None
+    return BulkGatherResult(
+        gathered=int(result.get("gathered") or 0),
+        total=int(result.get("total") or count),
+        aborted=bool(result.get("aborted")),
+        event=result.get("event"),
+    )
+
+
+async def wait_for_step_ready(
+    page: Any,
+    *,
+    missing_timeout: float,
+    timeout: float,
+    polling: float,
+) -> str | None:
+    """Wait in the page until the step button loses its cooldown styling
+
+    One pending page.evaluate call for the whole wait (checked on DOM mutations).
+
+    Args:
+        page: Travel page
+        missing_timeout: Seconds without any step button before STEP_MISSING
+        timeout: Seconds before resolving with STEP_WAITING (caller waits again)
+        polling: Seconds between in-page safety checks
+
+    Returns:
+        One of STEP_READY / STEP_MISSING / STEP_WAITING, or None if the wait could not run
+    """
+    args = {
+        "missing": int(missing_timeout * 1000),
+        "timeout": int(timeout * 1000),
+        "polling": max(10, int(polling * 1000)),
+    }
+
+    try:
+        result = await _evaluate(page, STEP_READY_SCRIPT, args)
+    except Exception as e:
+        logger.debug(f"Step readiness wait interrupted: {e}")
+        return None
+
+    if not isinstance(result, dict):
+        return None
+    return str(result.get("event") or STEP_WAITING)
+
+
+async def probe_devtools(
+    port: int, host: str = "127.0.0.1", timeout: float = BROWSER_PROBE_TIMEOUT
+) -> dict[str, Any] | None:
+    """Query the DevTools /json/version endpoint without starting Playwright
+
+    Returns:
+        The version info (with webSocketDebuggerUrl), None while the browser is not listening
+    """
+    try:
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+
+    try:
+        request = f"GET /json/version HTTP/1.1\r\nHost: {host}:{port}\r\nConnection: close\r\n\r\n"
+        writer.write(request.encode("ascii"))
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return None
+    finally:
+        writer.close()
+
+    head, _, body = response.partition(b"\r\n\r\n")
+    status = head.split(b"\r\n", 1)[0].split()
+    if len(status) < 2 or status[1] != b"200":
+        return None
+
+    try:
+        info = json.loads(body)
+    except ValueError:
+        return None
+    return info if isinstance(info, dict) and "webSocketDebuggerUrl" in info else None
+
+
+async def abort_bulk_gather(page: Any) -> bool:
+    """Ask a running in-page bulk gather to stop after the current item"""
+    try:
+        await _evaluate(page, "() => { window.__botGatherAbort = true; }")
+        return True
+    except Exception as e:
+        logger.debug(f"Could not abort bulk gather: {e}")
+        return False
 
 
 class WebAutomationEngine:
@@ -29,6 +558,54 @@ class WebAutomationEngine:
         self.page: Page | None = None
         self.is_initialized = False
 
+        # Page state helper (installed once per context as init script)
+        self._page_state_context_id: int | None = None
+
+        # Push-based page change notifications (MutationObserver -> binding)
+        self.page_events = PageEventBus()
+        self._page_events_context_id: int | None = None
+
+        # Progress callback of the in-page bulk gather runner (exposed once per context)
+        self.gather_progress_callback: Callable[[dict[str, Any]], bool] | None = None
+        self._gather_progress_context_id: int | None = None
+
+        # Parsed responses of the travel step request (page.on("response"), once per page)
+        self.last_step_outcome: StepOutcome | None = None
+        self._step_outcome_fresh = False
+        self._step_listener_page_id: int | None = None
+
+        # (page, event, handler) of every listener added to a page - removed before
+        # re-adding, so a re-picked page never fires a handler twice
+        self._page_listeners: list[tuple[Any, str, Callable[..., Any]]] = []
+
+        # Page liveness tracked from Playwright events (close/crash/framenavigated,
+        # browser disconnected) - no probing round trip on the hot path
+        self.page_lost_reason: str | None = None
+        self._lost_page: Any = None  # tab whose close/crash was reported (never re-picked)
+        self.current_url = ""
+        self.navigation_check_due = False
+        self._navigation_listeners: list[Callable[[str], Any]] = []
+        self._liveness_page_id: int | None = None
+        self._liveness_browser_id: int | None = None
+        self.recovery_stats = {
+            "recoveries": 0,
+            "recovery_failures": 0,
+            "last_recovery_ms": 0,
+            "total_recovery_ms": 0,
+        }
+
+        # Cold start: time until a started browser answered the DevTools probe
+        self.startup_stats = {"browser_ready_ms": 0, "browser_probe_attempts": 0}
+
+        # Next PageState read while a post-action settle delay runs
+        self.prefetch_enabled = True
+        self._prefetch_task: asyncio.Task | None = None
+        self.state_latency = 0.05  # EWMA of get_page_state round trip (seconds)
+        self.prefetch_stats = {"prefetch_started": 0, "prefetch_used": 0, "prefetch_discarded": 0}
+
+        # Precompiled locators for the current page (no remote handles)
+        self.locators = LocatorCache()
+
         # Configuration with defaults
         self.browser_headless = self.config.get("browser_headless", False)
         self.browser_type = self.config.get("browser_type", "chromium")
@@ -54,6 +631,7 @@ class WebAutomationEngine:
                 page_check = await self.get_page()
                 if page_check:
                     logger.debug(f"✅ Page validation successful: {page_check.url}")
+                    await self.install_page_helpers()
                     self.is_initialized = True
                     return True
                 else:
@@ -73,6 +651,7 @@ class WebAutomationEngine:
                     page_check = await self.get_page()
                     if page_check:
                         logger.success("✅ Connected to newly started Chromium and validated!")
+                        await self.install_page_helpers()
                         self.is_initialized = True
                         return True
                     else:
@@ -121,7 +700,8 @@ class WebAutomationEngine:
                 logger.debug(f"📄 Found {len(pages)} pages in context")
 
                 if pages:
-                    self.page = pages[0]
+                    # Re-attach to the game tab of the previous session if it is still open
+                    self.page = _pick_game_page(pages) or pages[0]
                     logger.debug(f"📄 Using existing page: {id(self.page)}")
                 else:
                     logger.debug("📄 No pages found, creating new page...")
@@ -135,8 +715,8 @@ class WebAutomationEngine:
                 logger.info(f"📍 Current page: {page_title}")
                 logger.info(f"🌐 Current URL: {current_url}")
 
-                # Ensure we're on travel page
-                if not current_url.endswith("/travel"):
+                # Ensure we're on a game page (the route machine returns to travel from there)
+                if route_from_url(current_url) == ROUTE_OTHER:
                     logger.info("🧭 Navigating to travel page...")
                     await self.page.goto(self.target_url)
                     await self.page.wait_for_load_state("networkidle")
@@ -211,6 +791,11 @@ class WebAutomationEngine:
 
     async def get_page(self) -> Page | None:
         """Get current page instance"""
+        if self.page and self.page_lost_reason and self._liveness_page_id == id(self.page):
+            logger.debug(f"Page lost ({self.page_lost_reason}), cleaning reference")
+            self.page = None
+            return None
+
         if self.page:
             try:
                 # Test if page is still valid with a very lightweight check
@@ -296,7 +881,7 @@ class WebAutomationEngine:
             return None
 
         try:
-            return await page.query_selector(selector)
+            return track_handles(await page.query_selector(selector))
         except Exception:
             return None
 
@@ -307,7 +892,7 @@ class WebAutomationEngine:
             return []
 
         try:
-            return await page.query_selector_all(selector)
+            return track_handles(await page.query_selector_all(selector))
         except Exception:
             return []
 
@@ -347,31 +932,36 @@ class WebAutomationEngine:
 
     async def _find_all_valid_elements(self, page: Page, selectors: list[str]) -> list[Any]:
         """Find all valid (visible and enabled) elements"""
-        for selector in selectors:
-            elements = await page.query_selector_all(selector)
-            if elements:
-                # Filter visible and enabled elements
-                valid_elements = []
-                for elem in elements[:3]:  # Limit to first 3 for performance
-                    try:
-                        if await elem.is_visible() and await elem.is_enabled():
-                            valid_elements.append(elem)
-                    except Exception:
-                        continue
-                if valid_elements:
-                    return valid_elements
+        async with scoped_handles() as scope:
+            for selector in selectors:
+                elements = track_handles(await page.query_selector_all(selector))
+                if elements:
+                    # Filter visible and enabled elements
+                    valid_elements = []
+                    for elem in elements[:3]:  # Limit to first 3 for performance
+                        try:
+                            if await elem.is_visible() and await elem.is_enabled():
+                                valid_elements.append(elem)
+                        except Exception:
+                            pass
+                    # Returned handles belong to the caller, the rest are disposed here
+                    scope.track([elem for elem in elements if elem not in valid_elements])
+                    if valid_elements:
+                        return valid_elements
         return []
 
     async def _find_single_valid_element(self, page: Page, selectors: list[str]) -> Any | None:
         """Find single valid (visible and enabled) element"""
-        for selector in selectors:
-            element = await page.query_selector(selector)
-            if element:
-                try:
-                    if await element.is_visible() and await element.is_enabled():
-                        return element
-                except Exception:
-                    continue
+        async with scoped_handles() as scope:
+            for selector in selectors:
+                element = track_handles(await page.query_selector(selector))
+                if element:
+                    try:
+                        if await element.is_visible() and await element.is_enabled():
+                            return element
+                    except Exception:
+                        pass
+                    scope.track(element)
         return None
 
     async def find_button_by_text(self, text: str, get_all: bool = False) -> Any | None | list[Any]:
@@ -400,13 +990,389 @@ class WebAutomationEngine:
             return False
 
         try:
-            element = await page.query_selector(selector)
-            if element:
-                return await element.is_visible()
+            return await self.locator(selector, page).first.is_visible()
+        except Exception:
+            return False
+
+    def locator(self, selector: str, page: Page | None = None) -> Locator | None:
+        """Get a reusable Locator for a selector on the current page (or the given one)"""
+        page = page or self.page
+        if not page:
+            return None
+
+        return self.locators.get(page, selector)
+
+    def get_resource_stats(self) -> dict[str, int]:
+        """Get remote object accounting (live handles should stay near zero)"""
+        stats = dict(handle_stats)
+        stats.update(rpc_stats)
+        stats.update(self.prefetch_stats)
+        stats.update(self.recovery_stats)
+        stats.update(self.startup_stats)
+        stats["cached_locators"] = len(self.locators)
+        return stats
+
+    async def match_selectors(
+        self, selectors: list[str], *, visible: bool = True, enabled: bool = False
+    ) -> SelectorSweep | None:
+        """Find which alternative of a fallback selector list matches (single round trip)"""
+        page = await self.get_page()
+        if not page:
+            return None
+
+        return await match_selector_list(page, selectors, visible=visible, enabled=enabled)
+
+    async def install_page_helpers(self) -> None:
+        """Install all in-page helpers (state snapshot first, observer depends on it)"""
+        if await self.install_page_state_helper():
+            await self.install_page_observer()
+        self.install_step_listener()
+        self.install_liveness_listeners()
+
+    async def install_page_state_helper(self) -> bool:
+        """Install the page state helper for every future document and the current one"""
+        page = await self.get_page()
+        if not page or not self.context:
+            return False
+
+        try:
+            # Init script runs before page scripts on every navigation (once per context)
+            if self._page_state_context_id != id(self.context):
+                await self.context.add_init_script(script=PAGE_STATE_SCRIPT)
+                self._page_state_context_id = id(self.context)
+
+            # Current document was loaded before the init script existed
+            await _evaluate(page, PAGE_STATE_SCRIPT)
+            logger.debug("📸 Page state helper installed")
+            return True
+        except Exception as e:
+            logger.debug(f"Could not install page state helper: {e}")
+            return False
+
+    async def install_page_observer(self) -> bool:
+        """Install the MutationObserver that pushes page changes into the event bus"""
+        page = await self.get_page()
+        if not page or not self.context:
+            return False
+
+        try:
+            if self._page_events_context_id != id(self.context):
+                await self.context.expose_function("__botPageEvent", self.page_events.publish)
+                await self.context.add_init_script(script=PAGE_OBSERVER_SCRIPT)
+                self._page_events_context_id = id(self.context)
+
+            await _evaluate(page, PAGE_OBSERVER_SCRIPT)
+            self.page_events.active = True
+            logger.debug("📡 Page change observer installed")
+            return True
+        except Exception as e:
+            logger.debug(f"Could not install page observer (falling back to polling): {e}")
+            self.page_events.active = False
+            return False
+
+    def install_step_listener(self) -> bool:
+        """Parse every travel step response into a StepOutcome (listener added once per page)"""
+        page = self.page
+        if not page:
             return False
+
+        if self._step_listener_page_id != id(page):
+            self._listen(page, "response", self._on_step_response)
+            self._step_listener_page_id = id(page)
+            logger.debug("👣 Step response listener installed")
+        return True
+
+    def install_liveness_listeners(self) -> bool:
+        """Track page/browser liveness from events (listeners added once per page/browser)"""
+        page = self.page
+        if not page:
+            return False
+
+        if self._liveness_page_id != id(page):
+            self._listen(page, "close", self._on_page_close)
+            self._listen(page, "crash", self._on_page_crash)
+            self._listen(page, "framenavigated", self._on_frame_navigated)
+            self._liveness_page_id = id(page)
+            self.page_lost_reason = None
+            self.current_url = page.url
+            self._notify_navigation()
+            logger.debug("💓 Page liveness listeners installed")
+
+        if self.browser is not None and self._liveness_browser_id != id(self.browser):
+            self.browser.on("disconnected", self._on_browser_disconnected)
+            self._liveness_browser_id = id(self.browser)
+        return True
+
+    def _listen(self, page: Any, event: str, handler: Callable[..., Any]) -> None:
+        """Add a page listener, remembered for _remove_page_listeners"""
+        page.on(event, handler)
+        self._page_listeners.append((page, event, handler))
+
+    def _remove_page_listeners(self) -> None:
+        """Detach every page listener (the page may be re-picked by recovery)"""
+        listeners, self._page_listeners = self._page_listeners, []
+        for page, event, handler in listeners:
+            try:
+                page.remove_listener(event, handler)
+            except Exception as e:
+                logger.debug(f"Could not remove {event} listener: {e}")
+        self._step_listener_page_id = None
+        self._liveness_page_id = None
+
+    def _mark_page_lost(self, reason: str, page: Any = None) -> None:
+        """Invalidate the cached page and wake the bot loop"""
+        if page is not None and page is not self.page:
+            return  # another tab (e.g. the captcha tab)
+
+        self.page_lost_reason = reason
+        self._lost_page = page if page is not None else self.page
+        logger.warning(f"🚨 {reason.capitalize()}")
+        self.page_events.wake()
+
+    def _on_page_close(self, page: Any = None) -> None:
+        """Page close event"""
+        self._mark_page_lost("page closed", page)
+
+    def _on_page_crash(self, page: Any = None) -> None:
+        """Page crash event"""
+        self._mark_page_lost("page crashed", page)
+
+    def _on_browser_disconnected(self, browser: Any = None) -> None:
+        """Browser disconnected event (closed or CDP connection lost)"""
+        if browser is not None and browser is not self.browser:
+            return  # a connection already replaced by recover()
+        self._mark_page_lost("browser disconnected")
+
+    def _on_frame_navigated(self, frame: Any) -> None:
+        """Main frame navigation - keep the URL and flag off-site pages for a navigation check"""
+        if frame.parent_frame is not None:
+            return  # iframes
+
+        self.current_url = frame.url or ""
+        if "simple-mmo.com" not in self.current_url:
+            self.navigation_check_due = True
+        self._notify_navigation()
+
+    def add_navigation_listener(self, listener: Callable[[str], Any]) -> None:
+        """Call listener(url) after every main frame navigation of the bot page"""
+        if listener not in self._navigation_listeners:
+            self._navigation_listeners.append(listener)
+
+    def remove_navigation_listener(self, listener: Callable[[str], Any]) -> None:
+        """Stop calling listener (e.g. its runner was cleaned up)"""
+        if listener in self._navigation_listeners:
+            self._navigation_listeners.remove(listener)
+
+    def _notify_navigation(self) -> None:
+        """Hand the current URL to the navigation listeners"""
+        for listener in self._navigation_listeners:
+            try:
+                listener(self.current_url)
+            except Exception as e:
+                logger.debug(f"Navigation listener failed: {e}")
+
+    def consume_navigation_check(self) -> bool:
+        """True once after the main frame navigated away from the game"""
+        due = self.navigation_check_due
+        self.navigation_check_due = False
+        return due
+
+    async def _on_step_response(self, response: Any) -> None:
+        """Response listener - keep the outcome of step requests and wake the bot loop"""
+        if not is_step_response_url(response.url):
+            return
+
+        try:
+            if not response.ok:
+                return
+            payload = await response.json()
+        except Exception as e:
+            logger.debug(f"Could not read step response: {e}")
+            return
+
+        if not isinstance(payload, dict):
+            return
+
+        outcome = StepOutcome.from_payload(payload)
+        self.last_step_outcome = outcome
+        self._step_outcome_fresh = True
+        logger.debug(f"👣 Step outcome: {outcome.kind} (cooldown {outcome.wait_seconds}s)")
+        self.page_events.wake()
+
+    def pop_step_outcome(self) -> StepOutcome | None:
+        """Get the latest step outcome if it was not consumed yet"""
+        if not self._step_outcome_fresh:
+            return None
+
+        self._step_outcome_fresh = False
+        return self.last_step_outcome
+
+    async def install_gather_progress(
+        self, callback: Callable[[dict[str, Any]], bool] | None
+    ) -> bool:
+        """Route bulk gather progress to a callback (its return value False aborts the run)
+
+        Returns:
+            True if the progress binding is available in the page
+        """
+        self.gather_progress_callback = callback
+        if not self.context:
+            return False
+
+        try:
+            if self._gather_progress_context_id != id(self.context):
+                await self.context.expose_function(
+                    GATHER_PROGRESS_BINDING, self._on_gather_progress
+                )
+                self._gather_progress_context_id = id(self.context)
+            return True
+        except Exception as e:
+            logger.debug(f"Could not expose gather progress binding: {e}")
+            return False
+
+    def _on_gather_progress(self, progress: dict[str, Any]) -> bool:
+        """Binding callback - forward progress, return False to stop the in-page runner"""
+        callback = self.gather_progress_callback
+        if callback is None:
+            return True
+
+        try:
+            return callback(progress) is not False
+        except Exception as e:
+            logger.debug(f"Gather progress callback failed: {e}")
+            return True
+
+    async def wait_for_page_change(self, timeout: float) -> bool:
+        """Wait for a pushed page change (or plain sleep when the observer is unavailable)
+
+        Returns:
+            True if a page change was pushed before the timeout
+        """
+        if not self.page_events.active:
+            await asyncio.sleep(timeout)
+            return False
+
+        return await self.page_events.wait_for_change(timeout)
+
+    def pop_pushed_state(self) -> PageState | None:
+        """Get the latest pushed snapshot if it is unconsumed and belongs to the current document"""
+        state = self.page_events.pop_state()
+        if not state or not self.page:
+            return None
+
+        try:
+            # A push from the previous document may arrive before the new one reports
+            return state if state.url == self.page.url else None
         except Exception:
+            return None
+
+    async def get_page_state(self) -> PageState | None:
+        """Get a snapshot of the current page in a single round trip"""
+        page = await self.get_page()
+        if not page:
+            return None
+
+        try:
+            started = time.monotonic()
+            payload = await _evaluate(page, PAGE_STATE_EVAL)
+            self.state_latency += STATE_LATENCY_SMOOTHING * (
+                time.monotonic() - started - self.state_latency
+            )
+            if payload is None:
+                # Helper missing (e.g. document replaced without init script) - install and retry
+                await _evaluate(page, PAGE_STATE_SCRIPT)
+                payload = await _evaluate(page, PAGE_STATE_EVAL)
+
+            if payload is None:
+                return None
+
+            return PageState.from_payload(payload)
+        except Exception as e:
+            logger.debug(f"Could not read page state: {e}")
+            return None
+
+    def prefetch_page_state(self, settle: float) -> bool:
+        """Read the next PageState so it is ready when a settle delay of `settle` seconds ends
+
+        The read starts one round trip before the delay expires, so the snapshot
+        is as fresh as possible and the next cycle does not wait for it.
+        """
+        if not self.prefetch_enabled or not self.page:
             return False
 
+        self.discard_prefetch()
+        lead = min(settle, self.state_latency)
+        self._prefetch_task = asyncio.create_task(self._prefetch(max(0.0, settle - lead)))
+        self.prefetch_stats["prefetch_started"] += 1
+        return True
+
+    async def _prefetch(self, delay: float) -> PageState | None:
+        """Prefetch task body"""
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return await self.get_page_state()
+
+    def discard_prefetch(self) -> None:
+        """Drop a pending or unused prefetched snapshot"""
+        task = self._prefetch_task
+        self._prefetch_task = None
+        if task is None:
+            return
+
+        if not task.done():
+            task.cancel()
+        self.prefetch_stats["prefetch_discarded"] += 1
+
+    async def take_prefetched_state(self) -> PageState | None:
+        """Get the prefetched snapshot (waiting for an in-flight read) if it is still valid"""
+        task = self._prefetch_task
+        self._prefetch_task = None
+        if task is None:
+            return None
+
+        try:
+            state = await task
+        except Exception as e:
+            logger.debug(f"Prefetched page state unavailable: {e}")
+            state = None
+
+        current_url = self.page.url if self.page else None
+        if not state or state.age > PREFETCH_MAX_AGE or state.url != current_url:
+            self.prefetch_stats["prefetch_discarded"] += 1
+            return None
+
+        self.prefetch_stats["prefetch_used"] += 1
+        return state
+
+    async def next_page_state(self) -> PageState | None:
+        """Snapshot for the next cycle: pushed by the observer, prefetched, or read now"""
+        state = self.pop_pushed_state()
+        if state is not None:
+            self.discard_prefetch()
+            return state
+
+        return await self.take_prefetched_state() or await self.get_page_state()
+
+    async def run_interruptible(self, awaitable: Awaitable[Any]) -> tuple[Any, str | None]:
+        """Run a long action that stops as soon as a captcha or death appears
+
+        Pushed page states are watched when the observer is active; otherwise the
+        state is read once per INTERRUPT_POLL_INTERVAL while the action runs.
+
+        Returns:
+            (result, None) if the action finished, (None, reason) if interrupted
+        """
+        poll = None if self.page_events.active else self.get_page_state
+        return await self.page_events.run_until_interrupt(awaitable, poll=poll)
+
+    async def get_combat_state(self, page: Page | None = None) -> CombatState | None:
+        """Read enemy/player HP from the combat page in a single round trip"""
+        page = page or await self.get_page()
+        if not page:
+            return None
+
+        return await read_combat_state(page)
+
     async def cleanup(self) -> None:
         """Cleanup resources"""
         try:
@@ -449,6 +1415,20 @@ class WebAutomationEngine:
             self.context = None
             self.browser = None
             self.playwright = None
+            self._page_state_context_id = None
+            self._page_events_context_id = None
+            self._gather_progress_context_id = None
+            self._remove_page_listeners()
+            self._liveness_browser_id = None
+            self.page_lost_reason = None
+            self._lost_page = None
+            self.navigation_check_due = False
+            self.last_step_outcome = None
+            self._step_outcome_fresh = False
+            self.discard_prefetch()
+            self.page_events.active = False
+            self.page_events.reset()
+            self.locators.clear()
 
     async def shutdown(self) -> None:
         """Shutdown browser"""
@@ -546,29 +1526,36 @@ class WebAutomationEngine:
             logger.error(f"❌ Failed to start Chromium: {e}")
             return False
 
-    async def _wait_for_browser_ready(self) -> None:
-        """Wait for browser to be ready for connection"""
+    async def _wait_for_browser_ready(self, timeout: float = BROWSER_READY_TIMEOUT) -> bool:
+        """Wait until the started browser accepts DevTools connections
+
+        Probes /json/version over plain HTTP at short intervals (a few milliseconds
+        each) instead of starting a Playwright driver and a CDP connection per attempt;
+        the real connection is made once afterwards.
+
+        Returns:
+            True if the browser answered within the timeout
+        """
         logger.info("⏰ Waiting for browser to be ready...")
-        for i in range(10):  # Wait up to 10 seconds
-            try:
-                # Try a quick connection test
-                test_playwright = await async_playwright().start()
-                try:
-                    test_browser = await test_playwright.chromium.connect_over_cdp(
-                        "http://localhost:9222"
-                    )
-                    await test_browser.close()
-                    await test_playwright.stop()
-                    logger.success("✅ Browser is ready!")
-                    return
-                except Exception:
-                    await test_playwright.stop()
+        started = time.monotonic()
+        attempts = 0
+        while True:
+            attempts += 1
+            info = await probe_devtools(self.debugging_port)
+            elapsed = time.monotonic() - started
+            if info is not None:
+                self.startup_stats["browser_ready_ms"] = round(elapsed * 1000)
+                self.startup_stats["browser_probe_attempts"] = attempts
+                logger.success(
+                    f"✅ Browser is ready! ({info.get('Browser', 'unknown')}, {elapsed:.2f}s)"
+                )
+                return True
 
-            except Exception:
-                pass
+            if elapsed >= timeout:
+                logger.warning(f"⚠️ Browser not ready after {timeout:.0f}s - connecting anyway")
+                return False
 
-            await asyncio.sleep(1)
-            logger.debug(f"Still waiting... ({i + 1}/10)")
+            await asyncio.sleep(BROWSER_PROBE_INTERVAL)
 
     async def ensure_on_travel_page(self) -> bool:
         """Ensure we're on the travel page, navigate if necessary"""
@@ -606,7 +1593,34 @@ class WebAutomationEngine:
         return await self.ensure_on_travel_page()
 
     async def is_context_destroyed(self) -> bool:
-        """Check if execution context was destroyed (navigation crash)"""
+        """Check if execution context was destroyed (navigation crash)
+
+        Answered from the liveness events when they are tracked for the current
+        page (no round trip); otherwise the page is probed.
+        """
+        if self.page is not None and self._liveness_page_id == id(self.page):
+            return self._is_page_lost()
+        return await self._probe_context_destroyed()
+
+    def _is_page_lost(self) -> bool:
+        """Liveness verdict from page/browser events"""
+        if self.page_lost_reason:
+            logger.warning(f"🚨 Page lost: {self.page_lost_reason}")
+            return True
+
+        url = self.current_url
+        if not url or url == "about:blank":
+            logger.warning("🚨 Page URL is blank or empty - likely destroyed")
+            return True
+
+        if "simple-mmo" not in url and "localhost" not in url:
+            logger.warning(f"🚨 Page navigated away from SimpleMMO: {url}")
+            return True
+
+        return False
+
+    async def _probe_context_destroyed(self) -> bool:
+        """Probe the page when no liveness events are tracked for it"""
         try:
             # Wait a moment if page/context is temporarily None (might be initializing)
             if not self.page or not self.context:
@@ -639,7 +1653,7 @@ class WebAutomationEngine:
 
             # Try a simple DOM operation to test if context is alive (with extra protection)
             try:
-                await self.page.evaluate("() => document.readyState")
+                await _evaluate(self.page, "() => document.readyState")
             except Exception as e:
                 if "'NoneType' object has no attribute 'send'" in str(e):
                     logger.warning("🚨 DOM operation failed - context destroyed")
@@ -678,6 +1692,108 @@ class WebAutomationEngine:
             logger.debug(f"Context check error (assuming alive): {e}")
             return False
 
+    async def recover(self, attempts: int = RECOVERY_ATTEMPTS) -> bool:
+        """Re-attach to the game after the page was lost and restore the travel page
+
+        Reuses the connected browser when possible, otherwise reconnects over CDP
+        to the one on the debugging port. The SimpleMMO tab is picked again (or
+        opened) and the page helpers are re-installed; the caller's scheduler
+        and system state are left untouched.
+
+        Returns:
+            True if a live travel page is attached again
+        """
+        logger.warning("🔄 Re-attaching to the browser...")
+        started = time.monotonic()
+        excluded = await self._discard_lost_page()
+
+        for attempt in range(1, attempts + 1):
+            try:
+                if await self._reattach(excluded):
+                    elapsed_ms = round((time.monotonic() - started) * 1000)
+                    self.recovery_stats["recoveries"] += 1
+                    self.recovery_stats["last_recovery_ms"] = elapsed_ms
+                    self.recovery_stats["total_recovery_ms"] += elapsed_ms
+                    logger.success(f"✅ Re-attached to the game in {elapsed_ms} ms")
+                    return True
+            except Exception as e:
+                logger.warning(f"⚠️ Re-attach attempt {attempt}/{attempts} failed: {e}")
+
+            if attempt < attempts:
+                await asyncio.sleep(RECOVERY_BACKOFF * attempt)
+
+        self.recovery_stats["recovery_failures"] += 1
+        logger.error("❌ Could not re-attach to the browser")
+        return False
+
+    async def _discard_lost_page(self) -> list[Any]:
+        """Pages recovery must not re-attach to: the reported tab (a crashed one is closed)
+
+        A crashed tab stays open with its game URL, so it would be picked again.
+        """
+        lost, self._lost_page = self._lost_page, None
+        if lost is None:
+            return []
+
+        if self.page_lost_reason == "page crashed":
+            try:
+                await lost.close()
+            except Exception as e:
+                logger.debug(f"Could not close crashed page: {e}")
+        return [lost]
+
+    async def _page_alive(self) -> bool:
+        """Real round trip confirming the attached page executes scripts"""
+        try:
+            await asyncio.wait_for(
+                _evaluate(self.page, "() => document.readyState"), RECOVERY_PROBE_TIMEOUT
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"Re-attached page is not responding: {e}")
+            return False
+
+    async def _reattach(self, excluded: list[Any]) -> bool:
+        """One re-attach attempt
+
+        Args:
+            excluded: Pages not to pick; a page failing the liveness round trip is added
+        """
+        self._reset_page_tracking()
+
+        if self.browser is None or not self.browser.is_connected():
+            if not self.playwright:
+                self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.connect_over_cdp(
+                f"http://localhost:{self.debugging_port}"
+            )
+
+        contexts = self.browser.contexts
+        self.context = contexts[0] if contexts else await self.browser.new_context()
+        candidates = [page for page in self.context.pages if page not in excluded]
+        self.page = _pick_game_page(candidates) or await self.context.new_page()
+
+        if not self.page.url.endswith("/travel"):
+            await self.page.goto(self.target_url, wait_until="domcontentloaded")
+
+        await self.install_page_helpers()
+        if not await self._page_alive():
+            excluded.append(self.page)  # e.g. a crashed tab nobody reported
+            return False
+        return not await self.is_context_destroyed()
+
+    def _reset_page_tracking(self) -> None:
+        """Forget everything bound to the lost page (context-level helpers are kept)"""
+        self.discard_prefetch()
+        self.page_events.active = False
+        self.page_events.reset()
+        self.locators.clear()
+        self._remove_page_listeners()
+        self.page_lost_reason = None
+        self.navigation_check_due = False
+        self.last_step_outcome = None
+        self._step_outcome_fresh = False
+
     async def handle_context_destruction(self):
         """Handle execution context destruction by cleaning up"""
         logger.warning("🔄 Handling context destruction...")
@@ -686,6 +1802,20 @@ class WebAutomationEngine:
         # Don't cleanup browser completely, just invalidate page references
 
 
+def _pick_game_page(pages: list[Any]) -> Any | None:
+    """Open SimpleMMO tab to re-attach to (the captcha tab is never picked)"""
+    for page in pages:
+        try:
+            if page.is_closed():
+                continue
+            url = page.url
+        except Exception:
+            continue
+        if "simple-mmo.com" in url and "i-am-not-a-bot" not in url:
+            return page
+    return None
+
+
 class WebEngineManager:
     """Singleton manager for web engine"""
 
@@ -731,6 +1861,13 @@ class WebEngineManager:
 
         return cls._instance
 
+    @classmethod
+    async def recover(cls) -> bool:
+        """Re-attach the running engine after its page was lost"""
+        if cls._instance is None or not cls._instance.is_initialized:
+            return False
+        return await cls._instance.recover()
+
     @classmethod
     async def shutdown(cls) -> None:
         """Shutdown the web engine instance"""
@@ -753,6 +1890,14 @@ class WebEngineManager:
         logger.success("✅ WebEngineManager force reset complete")
 
 
+def prefetch_page_state(settle: float) -> bool:
+    """Prefetch the next PageState on the running engine (no-op when there is none)"""
+    engine = WebEngineManager._instance
+    if engine is None or not engine.is_initialized:
+        return False
+    return engine.prefetch_page_state(settle)
+
+
 async def get_web_engine() -> WebAutomationEngine:
     """Get or create global web engine instance"""
     return await WebEngineManager.get_instance()
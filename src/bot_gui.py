@@ -350,8 +350,11 @@ class BotGUI:
                     self._update_gui_stats(current_time - start_time)
                     self.last_stats_update = current_time
 
-                # Small delay to prevent excessive CPU usage
-                await asyncio.sleep(0.1)
+                # Wake on the next pushed page change instead of a blind 0.1s poll
+                if self.paused:
+                    await asyncio.sleep(0.1)
+                else:
+                    await self.bot_runner.wait_for_page_event()
 
         except Exception as e:
             logger.error(f"❌ Bot main loop error: {e}")
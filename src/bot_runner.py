@@ -14,6 +14,7 @@ from loguru import logger
 CYCLE_LOG_INTERVAL = 50  # Log status every 50 cycles (more efficient)
 NAVIGATION_CHECK_INTERVAL = 500  # Check navigation every 500 cycles (less frequent)
 MAIN_LOOP_DELAY = 0.1  # Slightly longer delay to reduce CPU usage
+EVENT_WAIT_TIMEOUT = 1.0  # Safety-net rescan interval when page changes are pushed by the observer
 
 if TYPE_CHECKING:
     from config.types import BotConfig
@@ -129,6 +130,15 @@ class BotRunner:
             results["error"] = True
             return results
 
+    async def wait_for_page_event(self) -> bool:
+        """Wait between cycles until the page changes instead of polling blindly"""
+        if not self.web_engine:
+            await asyncio.sleep(MAIN_LOOP_DELAY)
+            return False
+
+        timeout = EVENT_WAIT_TIMEOUT if self.web_engine.page_events.active else MAIN_LOOP_DELAY
+        return await self.web_engine.wait_for_page_change(timeout)
+
     def get_stats(self) -> dict[str, Any]:
         """Get current bot statistics"""
         return self.stats.copy()
@@ -229,6 +239,13 @@ async def initialize_systems(config: "BotConfig") -> tuple[Any, ...] | None:
             logger.error(f"❌ Error initializing {name} System: {e}")
             return None
 
+    # Validate every registered selector once so no cycle pays for an invalid one
+    from automation.selectors import get_selector_registry
+
+    page = await web_engine.get_page()
+    if page:
+        await get_selector_registry().validate(page)
+
     logger.success("✅ All systems initialized successfully")
     return web_engine, gathering, healing, steps, combat, captcha
 
@@ -329,6 +346,10 @@ async def _cleanup_systems(web_engine) -> None:
     """Clean up systems before exit"""
     try:
         logger.info("🧹 Cleaning up systems...")
+        from automation.selectors import get_selector_registry
+
+        # Persist the selector ranking so the next session starts warm
+        get_selector_registry().save()
         if web_engine:
             await web_engine.shutdown()
         logger.success("✅ Cleanup complete")
@@ -0,0 +1,12 @@
+"""
+📁 Local data paths for SimpleMMO Bot
+
+Small files the bot keeps between sessions (learned selector ranking,
+runtime checkpoints). Everything lives under one per-user directory.
+"""
+
+from pathlib import Path
+
+BOT_DATA_DIR = Path.home() / ".botnovotesteatt"
+SELECTOR_RANKING_FILE = BOT_DATA_DIR / "selector_ranking.json"
+CHECKPOINT_FILE = BOT_DATA_DIR / "checkpoint.json"
@@ -31,6 +31,7 @@ class BotConfig(TypedDict, total=False):
     auto_steps: bool
     auto_captcha: bool
     auto_quests: bool
+    bulk_gather: bool  # gather a whole node in one in-page run (opt-in)
 
     # Quest settings
     quests_enabled: bool
@@ -44,6 +45,17 @@ class BotConfig(TypedDict, total=False):
     step_delay_max: float
     combat_delay: float
     gathering_delay: float
+    auto_tune_timing: bool  # retune polling/timeouts from observed click-to-change times
+    timing_floors: dict[str, float]  # e.g. {"combat.button_check_interval": 0.02}
+    prefetch_page_state: bool  # read the next page state during post-action settle delays
+    cycle_deadline: float  # hard limit of one bot cycle in seconds
+    system_budgets: dict[str, float | None]  # time slice per system, e.g. {"quest": 20.0}
+    auto_recover: bool  # re-attach over CDP when the page is lost instead of stopping
+    stall_deadline: float  # seconds before a running cycle is reported as stalled
+    cancel_stalled_cycles: bool  # cancel a stalled cycle so the next one starts
+    route_leave_after: float  # idle seconds before a combat/gather/healer/quests page is left
+    checkpoint_enabled: bool  # save/restore cooldowns, pending quests and tuner samples
+    checkpoint_interval: float  # seconds between periodic checkpoint saves
 
     # URLs
     travel_url: str
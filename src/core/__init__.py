@@ -5,5 +5,9 @@ Módulo principal contendo a lógica central do bot.
 """
 
 from .bot_runner import BotRunner
+from .pacing import LoopPacer
+from .route_machine import RouteMachine
+from .scheduler import ActionScheduler
+from .watchdog import CycleWatchdog
 
-__all__ = ["BotRunner"]
+__all__ = ["ActionScheduler", "BotRunner", "CycleWatchdog", "LoopPacer", "RouteMachine"]
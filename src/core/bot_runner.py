@@ -6,16 +6,50 @@ The main.py file should only be responsible for starting the bot.
 """
 
 import asyncio
+import time
 from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
+try:
+    from ..utils.deadlines import cancel_threadsafe, deadline_scope
+    from .checkpoint import CHECKPOINT_INTERVAL, SessionCheckpoint
+    from .pacing import LoopPacer
+    from .route_machine import ROUTE_LEAVE_AFTER, RouteMachine
+    from .scheduler import ActionScheduler
+    from .tuner import get_timing_tuner
+    from .watchdog import DEFAULT_STALL_AFTER, CycleWatchdog
+except ImportError:
+    from core.checkpoint import CHECKPOINT_INTERVAL, SessionCheckpoint
+    from core.pacing import LoopPacer
+    from core.route_machine import ROUTE_LEAVE_AFTER, RouteMachine
+    from core.scheduler import ActionScheduler
+    from core.tuner import get_timing_tuner
+    from core.watchdog import DEFAULT_STALL_AFTER, CycleWatchdog
+    from utils.deadlines import cancel_threadsafe, deadline_scope
+
 # Constants
 CYCLE_LOG_INTERVAL = 50  # Log status every 50 cycles (more efficient)
-NAVIGATION_CHECK_INTERVAL = 500  # Check navigation every 500 cycles (less frequent)
 MAIN_LOOP_DELAY = 0.1  # Slightly longer delay to reduce CPU usage
+IDLE_BACKOFF_MAX_POLLING = 1.0  # Idle delay ceiling when changes must be polled
+IDLE_BACKOFF_MAX_PUSHED = 5.0  # Idle delay ceiling when the observer pushes page changes
+CYCLE_DEADLINE = 900.0  # Hard limit of one cycle (longer than the 600s manual captcha wait)
+
+# Time slice per system run (seconds, None = cycle deadline only). Quests and the
+# step wait yield when their slice is used up and continue in a later cycle;
+# every overrun is counted per system. Override with config["system_budgets"].
+DEFAULT_SYSTEM_BUDGETS: dict[str, float | None] = {
+    "captcha": None,  # waits for the player
+    "gathering": 60.0,
+    "combat": 60.0,
+    "healing": 15.0,
+    "step": 30.0,
+    "quest": 20.0,
+}
 
 if TYPE_CHECKING:
+    from automation.page_state import PageState
+    from automation.step_outcome import StepOutcome
     from config.types import BotConfig
 
 
@@ -41,6 +75,36 @@ class BotRunner:
         self.combat = None
         self.captcha = None
         self.quest_automation = None
+        self.scheduler: ActionScheduler | None = None
+        # Page route -> systems dispatched there
+        self.routes = RouteMachine(leave_after=config.get("route_leave_after", ROUTE_LEAVE_AFTER))
+        self.pacer = LoopPacer(base_delay=MAIN_LOOP_DELAY)
+
+        # Time from the end of an action until the next cycle has its page state
+        self._last_action_end: float | None = None
+        self.decision_latency = {"samples": 0, "total_seconds": 0.0}
+
+        # Task running the bot loop and the cycle in flight (cancelled on stop/pause)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task | None = None
+        self._cycle_task: asyncio.Task | None = None
+        self._cycle_interrupted = False
+
+        # Reports cycles stuck far past stall_deadline (and optionally cancels them)
+        self.last_state: "PageState | None" = None
+        self.watchdog = CycleWatchdog(
+            config.get("stall_deadline", DEFAULT_STALL_AFTER),
+            cancel_stalled=config.get("cancel_stalled_cycles", False),
+            context=self._watchdog_context,
+            interrupt=self._interrupt_cycle,
+        )
+
+        # Cooldowns, pending quests and tuner samples kept across restarts (not stats)
+        self.checkpoint = SessionCheckpoint(
+            interval=config.get("checkpoint_interval", CHECKPOINT_INTERVAL)
+        )
+        if not config.get("checkpoint_enabled", True):
+            self.checkpoint.path = None
 
         # Statistics
         self.stats = {
@@ -66,17 +130,69 @@ class BotRunner:
             self.web_engine, self.gathering, self.healing, self.steps, self.combat, self.captcha, self.quest_automation = (
                 systems
             )
+            await self.checkpoint.restore(self)
+            self._setup_dispatch()
             return True
 
         except Exception as e:
             logger.error(f"❌ Failed to initialize bot: {e}")
             return False
 
+    def _setup_dispatch(self) -> None:
+        """Build the action scheduler and follow page routes from navigation events"""
+        self.scheduler = build_action_scheduler(
+            self.gathering,
+            self.healing,
+            self.steps,
+            self.combat,
+            self.captcha,
+            self.quest_automation,
+            self.config,
+        )
+        self.web_engine.add_navigation_listener(self.routes.on_navigated)
+        self.routes.on_navigated(self.web_engine.current_url)
+
     async def run_cycle(self) -> dict[str, bool]:
         """Run a single bot cycle and return results"""
         if not self.web_engine:
             raise RuntimeError("Bot not initialized")
 
+        cpu_start = time.process_time()
+        rpcs_start = self.web_engine.get_resource_stats().get("page_calls", 0)
+
+        # Every wait inside the systems is capped by the cycle deadline
+        with deadline_scope(self.config.get("cycle_deadline", CYCLE_DEADLINE)):
+            self._cycle_task = asyncio.ensure_future(self._run_cycle())
+            self.watchdog.start()
+            self.watchdog.cycle_started(self._cycle_task)
+            try:
+                results = await self._cycle_task
+            except asyncio.CancelledError:
+                if not self._cycle_interrupted:
+                    raise  # The bot task itself was cancelled (stop)
+                logger.info("⏸️ Cycle interrupted")
+                results = {"interrupted": True}
+            finally:
+                self.watchdog.cycle_finished()
+                self._cycle_task = None
+                self._cycle_interrupted = False
+
+        acted = any(
+            value for key, value in results.items() if key not in ("error", "interrupted")
+        )
+        if acted:
+            self._last_action_end = time.monotonic()
+
+        self.pacer.record_cycle(
+            acted=acted,
+            cpu_seconds=time.process_time() - cpu_start,
+            rpcs=self.web_engine.get_resource_stats().get("page_calls", 0) - rpcs_start,
+        )
+        self.checkpoint.maybe_save(self)
+        return results
+
+    async def _run_cycle(self) -> dict[str, bool]:
+        """Cycle body: step outcome, page snapshot and scheduled system checks"""
         self.cycles += 1
         self.stats["cycles"] = self.cycles
         results: dict[str, bool] = {}
@@ -84,6 +200,10 @@ class BotRunner:
         try:
             # FIRST: Check if page context was destroyed (navigation crash)
             if await self.web_engine.is_context_destroyed():
+                if await self.recover_page():
+                    results["recovered"] = True
+                    return results
+
                 logger.error("🚨 Page navigation detected - bot context destroyed!")
                 logger.error("🛑 Stopping bot to prevent errors. Please restart when ready.")
                 self.running = False
@@ -91,54 +211,63 @@ class BotRunner:
                 await self.web_engine.handle_context_destruction()
                 return results
 
-            # Check for captcha first (highest priority)
-            captcha_handled = await check_and_handle_captcha(self.captcha)
-            if captcha_handled:
-                self.stats["captcha_solved"] += 1
-                results["captcha"] = True
+            # Act on the last step response first (no DOM probes needed)
+            outcome_result = await handle_step_outcome(
+                self.web_engine.pop_step_outcome(), self.gathering, self.combat, self.scheduler
+            )
+            if outcome_result == "combat":
+                self.stats["combat_wins"] += 1
+                results["combat"] = True
                 return results
-
-            # Check for gathering opportunities
-            gather_result = await check_and_handle_gathering(self.gathering)
-            if gather_result:
+            if outcome_result == "gathering":
                 self.stats["gathering_success"] += 1
                 results["gathering"] = True
                 return results
 
-            # Check for combat opportunities
-            combat_result = await check_and_handle_combat(self.combat)
-            if combat_result:
-                self.stats["combat_wins"] += 1
-                results["combat"] = True
+            # Snapshot shared by every detector below (pushed, prefetched or one round trip)
+            state = await self.web_engine.next_page_state()
+            if state is None:
+                logger.debug("📸 Page state unavailable - skipping system checks this cycle")
                 return results
 
-            # Check character health
-            healing_result = await check_and_handle_healing(self.healing)
-            if healing_result:
-                self.stats["healing_performed"] += 1
-                results["healing"] = True
-                return results
+            self.last_state = state
+            self._record_decision_latency()
+            if state.url:
+                self.routes.transition(state.route)  # in case a navigation event was missed
+
+            # Only systems that can act right now on this route are evaluated (priority order)
+            scheduled = await self.scheduler.run_once(state, only=self.routes.actions)
+            results.update(scheduled)
+            leave_route = self.routes.should_leave(any(scheduled.values()))
 
-            # Check for step availability
-            step_result = await check_and_handle_step(self.steps)
-            if step_result:
+            if scheduled.get("captcha"):
+                self.stats["captcha_solved"] += 1
+            if scheduled.get("gathering"):
+                self.stats["gathering_success"] += 1
+            if scheduled.get("combat"):
+                self.stats["combat_wins"] += 1
+            if scheduled.get("healing"):
+                self.stats["healing_performed"] += 1
+            if scheduled.get("step"):
                 self.stats["steps_taken"] += 1
                 self.stats["successful_steps"] += 1
-                results["step"] = True
-            else:
-                if self.steps and await self.steps.is_step_available():
-                    self.stats["failed_steps"] += 1
-                results["step"] = False
-
-            # Check for quest opportunities
-            quest_result = await check_and_handle_quests(self.quest_automation, self.config)
-            if quest_result:
+            elif "step" in scheduled and await self.steps.is_step_available(state):
+                self.stats["failed_steps"] += 1
+            if scheduled.get("quest"):
                 self.stats["quests_completed"] += 1
-                results["quest"] = True
+
+            terminal = ("captcha", "gathering", "combat", "healing", "quest")
+            if any(scheduled.get(name) for name in terminal):
                 return results
 
-            # Check navigation if needed
-            if self.cycles % NAVIGATION_CHECK_INTERVAL == 0:
+            # Nothing happened on a combat/gather/healer/quests page for a while
+            if leave_route:
+                logger.debug(f"🧭 Nothing to do on the {self.routes.route} page - back to travel")
+                await self.steps.navigate_to_travel()
+                return results
+
+            # Check navigation only after the main frame left the game (framenavigated)
+            if self.web_engine.consume_navigation_check():
                 await _check_navigation_if_needed(self.web_engine, self.steps)
 
             return results
@@ -148,9 +277,105 @@ class BotRunner:
             results["error"] = True
             return results
 
+    async def recover_page(self) -> bool:
+        """Re-attach to the browser after the page was lost (scheduler state is kept)"""
+        if not self.web_engine or not self.config.get("auto_recover", True):
+            return False
+
+        if not await self.web_engine.recover():
+            return False
+
+        # Cooldowns may have passed during the outage
+        if self.scheduler:
+            self.scheduler.refresh()
+        return True
+
+    def save_checkpoint(self) -> bool:
+        """Persist the session state now (e.g. when the bot loop ends)"""
+        return self.checkpoint.save(self)
+
+    def bind_current_task(self) -> None:
+        """Remember the task running the bot loop so other threads can stop it"""
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.current_task()
+
+    def request_stop(self) -> bool:
+        """Stop the bot from any thread - the running call is cancelled right away
+
+        Returns:
+            True if a running bot task was cancelled
+        """
+        self.running = False
+        return cancel_threadsafe(self._loop, self._task)
+
+    def request_pause(self, paused: bool) -> None:
+        """Pause/resume from any thread - pausing interrupts the cycle in flight"""
+        self.paused = paused
+        if paused and self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._interrupt_cycle)
+
+    def _interrupt_cycle(self) -> None:
+        """Cancel the cycle in flight (runs on the bot loop)"""
+        if self._cycle_task is not None and not self._cycle_task.done():
+            self._cycle_interrupted = True
+            self._cycle_task.cancel()
+
+    def _watchdog_context(self) -> dict[str, Any]:
+        """URL and last page state for a stall report (no page round trip)"""
+        url = None
+        if self.web_engine:
+            page = getattr(self.web_engine, "page", None)
+            url = getattr(self.web_engine, "current_url", "") or getattr(page, "url", None)
+        return {"url": url, "page_state": self.last_state}
+
+    def _record_decision_latency(self) -> None:
+        """Account the time from the last action until this cycle had its page state"""
+        if self._last_action_end is None:
+            return
+        self.decision_latency["samples"] += 1
+        self.decision_latency["total_seconds"] += time.monotonic() - self._last_action_end
+        self._last_action_end = None
+
+    async def wait_for_page_event(self, timeout: float | None = None) -> bool:
+        """Wait between cycles until the page changes instead of polling blindly
+
+        Args:
+            timeout: Maximum wait; defaults to the adaptive pacing delay
+
+        Returns:
+            True if woken by a pushed page change
+        """
+        if not self.web_engine:
+            await asyncio.sleep(MAIN_LOOP_DELAY)
+            return False
+
+        if timeout is not None:
+            return await self.web_engine.wait_for_page_change(timeout)
+
+        return await paced_wait(self.web_engine, self.pacer, self.scheduler)
+
     def get_stats(self) -> dict[str, Any]:
         """Get current bot statistics"""
-        return self.stats.copy()
+        stats = self.stats.copy()
+        if self.web_engine:
+            for key, value in self.web_engine.page_events.stats.items():
+                stats[f"page_{key}"] = value
+            stats.update(self.web_engine.get_resource_stats())
+        if self.scheduler:
+            stats.update(self.scheduler.get_stats())
+        stats.update(self.pacer.get_stats())
+        stats.update(get_timing_tuner().get_stats())
+        stats.update(self.watchdog.get_stats())
+        stats.update(self.routes.get_stats())
+        stats.update(self.checkpoint.get_stats())
+        if self.quest_automation is not None:
+            stats["quests_pending"] = getattr(self.quest_automation, "pending_quests", 0)
+        samples = self.decision_latency["samples"]
+        if samples:
+            stats["time_to_next_decision_ms"] = round(
+                self.decision_latency["total_seconds"] * 1000 / samples, 1
+            )
+        return stats
 
     async def initialize(self):
         """Initialize the bot and all systems"""
@@ -163,12 +388,18 @@ class BotRunner:
         (self.web_engine, self.gathering, self.healing, self.steps, self.combat, self.captcha, self.quest_automation) = (
             systems
         )
+        await self.checkpoint.restore(self)
+        self._setup_dispatch()
 
         logger.success("✅ Bot initialized successfully")
         return True
 
     async def cleanup(self):
         """Cleanup bot and all systems"""
+        self.watchdog.stop()
+        if self.web_engine:
+            self.save_checkpoint()
+            self.web_engine.remove_navigation_listener(self.routes.on_navigated)
         try:
             await _cleanup_systems(self.web_engine)
             logger.success("✅ Bot cleanup completed")
@@ -182,6 +413,8 @@ class BotRunner:
     def update_config(self, new_config: "BotConfig") -> None:
         """Update bot configuration and propagate to all systems"""
         self.config.update(new_config)
+        self.watchdog.stall_after = self.config.get("stall_deadline", DEFAULT_STALL_AFTER)
+        self.watchdog.cancel_stalled = self.config.get("cancel_stalled_cycles", False)
 
         # Update each system's configuration
         systems = [self.gathering, self.healing, self.steps, self.combat, self.captcha]
@@ -196,6 +429,8 @@ class BotRunner:
                     system.auto_combat = new_config.get("auto_combat", True)
                 if hasattr(system, "auto_heal"):
                     system.auto_heal = new_config.get("auto_heal", True)
+                if hasattr(system, "bulk_gather"):
+                    system.bulk_gather = new_config.get("bulk_gather", False)
 
         logger.info("⚙️ Configuration updated for all systems")
 
@@ -218,6 +453,8 @@ class BotRunner:
             "gathering_success": 0,
             "captcha_solved": 0,
             "healing_performed": 0,
+            "quests_completed": 0,
+            "quest_points_used": 0,
         }
 
         # Reset captcha system state
@@ -232,6 +469,18 @@ class BotRunner:
         if self.combat and hasattr(self.combat, "reset_state"):
             await self.combat.reset_state()
 
+        # Drop quests left over from an interrupted time slice
+        if self.quest_automation is not None:
+            self.quest_automation.pending_quests = 0
+
+        # Warm-start data (cooldowns, pending quests, tuned timings) survives stop/start -
+        # re-apply it on top of the reset, statistics stay at zero
+        await self.checkpoint.restore(self)
+
+        # Cooldowns were reset - re-read every system's next eligible time
+        if self.scheduler:
+            self.scheduler.refresh()
+
         logger.success("✅ Bot state reset complete - ready for fresh start")
 
 
@@ -256,6 +505,7 @@ async def initialize_systems(config: "BotConfig") -> tuple[Any, ...] | None:
         return None
 
     logger.success("✅ Web engine ready")
+    web_engine.prefetch_enabled = config.get("prefetch_page_state", True)
 
     # Initialize systems
     gathering = GatheringSystem(config)
@@ -265,6 +515,10 @@ async def initialize_systems(config: "BotConfig") -> tuple[Any, ...] | None:
     captcha = CaptchaSystem(config)
     quest_automation = QuestAutomation()
 
+    # Systems share the engine (and its event-tracked page) instead of looking it up
+    for system in (gathering, healing, steps, combat, captcha):
+        system.web_engine = web_engine
+
     # Initialize each system
     systems = [
         ("Gathering", gathering),
@@ -286,13 +540,115 @@ async def initialize_systems(config: "BotConfig") -> tuple[Any, ...] | None:
             logger.error(f"❌ Error initializing {name} System: {e}")
             return None
 
+    # Validate every registered selector once so no cycle pays for an invalid one
+    from automation.selectors import get_selector_registry
+
+    page = await web_engine.get_page()
+    if page:
+        await get_selector_registry().validate(page)
+
     logger.success("✅ All systems initialized successfully")
     return web_engine, gathering, healing, steps, combat, captcha, quest_automation
 
 
-async def check_and_handle_captcha(captcha) -> bool:
+def build_action_scheduler(
+    gathering, healing, steps, combat, captcha, quest_automation=None, config=None
+) -> ActionScheduler:
+    """Register every system with its priority, readiness flag and cooldown"""
+    config = config or {}
+    budgets = {**DEFAULT_SYSTEM_BUDGETS, **(config.get("system_budgets") or {})}
+    scheduler = ActionScheduler()
+
+    scheduler.register(
+        "captcha",
+        lambda state: check_and_handle_captcha(captcha, state),
+        priority=0,
+        budget=budgets.get("captcha"),
+    )
+    scheduler.register(
+        "gathering",
+        lambda state: check_and_handle_gathering(gathering, state),
+        priority=10,
+        is_ready=lambda: gathering.auto_gather,
+        next_eligible=lambda: gathering.last_gather_time + gathering.gather_cooldown,
+        budget=budgets.get("gathering"),
+        interrupted=lambda: gathering.last_interrupt,
+    )
+    scheduler.register(
+        "combat",
+        lambda state: check_and_handle_combat(combat, state),
+        priority=20,
+        is_ready=lambda: combat.auto_combat,
+        next_eligible=lambda: combat.last_combat_time + combat.combat_cooldown,
+        budget=budgets.get("combat"),
+        interrupted=lambda: combat.last_interrupt,
+    )
+    scheduler.register(
+        "healing",
+        lambda state: check_and_handle_healing(healing, state),
+        priority=30,
+        is_ready=lambda: getattr(healing, "auto_heal", True),
+        budget=budgets.get("healing"),
+    )
+    scheduler.register(
+        "step",
+        lambda state: check_and_handle_step(steps, state),
+        priority=40,
+        stop_on_success=False,  # quests still get their turn after a step
+        budget=budgets.get("step"),
+    )
+    if quest_automation is not None:
+        scheduler.register(
+            "quest",
+            lambda state: check_and_handle_quests(quest_automation, config),
+            priority=50,
+            is_ready=lambda: config.get("quests_enabled", False),
+            budget=budgets.get("quest"),
+        )
+
+    return scheduler
+
+
+async def handle_step_outcome(
+    outcome: "StepOutcome | None", gathering, combat, scheduler: ActionScheduler | None = None
+) -> str | None:
+    """Act on what the last step produced, as reported by its network response
+
+    NPC and material outcomes go straight to combat/gathering; any other outcome
+    holds the scheduled step back until the step cooldown ends. Nothing sleeps here,
+    so captcha/death checks keep running and the idle wait wakes on page changes.
+
+    Returns:
+        "combat" or "gathering" if the outcome was handled, None to run the normal checks
+    """
+    if outcome is None:
+        return None
+
+    from automation.step_outcome import OUTCOME_CAPTCHA, OUTCOME_MATERIAL, OUTCOME_NPC
+
+    if outcome.kind == OUTCOME_NPC and combat and combat.auto_combat:
+        logger.info("⚔️ Step found an enemy - starting combat")
+        if await combat.start_combat():
+            return "combat"
+        return None
+
+    if outcome.kind == OUTCOME_MATERIAL and gathering and gathering.auto_gather:
+        logger.info("⛏️ Step found materials - starting gathering")
+        if await gathering.start_gathering():
+            return "gathering"
+        return None
+
+    if outcome.kind != OUTCOME_CAPTCHA:
+        remaining = outcome.cooldown_remaining
+        if remaining > 0 and scheduler is not None:
+            logger.debug(f"⏳ Next step in {remaining:.1f}s")
+            scheduler.defer("step", scheduler.clock() + remaining)
+    return None
+
+
+async def check_and_handle_captcha(captcha, state: "PageState | None" = None) -> bool:
     """Check and handle captcha if present"""
-    captcha_present = await captcha.is_captcha_present()
+    captcha_present = await captcha.is_captcha_present(state)
 
     if captcha_present:
         logger.warning("🔒 Captcha detected - resolving...")
@@ -306,9 +662,9 @@ async def check_and_handle_captcha(captcha) -> bool:
     return False
 
 
-async def check_and_handle_gathering(gathering) -> bool:
+async def check_and_handle_gathering(gathering, state: "PageState | None" = None) -> bool:
     """Check and handle gathering opportunities"""
-    gather_available = await gathering.is_gathering_available()
+    gather_available = await gathering.is_gathering_available(state)
 
     if gather_available:
         logger.info("⛏️ Gathering opportunity found!")
@@ -321,9 +677,9 @@ async def check_and_handle_gathering(gathering) -> bool:
     return False
 
 
-async def check_and_handle_combat(combat) -> bool:
+async def check_and_handle_combat(combat, state: "PageState | None" = None) -> bool:
     """Check and handle combat opportunities"""
-    combat_available = await combat.is_combat_available()
+    combat_available = await combat.is_combat_available(state)
 
     if combat_available:
         logger.info("⚔️ Combat opportunity found!")
@@ -336,9 +692,9 @@ async def check_and_handle_combat(combat) -> bool:
     return False
 
 
-async def check_and_handle_healing(healing) -> bool:
+async def check_and_handle_healing(healing, state: "PageState | None" = None) -> bool:
     """Check and handle character healing"""
-    health_status = await healing.check_health_status()
+    health_status = await healing.check_health_status(state)
 
     if health_status.get("needs_healing", False):
         logger.info(f"❤️ Character needs healing! (HP: {health_status.get('hp_percenttage', '?')}%)")
@@ -351,13 +707,13 @@ async def check_and_handle_healing(healing) -> bool:
     return False
 
 
-async def check_and_handle_step(steps) -> bool:
+async def check_and_handle_step(steps, state: "PageState | None" = None) -> bool:
     """Check and handle step taking"""
-    step_available = await steps.is_step_available()
+    step_available = await steps.is_step_available(state)
 
     if step_available:
         logger.debug("👣 Step available - taking step to trigger new event...")
-        step_taken = await steps.take_step(fast_mode=True)  # Use fast mode for automation
+        step_taken = await steps.take_step(fast_mode=True, state=state)  # Use fast mode for automation
         if step_taken:
             logger.info("✅ Step taken - checking for new events...")
             return True
@@ -383,9 +739,14 @@ async def check_and_handle_quests(quest_automation, config) -> bool:
 
         logger.info(f"🎯 Quest points available: {current_points}/{max_points}")
 
-        # Executa ciclo de quests
+        # Executa ciclo de quests (continues the quests left by a run that ran out of time)
         max_quests_per_cycle = config.get("max_quests_per_cycle", 3)
         results = await quest_automation.execute_quests_cycle(max_quests_per_cycle)
+        if results.get("yielded"):
+            logger.info(
+                f"⏱️ Quest time slice used up - {quest_automation.pending_quests} quests "
+                "resume next cycle"
+            )
 
         if results["quests_successful"] > 0:
             logger.success(f"✅ Completed {results['quests_successful']} quests")
@@ -413,10 +774,42 @@ async def _check_navigation_if_needed(web_engine, steps) -> None:
         logger.debug(f"Navigation check failed: {e}")
 
 
+async def paced_wait(
+    web_engine, pacer: LoopPacer, scheduler: ActionScheduler | None = None
+) -> bool:
+    """Wait the adaptive delay before the next cycle (0 right after an action)
+
+    A pushed page change ends the wait early and resets the backoff; the delay
+    never runs past the moment a scheduled system comes off cooldown.
+
+    Returns:
+        True if woken by a pushed page change
+    """
+    pacer.max_delay = (
+        IDLE_BACKOFF_MAX_PUSHED if web_engine.page_events.active else IDLE_BACKOFF_MAX_POLLING
+    )
+    next_wakeup = scheduler.next_wakeup() if scheduler else None
+    until = next_wakeup - time.time() if next_wakeup else None
+
+    delay = pacer.next_delay(until)
+    if delay <= 0:
+        await asyncio.sleep(0)  # let other tasks run
+        return False
+
+    woke = await web_engine.wait_for_page_change(delay)
+    if woke:
+        pacer.wake()
+    return woke
+
+
 async def _cleanup_systems(web_engine) -> None:
     """Clean up systems before exit"""
     try:
         logger.info("🧹 Cleaning up systems...")
+        from automation.selectors import get_selector_registry
+
+        # Persist the selector ranking so the next session starts warm
+        get_selector_registry().save()
         if web_engine:
             await web_engine.shutdown()
         logger.success("✅ Cleanup complete")
@@ -428,6 +821,11 @@ async def run_bot_loop(web_engine, gathering, healing, steps, combat, captcha) -
     """Main bot automation loop"""
     logger.info("🚀 Starting bot automation loop...")
 
+    scheduler = build_action_scheduler(gathering, healing, steps, combat, captcha)
+    pacer = LoopPacer(base_delay=MAIN_LOOP_DELAY)
+    routes = RouteMachine()
+    web_engine.add_navigation_listener(routes.on_navigated)
+
     # Keep track of cycles for reduced logging
     cycles = 0
     last_cycle_log = 0
@@ -453,36 +851,42 @@ async def run_bot_loop(web_engine, gathering, healing, steps, combat, captcha) -
                     except Exception as e:
                         logger.warning(f"⚠️ Could not get page info: {e}")
 
-            # Check for captcha first (highest priority)
-            captcha_handled = await check_and_handle_captcha(captcha)
-            if captcha_handled:  # If captcha was resolved, continue to next iteration
+            # Act on the last step response first (no DOM probes needed)
+            outcome = web_engine.pop_step_outcome()
+            if await handle_step_outcome(outcome, gathering, combat, scheduler):
                 continue
 
-            # Check for gathering opportunities
-            if await check_and_handle_gathering(gathering):
-                continue  # Check immediately for new events after gathering
-
-            # Check for combat opportunities
-            if await check_and_handle_combat(combat):
-                continue  # Check immediately for new events after combat
-
-            # Check character health
-            if await check_and_handle_healing(healing):
+            # Snapshot shared by every detector below (pushed, prefetched or one round trip)
+            state = await web_engine.next_page_state()
+            if state is None:
+                pacer.record_cycle(acted=False)
+                await paced_wait(web_engine, pacer, scheduler)
+                continue  # Page state unavailable - retry next cycle
+
+            if state.url:
+                routes.transition(state.route)
+
+            # Only systems that can act right now on this route are evaluated (priority order)
+            results = await scheduler.run_once(state, only=routes.actions)
+            acted = any(results.values())
+            pacer.record_cycle(acted=acted)
+            leave_route = routes.should_leave(acted)
+            if acted:
+                continue  # Check immediately for new events after an action
+
+            if leave_route:
+                await steps.navigate_to_travel()  # route page idle for the grace period
                 continue
 
-            # If no events found, check if step is available
-            if await check_and_handle_step(steps):
-                continue  # Check immediately for new events after step
-
             # If step not available, don't wait - just continue checking other things
             # This ensures we keep detecting gathering, combat, etc. while waiting for steps
 
-            # Check if we need to navigate to travel page (much less frequently)
-            if cycles % NAVIGATION_CHECK_INTERVAL == 0:  # Every 500 cycles (about every 50 seconds)
+            # Navigate back to travel only after the main frame left the game
+            if web_engine.consume_navigation_check():
                 await _check_navigation_if_needed(web_engine, steps)
 
-            # Optimized delay - longer since opportunities are usually detected within 2s
-            await asyncio.sleep(MAIN_LOOP_DELAY)
+            # Sleep until the page pushes a change (idle backoff while nothing happens)
+            await paced_wait(web_engine, pacer, scheduler)
 
     except KeyboardInterrupt:
         logger.info("🛑 Bot stopped by user")
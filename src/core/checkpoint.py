@@ -0,0 +1,174 @@
+"""
+💾 Session Checkpoint for SimpleMMO Bot
+
+Small local snapshot of the warm-start state that is otherwise lost on
+stop/start or a process restart: cooldown timestamps, pending quests and
+the timing tuner samples (the tuned timings are derived from them again and
+pushed to combat/gathering).
+Statistics are not part of it, so a reset or new session starts counting
+from zero. Saved periodically and when the bot loop ends, restored when the
+runner initializes, so a restart resumes at full speed.
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+try:
+    from ..config.paths import CHECKPOINT_FILE
+    from .tuner import ACTION_ATTACK, ACTION_GATHER, get_timing_tuner
+except ImportError:
+    from config.paths import CHECKPOINT_FILE
+    from core.tuner import ACTION_ATTACK, ACTION_GATHER, get_timing_tuner
+
+CHECKPOINT_VERSION = 1
+CHECKPOINT_INTERVAL = 30.0  # seconds between periodic saves
+MAX_CHECKPOINT_AGE = 6 * 3600.0  # older checkpoints are ignored
+
+# BotRunner attribute -> numeric attributes kept across restarts
+SYSTEM_FIELDS: dict[str, tuple[str, ...]] = {
+    "combat": ("last_combat_time",),
+    "gathering": ("last_gather_time",),
+    "quest_automation": ("pending_quests",),
+}
+
+# BotRunner attribute -> measured action whose tuned timings are re-applied on restore
+TUNED_SYSTEMS: dict[str, str] = {
+    "combat": ACTION_ATTACK,
+    "gathering": ACTION_GATHER,
+}
+
+
+class SessionCheckpoint:
+    """Periodic save and warm-start restore of the bot session state"""
+
+    def __init__(
+        self,
+        path: Path | None = CHECKPOINT_FILE,
+        interval: float = CHECKPOINT_INTERVAL,
+        max_age: float = MAX_CHECKPOINT_AGE,
+    ):
+        """Initialize Session Checkpoint
+
+        Args:
+            path: Checkpoint file (None disables saving/restoring)
+            interval: Seconds between periodic saves
+            max_age: Checkpoints older than this are not restored
+        """
+        self.path = path
+        self.interval = interval
+        self.max_age = max_age
+        self._last_save = time.monotonic()
+        self.stats = {"saves": 0, "restored": 0}
+
+    def capture(self, runner: Any) -> dict[str, Any]:
+        """Warm-start snapshot of the runner's systems"""
+        systems: dict[str, dict[str, float]] = {}
+        for name, fields in SYSTEM_FIELDS.items():
+            system = getattr(runner, name, None)
+            if system is None:
+                continue
+            values = {field: getattr(system, field, None) for field in fields}
+            systems[name] = {
+                field: value
+                for field, value in values.items()
+                if isinstance(value, int | float) and not isinstance(value, bool)
+            }
+
+        return {
+            "version": CHECKPOINT_VERSION,
+            "saved_at": time.time(),
+            "systems": systems,
+            "tuner": get_timing_tuner().dump_samples(),
+        }
+
+    async def apply(self, runner: Any, data: dict[str, Any]) -> None:
+        """Write a snapshot back into the runner's systems (statistics stay untouched)"""
+        for name, values in data.get("systems", {}).items():
+            system = getattr(runner, name, None)
+            if system is None:
+                continue
+            for field in SYSTEM_FIELDS.get(name, ()):
+                if field in values and hasattr(system, field):
+                    setattr(system, field, values[field])
+
+        tuner = get_timing_tuner()
+        tuner.load_samples(data.get("tuner", {}))
+
+        # Samples alone only take effect after the next click - retune the systems now
+        for name, action in TUNED_SYSTEMS.items():
+            system = getattr(runner, name, None)
+            if system is None or not hasattr(system, "set_timing_config"):
+                continue
+            config = getattr(system, "config", None) or {}
+            await tuner.apply(system, action, config.get("timing_floors"))
+
+    def load(self) -> dict[str, Any] | None:
+        """Read the checkpoint (missing, corrupt, outdated or stale files are ignored)"""
+        if not self.path or not self.path.exists():
+            return None
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.debug(f"Could not load checkpoint: {e}")
+            return None
+
+        if data.get("version") != CHECKPOINT_VERSION:
+            return None
+        if time.time() - float(data.get("saved_at", 0)) > self.max_age:
+            logger.debug("💾 Checkpoint too old - starting fresh")
+            return None
+        return data
+
+    async def restore(self, runner: Any) -> bool:
+        """Warm-start the runner from the last checkpoint
+
+        Returns:
+            True if a checkpoint was applied
+        """
+        data = self.load()
+        if data is None:
+            return False
+
+        try:
+            await self.apply(runner, data)
+        except Exception as e:
+            logger.debug(f"Could not restore checkpoint: {e}")
+            return False
+
+        self.stats["restored"] += 1
+        age = time.time() - float(data["saved_at"])
+        logger.info(f"💾 Session restored from checkpoint ({age:.0f}s old)")
+        return True
+
+    def save(self, runner: Any) -> bool:
+        """Persist a snapshot to disk (atomic replace)"""
+        self._last_save = time.monotonic()
+        if not self.path:
+            return False
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(self.capture(runner), indent=1), encoding="utf-8")
+            tmp_path.replace(self.path)
+        except Exception as e:
+            logger.debug(f"Could not save checkpoint: {e}")
+            return False
+
+        self.stats["saves"] += 1
+        return True
+
+    def maybe_save(self, runner: Any) -> bool:
+        """Save if the periodic interval elapsed"""
+        if time.monotonic() - self._last_save >= self.interval:
+            return self.save(runner)
+        return False
+
+    def get_stats(self) -> dict[str, int]:
+        """Save/restore counters"""
+        return {f"checkpoint_{key}": value for key, value in self.stats.items()}
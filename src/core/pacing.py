@@ -0,0 +1,103 @@
+"""
+⏱️ Loop Pacing for SimpleMMO Bot
+
+Adaptive delay between bot cycles. Right after an action (or a pushed page
+change) the next cycle runs immediately; while nothing happens the delay
+backs off exponentially up to a ceiling. Loop CPU time and page round trips
+are accumulated so the saving is visible in the bot statistics.
+"""
+
+import time
+
+
+class LoopPacer:
+    """Exponential idle backoff with instant wake"""
+
+    def __init__(
+        self,
+        base_delay: float = 0.1,
+        max_delay: float = 1.0,
+        backoff: float = 2.0,
+        idle_cycles_before_backoff: int = 3,
+    ):
+        """Initialize Loop Pacer
+
+        Args:
+            base_delay: Delay of the first idle cycles
+            max_delay: Ceiling of the idle backoff
+            backoff: Multiplier applied on every further idle cycle
+            idle_cycles_before_backoff: Idle cycles at base_delay before backing off
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.idle_cycles_before_backoff = idle_cycles_before_backoff
+
+        self.delay = 0.0
+        self.idle_streak = 0
+        self._started_at: float | None = None
+        self.stats = {
+            "cycles": 0,
+            "active_cycles": 0,
+            "idle_cycles": 0,
+            "wakeups": 0,
+            "cpu_seconds": 0.0,
+            "rpcs": 0,
+        }
+
+    def record_cycle(self, acted: bool, cpu_seconds: float = 0.0, rpcs: int = 0) -> None:
+        """Account one cycle and compute the delay before the next one"""
+        if self._started_at is None:
+            self._started_at = time.monotonic()
+
+        self.stats["cycles"] += 1
+        self.stats["cpu_seconds"] += cpu_seconds
+        self.stats["rpcs"] += rpcs
+
+        if acted:
+            self.stats["active_cycles"] += 1
+            self.idle_streak = 0
+            self.delay = 0.0
+            return
+
+        self.stats["idle_cycles"] += 1
+        self.idle_streak += 1
+        if self.idle_streak <= self.idle_cycles_before_backoff or self.delay <= 0:
+            self.delay = self.base_delay
+        else:
+            self.delay = self.delay * self.backoff
+        self.delay = min(self.delay, self.max_delay)
+
+    def wake(self) -> None:
+        """A page change was signalled - run the next cycle without delay"""
+        self.stats["wakeups"] += 1
+        self.idle_streak = 0
+        self.delay = 0.0
+
+    def next_delay(self, until: float | None = None) -> float:
+        """Delay before the next cycle
+
+        Args:
+            until: Optional seconds until something is known to become due (caps the delay)
+        """
+        delay = self.delay
+        if until is not None:
+            delay = min(delay, max(0.0, until))
+        return delay
+
+    def get_stats(self) -> dict[str, float]:
+        """Pacing counters, loop CPU time and round trips per minute"""
+        elapsed = time.monotonic() - self._started_at if self._started_at else 0.0
+        cycles = self.stats["cycles"]
+        return {
+            "pacing_delay": round(self.delay, 3),
+            "pacing_idle_streak": self.idle_streak,
+            "pacing_wakeups": self.stats["wakeups"],
+            "loop_cycles": cycles,
+            "loop_idle_cycles": self.stats["idle_cycles"],
+            "loop_cpu_seconds": round(self.stats["cpu_seconds"], 3),
+            "loop_cpu_ms_per_cycle": (
+                round(self.stats["cpu_seconds"] * 1000 / cycles, 3) if cycles else 0.0
+            ),
+            "rpcs_per_minute": round(self.stats["rpcs"] * 60 / elapsed, 1) if elapsed > 0 else 0.0,
+        }
@@ -0,0 +1,144 @@
+"""
+🧭 Route State Machine for SimpleMMO Bot
+
+Finite-state machine keyed on the page route (travel, combat, gather,
+healer, quests, i-am-not-a-bot). Each route only dispatches the systems
+that can act there, so combat pages skip gathering/step checks and the
+captcha page only runs the captcha handler. Transitions are driven by
+main frame navigation events; the time spent in a route before leaving it
+is accumulated per (from, to) pair. A page where nothing acted for a grace
+period is left for travel (never the captcha page).
+"""
+
+import time
+from collections.abc import Callable
+
+try:
+    from ..automation.page_state import (
+        ROUTE_CAPTCHA,
+        ROUTE_COMBAT,
+        ROUTE_GATHER,
+        ROUTE_HEALER,
+        ROUTE_OTHER,
+        ROUTE_QUESTS,
+        ROUTE_TRAVEL,
+        route_from_url,
+    )
+except ImportError:
+    from automation.page_state import (
+        ROUTE_CAPTCHA,
+        ROUTE_COMBAT,
+        ROUTE_GATHER,
+        ROUTE_HEALER,
+        ROUTE_OTHER,
+        ROUTE_QUESTS,
+        ROUTE_TRAVEL,
+        route_from_url,
+    )
+
+# Scheduled actions that may act on each route (None = every action)
+ROUTE_ACTIONS: dict[str, frozenset[str] | None] = {
+    ROUTE_TRAVEL: frozenset({"captcha", "gathering", "combat", "healing", "step", "quest"}),
+    ROUTE_COMBAT: frozenset({"captcha", "combat", "healing"}),
+    ROUTE_GATHER: frozenset({"captcha", "gathering"}),
+    ROUTE_HEALER: frozenset({"captcha", "healing"}),
+    ROUTE_QUESTS: frozenset({"captcha", "quest"}),
+    ROUTE_CAPTCHA: frozenset({"captcha"}),
+    ROUTE_OTHER: None,  # unknown page - the navigation check takes over
+}
+
+# Routes the bot never leaves on its own (the captcha must be solved first)
+STAY_ROUTES = frozenset({ROUTE_CAPTCHA})
+
+ROUTE_LEAVE_AFTER = 15.0  # seconds without any action before a route page is left
+
+
+class RouteMachine:
+    """Current page route, the actions it allows and per-transition timing"""
+
+    def __init__(
+        self, clock: Callable[[], float] = time.monotonic, leave_after: float = ROUTE_LEAVE_AFTER
+    ):
+        """Initialize Route Machine
+
+        Args:
+            clock: Time source of the transition timings
+            leave_after: Seconds a route page may stay idle before it is left
+        """
+        self.clock = clock
+        self.leave_after = leave_after
+        self.route = ROUTE_OTHER
+        self.entered_at = clock()
+        self.idle_since: float | None = None
+        self.transitions: dict[tuple[str, str], dict[str, float]] = {}
+
+    @property
+    def actions(self) -> frozenset[str] | None:
+        """Actions dispatched on the current route (None = all)"""
+        return ROUTE_ACTIONS.get(self.route)
+
+    @property
+    def is_restricted(self) -> bool:
+        """True on a route that only runs a subset of the actions (not travel/unknown)"""
+        return self.route not in (ROUTE_TRAVEL, ROUTE_OTHER)
+
+    def on_navigated(self, url: str) -> bool:
+        """Navigation event listener - move to the route of url"""
+        return self.transition(route_from_url(url))
+
+    def transition(self, route: str) -> bool:
+        """Enter route (no-op if already there)
+
+        Returns:
+            True if the route changed
+        """
+        if route == self.route:
+            return False
+
+        now = self.clock()
+        timing = self.transitions.setdefault((self.route, route), {"count": 0, "seconds": 0.0})
+        timing["count"] += 1
+        timing["seconds"] += now - self.entered_at
+
+        self.route = route
+        self.entered_at = now
+        self.idle_since = None
+        return True
+
+    def should_leave(self, acted: bool) -> bool:
+        """Account one cycle on the current route
+
+        Args:
+            acted: True if a system acted this cycle
+
+        Returns:
+            True once a route page (not travel/unknown/captcha) stayed idle for leave_after
+        """
+        if acted or not self.is_restricted or self.route in STAY_ROUTES:
+            self.idle_since = None
+            return False
+
+        now = self.clock()
+        if self.idle_since is None:
+            self.idle_since = now
+        if now - self.idle_since < self.leave_after:
+            return False
+
+        self.idle_since = None  # next attempt only after another grace period
+        return True
+
+    def reset(self) -> None:
+        """Forget the current route and timings"""
+        self.route = ROUTE_OTHER
+        self.entered_at = self.clock()
+        self.idle_since = None
+        self.transitions.clear()
+
+    def get_stats(self) -> dict[str, float]:
+        """Transition counts and mean time in the source route, per route pair"""
+        stats: dict[str, float] = {}
+        for (source, target), timing in self.transitions.items():
+            key = f"route_{source}_to_{target}"
+            stats[f"{key}_count"] = timing["count"]
+            stats[f"{key}_avg_ms"] = round(timing["seconds"] * 1000 / timing["count"], 1)
+        return stats
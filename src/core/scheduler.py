@@ -0,0 +1,224 @@
+"""
+🗓️ Action Scheduler for SimpleMMO Bot
+
+Cooldown-aware replacement for the fixed captcha → gathering → combat →
+healing → step → quests chain. Each system registers a priority, a cheap
+readiness predicate (no page queries) and the time it may act next. Actions
+are kept in a timer heap, so a cycle only evaluates systems that can act.
+Every action runs under its own time budget (a deadline scope); systems that
+check the deadline yield when it passes, and overruns are counted per system.
+A cycle can be limited to the actions relevant on the current page route.
+"""
+
+import heapq
+import itertools
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from loguru import logger
+
+try:
+    from ..utils.deadlines import deadline_scope
+except ImportError:
+    from utils.deadlines import deadline_scope
+
+
+@dataclass
+class ScheduledAction:
+    """A system action registered with the scheduler"""
+
+    name: str
+    handler: Callable[[Any], Awaitable[bool]]  # receives the PageState, True if it acted
+    priority: int = 100  # lower runs first
+    is_ready: Callable[[], bool] | None = None  # cheap predicate, e.g. the auto_* flag
+    next_eligible: Callable[[], float] | None = None  # clock time the system may act again
+    stop_on_success: bool = True  # False: later actions still run after this one acted
+    budget: float | None = None  # seconds per run; None = only the cycle deadline
+    interrupted: Callable[[], str | None] | None = None  # why the last run was cut short
+    held_until: float = 0.0  # clock time set by defer() - the action is not due before it
+    due_at: float = 0.0
+    entry: int = -1  # sequence number of the live heap entry
+    stats: dict[str, int] = field(
+        default_factory=lambda: {
+            "evaluated": 0,
+            "skipped": 0,
+            "acted": 0,
+            "overruns": 0,
+            "overrun_ms": 0,
+            "interrupted": 0,
+        }
+    )
+
+
+class ActionScheduler:
+    """Timer-heap scheduler that only evaluates systems able to act"""
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        """Initialize Action Scheduler
+
+        Args:
+            clock: Time source of the next_eligible callbacks (systems use time.time)
+        """
+        self.clock = clock
+        self.actions: dict[str, ScheduledAction] = {}
+        self._heap: list[tuple[float, int, int, str]] = []
+        self._sequence = itertools.count()
+
+    def register(
+        self,
+        name: str,
+        handler: Callable[[Any], Awaitable[bool]],
+        *,
+        priority: int = 100,
+        is_ready: Callable[[], bool] | None = None,
+        next_eligible: Callable[[], float] | None = None,
+        stop_on_success: bool = True,
+        budget: float | None = None,
+        interrupted: Callable[[], str | None] | None = None,
+    ) -> None:
+        """Register (or replace) a system action"""
+        self.actions[name] = ScheduledAction(
+            name=name,
+            handler=handler,
+            priority=priority,
+            is_ready=is_ready,
+            next_eligible=next_eligible,
+            stop_on_success=stop_on_success,
+            budget=budget,
+            interrupted=interrupted,
+        )
+        self._schedule(self.actions[name])
+
+    def _schedule(self, action: ScheduledAction) -> None:
+        """Push an action with its next eligible time (older heap entries become stale)"""
+        due_at = 0.0
+        if action.next_eligible is not None:
+            try:
+                due_at = float(action.next_eligible())
+            except Exception as e:
+                logger.debug(f"Could not get next eligible time of {action.name}: {e}")
+        due_at = max(due_at, action.held_until)
+        action.due_at = due_at
+        action.entry = next(self._sequence)
+        heapq.heappush(self._heap, (due_at, action.priority, action.entry, action.name))
+
+    def refresh(self) -> None:
+        """Re-read every next eligible time (e.g. after the systems were reset)"""
+        self._heap = []
+        for action in self.actions.values():
+            self._schedule(action)
+
+    def defer(self, name: str, until: float) -> None:
+        """Hold an action back until a clock time (e.g. a cooldown reported by the game)
+
+        Other actions keep running meanwhile, and the idle wait ends when it comes due.
+        """
+        action = self.actions.get(name)
+        if action is None:
+            return
+        action.held_until = until
+        self._schedule(action)
+
+    def _pop_due(self, now: float) -> list[ScheduledAction]:
+        """Pop every action whose time has come, in priority order"""
+        due: dict[str, ScheduledAction] = {}
+        while self._heap and self._heap[0][0] <= now:
+            _, _, entry, name = heapq.heappop(self._heap)
+            action = self.actions.get(name)
+            if action is None or action.entry != entry:
+                continue  # stale entry
+            due[name] = action
+        return sorted(due.values(), key=lambda action: action.priority)
+
+    def next_wakeup(self) -> float | None:
+        """Earliest clock time at which a currently waiting action becomes due"""
+        for due_at, _, entry, name in sorted(self._heap):
+            action = self.actions.get(name)
+            if action is not None and action.entry == entry:
+                return due_at
+        return None
+
+    async def run_once(
+        self, state: Any = None, only: Iterable[str] | None = None
+    ) -> dict[str, bool]:
+        """Evaluate the actions that can act now, highest priority first
+
+        Args:
+            state: PageState handed to every handler
+            only: Names of the actions allowed this cycle (e.g. by the page route);
+                due actions outside it stay due for a later cycle
+
+        Returns:
+            Result of every evaluated action (name -> acted)
+        """
+        now = self.clock()
+        due = self._pop_due(now)
+        if only is not None:
+            allowed = set(only)
+            for action in due:
+                if action.name not in allowed:
+                    self._schedule(action)
+            due = [action for action in due if action.name in allowed]
+
+        due_names = {action.name for action in due}
+        for action in self.actions.values():
+            if action.name not in due_names:
+                action.stats["skipped"] += 1
+
+        results: dict[str, bool] = {}
+        pending = list(due)
+        while pending:
+            action = pending.pop(0)
+            try:
+                if action.is_ready is not None and not action.is_ready():
+                    action.stats["skipped"] += 1
+                    continue
+
+                action.stats["evaluated"] += 1
+                started = time.monotonic()
+                try:
+                    with deadline_scope(action.budget):
+                        acted = bool(await action.handler(state))
+                finally:
+                    self._account_budget(action, time.monotonic() - started)
+                results[action.name] = acted
+                if acted:
+                    action.stats["acted"] += 1
+                    if action.stop_on_success:
+                        break
+                elif action.interrupted is not None and action.interrupted():
+                    # Captcha/death cut the action short - the rest of the cycle is stale
+                    action.stats["interrupted"] += 1
+                    break
+            except Exception as e:
+                logger.error(f"❌ Error in scheduled action {action.name}: {e}")
+                results[action.name] = False
+            finally:
+                self._schedule(action)
+
+        # Actions not reached this cycle stay due for the next one
+        for action in pending:
+            self._schedule(action)
+
+        return results
+
+    def _account_budget(self, action: ScheduledAction, elapsed: float) -> None:
+        """Count a run that took longer than its budget"""
+        if action.budget is None or elapsed <= action.budget:
+            return
+
+        action.stats["overruns"] += 1
+        action.stats["overrun_ms"] += int((elapsed - action.budget) * 1000)
+        logger.warning(
+            f"⏱️ {action.name} overran its {action.budget:.0f}s budget ({elapsed:.1f}s)"
+        )
+
+    def get_stats(self) -> dict[str, int]:
+        """Per-system evaluate/skip/act/overrun counters"""
+        stats: dict[str, int] = {}
+        for action in self.actions.values():
+            for key, value in action.stats.items():
+                stats[f"scheduler_{action.name}_{key}"] = value
+        return stats
@@ -0,0 +1,210 @@
+"""
+🎛️ Timing Tuner for SimpleMMO Bot
+
+Online tuning of the combat/gathering timings that used to be hand-picked
+constants. Systems report how long each click took until the next state
+change (attack button ready again, #crafting_button re-enabled); the tuner
+derives polling intervals and timeouts from the observed percentiles and
+applies them through the systems' set_timing_config, within configured
+floors and ceilings.
+"""
+
+import math
+from collections import deque
+from typing import Any
+
+from loguru import logger
+
+# Measured actions
+ACTION_ATTACK = "combat.attack"
+ACTION_GATHER = "gathering.gather"
+
+# Action -> (settings prefix, inter-action delay attribute)
+_ACTION_SETTINGS = {
+    ACTION_ATTACK: ("combat", "attack_delay"),
+    ACTION_GATHER: ("gathering", "gather_delay"),
+}
+
+# Default (floor, ceiling) of every tuned setting, keyed "<prefix>.<attribute>"
+DEFAULT_LIMITS: dict[str, tuple[float, float]] = {
+    "combat.button_check_interval": (0.01, 0.25),
+    "combat.max_wait_time": (1.0, 10.0),
+    "combat.attack_delay": (0.05, 0.5),  # never decays to back-to-back clicks
+    "gathering.button_check_interval": (0.02, 0.5),
+    "gathering.max_wait_time": (1.5, 15.0),
+    "gathering.gather_delay": (0.1, 1.0),
+}
+
+DEFAULT_WINDOW = 50  # samples kept per action
+DEFAULT_MIN_SAMPLES = 8  # samples needed before anything is retuned
+POLLS_PER_ACTION = 4  # poll ~4 times within the fastest typical completion (p10)
+TIMEOUT_MARGIN = 1.5  # timeout = p99 * margin
+DELAY_DECREASE = 0.9  # inter-action delay shrinks while actions complete normally
+DELAY_INCREASE = 2.0  # ... and backs off after a timeout
+CHANGE_THRESHOLD = 0.1  # relative change needed before a setting is re-applied
+
+
+def _clamp(value: float, limits: tuple[float, float]) -> float:
+    """Clamp a value into (floor, ceiling)"""
+    floor, ceiling = limits
+    return min(max(value, floor), ceiling)
+
+
+class TimingTuner:
+    """Derives polling intervals, timeouts and delays from observed click-to-change times"""
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[float, float]] | None = None,
+        window: int = DEFAULT_WINDOW,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+    ):
+        """Initialize Timing Tuner"""
+        self.limits = dict(DEFAULT_LIMITS)
+        self.limits.update(limits or {})
+        self.window = window
+        self.min_samples = min_samples
+        self.samples: dict[str, deque[float]] = {}
+        self.stats: dict[str, dict[str, int]] = {}
+        self._failed_since_apply: dict[str, bool] = {}
+
+    def record(self, action: str, seconds: float, ok: bool = True) -> None:
+        """Record the time from a click until the next state change
+
+        Args:
+            action: ACTION_ATTACK / ACTION_GATHER
+            seconds: Click-to-change duration
+            ok: False if the wait timed out (the sample is the timeout, not a completion)
+        """
+        stats = self.stats.setdefault(action, {"samples": 0, "timeouts": 0, "applied": 0})
+        if not ok:
+            stats["timeouts"] += 1
+            self._failed_since_apply[action] = True
+            return
+
+        stats["samples"] += 1
+        self.samples.setdefault(action, deque(maxlen=self.window)).append(max(0.0, seconds))
+
+    def percentile(self, action: str, q: float) -> float | None:
+        """Nearest-rank percentile (q in 0..100) of the recorded durations"""
+        samples = self.samples.get(action)
+        if not samples or len(samples) < self.min_samples:
+            return None
+
+        ordered = sorted(samples)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def suggest(
+        self,
+        action: str,
+        current: dict[str, float],
+        limits: dict[str, tuple[float, float]] | None = None,
+    ) -> dict[str, float]:
+        """Settings derived from the observations (empty until enough samples)
+
+        Args:
+            action: ACTION_ATTACK / ACTION_GATHER
+            current: Current values of the tuned attributes
+            limits: (floor, ceiling) per setting (defaults to the tuner's limits)
+        """
+        limits = limits or self.limits
+        prefix, delay_key = _ACTION_SETTINGS[action]
+        suggestion: dict[str, float] = {}
+
+        fast = self.percentile(action, 10)
+        slow = self.percentile(action, 99)
+        if fast is not None and slow is not None:
+            suggestion["button_check_interval"] = _clamp(
+                fast / POLLS_PER_ACTION, limits[f"{prefix}.button_check_interval"]
+            )
+            suggestion["max_wait_time"] = _clamp(
+                slow * TIMEOUT_MARGIN, limits[f"{prefix}.max_wait_time"]
+            )
+
+        delay = current.get(delay_key)
+        delay_limits = limits[f"{prefix}.{delay_key}"]
+        if delay is not None:
+            if self._failed_since_apply.get(action):
+                # Timeouts: give the game more room again
+                suggestion[delay_key] = _clamp(
+                    max(delay * DELAY_INCREASE, delay_limits[0] or 0.05), delay_limits
+                )
+            elif fast is not None:
+                suggestion[delay_key] = _clamp(delay * DELAY_DECREASE, delay_limits)
+
+        return suggestion
+
+    async def apply(
+        self, system: Any, action: str, floors: dict[str, float] | None = None
+    ) -> dict[str, float]:
+        """Retune a system through its set_timing_config
+
+        Args:
+            system: CombatSystem / GatheringSystem
+            action: ACTION_ATTACK / ACTION_GATHER
+            floors: Configured floors overriding the defaults ("<prefix>.<attribute>": value),
+                for this call only - the shared limits stay untouched
+
+        Returns:
+            The settings that were changed
+        """
+        limits = dict(self.limits)
+        for key, floor in (floors or {}).items():
+            if key in limits:
+                limits[key] = (floor, max(floor, limits[key][1]))
+
+        prefix, delay_key = _ACTION_SETTINGS[action]
+        keys = ("button_check_interval", "max_wait_time", delay_key)
+        current = {key: getattr(system, key) for key in keys if hasattr(system, key)}
+
+        changed = {}
+        for key, value in self.suggest(action, current, limits).items():
+            old = current.get(key)
+            if old is None or abs(value - old) > CHANGE_THRESHOLD * max(old, 1e-3):
+                changed[key] = round(value, 3)
+
+        self._failed_since_apply[action] = False
+        if changed:
+            logger.debug(f"🎛️ Retuning {prefix}: {changed}")
+            await system.set_timing_config(**changed)
+            self.stats.setdefault(action, {"samples": 0, "timeouts": 0, "applied": 0})
+            self.stats[action]["applied"] += 1
+        return changed
+
+    def dump_samples(self) -> dict[str, list[float]]:
+        """Recorded durations per action (for the session checkpoint)"""
+        return {action: list(samples) for action, samples in self.samples.items()}
+
+    def load_samples(self, samples: dict[str, list[float]]) -> None:
+        """Restore recorded durations so tuning resumes without relearning"""
+        for action, values in samples.items():
+            if action in _ACTION_SETTINGS:
+                restored = deque(maxlen=self.window)
+                restored.extend(max(0.0, float(value)) for value in values)
+                self.samples[action] = restored
+
+    def get_stats(self) -> dict[str, float]:
+        """Observed percentiles and counters per action"""
+        stats: dict[str, float] = {}
+        for action, counters in self.stats.items():
+            name = action.replace(".", "_")
+            for key, value in counters.items():
+                stats[f"tuner_{name}_{key}"] = value
+            for q in (50, 95):
+                value = self.percentile(action, q)
+                if value is not None:
+                    stats[f"tuner_{name}_p{q}_ms"] = round(value * 1000, 1)
+        return stats
+
+
+# Global timing tuner shared by the systems
+_timing_tuner: TimingTuner | None = None
+
+
+def get_timing_tuner() -> TimingTuner:
+    """Get the global timing tuner"""
+    global _timing_tuner
+    if _timing_tuner is None:
+        _timing_tuner = TimingTuner()
+    return _timing_tuner
@@ -0,0 +1,170 @@
+"""
+🐕 Cycle Watchdog for SimpleMMO Bot
+
+Background task next to BotRunner that notices cycles running far past the
+expected time (an indefinite step wait, a slow networkidle, a 600s captcha
+window). A stalled cycle is reported once with the await chain it is stuck
+in, the current URL and the last PageState, and can optionally be cancelled
+so the loop starts the next cycle.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+from loguru import logger
+
+DEFAULT_STALL_AFTER = 120.0  # seconds before a cycle counts as stalled
+DEFAULT_CHECK_INTERVAL = 1.0  # seconds between watchdog checks
+MAX_STACK_DEPTH = 30  # frames kept in a stall report
+
+
+def await_chain(awaitable: Any) -> list[str]:
+    """Frames ("file:line in function") of the coroutine chain a task is suspended in
+
+    Task.get_stack() only returns the outermost coroutine of a suspended task,
+    so the chain is followed through cr_await / gi_yieldfrom instead.
+    """
+    frames: list[str] = []
+    current = awaitable
+    while current is not None and len(frames) < MAX_STACK_DEPTH:
+        frame = getattr(current, "cr_frame", None) or getattr(current, "gi_frame", None)
+        if frame is None:
+            if isinstance(current, asyncio.Future):
+                frames.append(f"<awaiting {type(current).__name__}>")
+            break
+        code = frame.f_code
+        frames.append(f"{code.co_filename}:{frame.f_lineno} in {code.co_name}")
+        current = getattr(current, "cr_await", None) or getattr(current, "gi_yieldfrom", None)
+    return frames
+
+
+class CycleWatchdog:
+    """Reports (and optionally cancels) bot cycles that exceed their deadline"""
+
+    def __init__(
+        self,
+        stall_after: float = DEFAULT_STALL_AFTER,
+        *,
+        cancel_stalled: bool = False,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+        context: Callable[[], dict[str, Any]] | None = None,
+        interrupt: Callable[[], None] | None = None,
+    ):
+        """Initialize Cycle Watchdog
+
+        Args:
+            stall_after: Seconds a cycle may run before it is reported
+            cancel_stalled: Cancel a stalled cycle so the next one starts
+            check_interval: Seconds between checks
+            context: Cheap (no page round trip) provider of the URL / last PageState
+            interrupt: Cancels the cycle in flight; defaults to cancelling its task
+        """
+        self.stall_after = stall_after
+        self.cancel_stalled = cancel_stalled
+        self.check_interval = check_interval
+        self.context = context
+        self.interrupt = interrupt
+
+        self._task: asyncio.Task | None = None
+        self._cycle_task: asyncio.Future | None = None
+        self._cycle_started_at: float | None = None
+        self._reported = False
+        self.last_report: dict[str, Any] | None = None
+        self.stats = {"stalls": 0, "cancelled": 0, "longest_cycle_ms": 0}
+
+    def start(self) -> None:
+        """Start the watchdog on the running loop (no-op if it already runs there)"""
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            return
+        self._task = loop.create_task(self._run())
+
+    def stop(self) -> None:
+        """Stop the watchdog task"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def cycle_started(self, cycle_task: asyncio.Future) -> None:
+        """A cycle began running in cycle_task"""
+        self._cycle_task = cycle_task
+        self._cycle_started_at = time.monotonic()
+        self._reported = False
+
+    def cycle_finished(self) -> None:
+        """The current cycle ended"""
+        if self._cycle_started_at is not None:
+            elapsed_ms = round((time.monotonic() - self._cycle_started_at) * 1000)
+            self.stats["longest_cycle_ms"] = max(self.stats["longest_cycle_ms"], elapsed_ms)
+        self._cycle_task = None
+        self._cycle_started_at = None
+
+    async def _run(self) -> None:
+        """Watchdog loop"""
+        while True:
+            await asyncio.sleep(self.check_interval)
+            try:
+                self.check()
+            except Exception as e:
+                logger.debug(f"Watchdog check failed: {e}")
+
+    def check(self) -> dict[str, Any] | None:
+        """Report the running cycle once if it exceeded stall_after
+
+        Returns:
+            The stall report when a new stall was detected
+        """
+        if self._cycle_started_at is None or self._reported:
+            return None
+
+        elapsed = time.monotonic() - self._cycle_started_at
+        if elapsed < self.stall_after:
+            return None
+
+        self._reported = True
+        self.stats["stalls"] += 1
+        report = self._build_report(elapsed)
+        self.last_report = report
+        self._log_report(report)
+
+        if self.cancel_stalled:
+            self.stats["cancelled"] += 1
+            if self.interrupt is not None:
+                self.interrupt()
+            elif self._cycle_task is not None and not self._cycle_task.done():
+                self._cycle_task.cancel()
+        return report
+
+    def _build_report(self, elapsed: float) -> dict[str, Any]:
+        """Collect what the stalled cycle is doing"""
+        task = self._cycle_task
+        coro = task.get_coro() if isinstance(task, asyncio.Task) else None
+        report: dict[str, Any] = {
+            "elapsed": round(elapsed, 1),
+            "stack": await_chain(coro) if coro is not None else [],
+            "url": None,
+            "page_state": None,
+        }
+        if self.context is not None:
+            try:
+                report.update(self.context())
+            except Exception as e:
+                logger.debug(f"Could not collect watchdog context: {e}")
+        return report
+
+    def _log_report(self, report: dict[str, Any]) -> None:
+        """Log a stall report (once per stalled cycle)"""
+        stack = "\n".join(f"    {frame}" for frame in report["stack"]) or "    <unavailable>"
+        logger.warning(
+            f"🐕 Cycle stalled for {report['elapsed']:.0f}s (limit {self.stall_after:.0f}s)\n"
+            f"  URL: {report['url']}\n"
+            f"  Last page state: {report['page_state']}\n"
+            f"  Stuck in:\n{stack}"
+            + ("\n  Cancelling the cycle" if self.cancel_stalled else "")
+        )
+
+    def get_stats(self) -> dict[str, int]:
+        """Stall counters"""
+        return {f"watchdog_{key}": value for key, value in self.stats.items()}
@@ -11,29 +11,87 @@ Handles the "I'm a person! Promise!" captcha flow:
 """
 
 import asyncio
+import time
 from typing import Any
 
 from loguru import logger
 
 # Robust import mechanism for both direct execution and module import
 try:
+    from ..automation.page_state import PageState
+    from ..automation.selectors import get_selector_registry, to_playwright_selector
     from ..automation.web_engine import get_web_engine
+    from ..utils.deadlines import Deadline, time_left
 except ImportError:
     try:
+        from automation.page_state import PageState
+        from automation.selectors import get_selector_registry, to_playwright_selector
         from automation.web_engine import get_web_engine
+        from utils.deadlines import Deadline, time_left
     except ImportError:
+        from src.automation.page_state import PageState
+        from src.automation.selectors import get_selector_registry, to_playwright_selector
         from src.automation.web_engine import get_web_engine
+        from src.utils.deadlines import Deadline, time_left
 
 
 class CaptchaSystem:
     """Modern captcha detection and handling system with tab management"""
 
+    # Fallback selector lists (ordered at runtime by the selector registry)
+    SELECTORS = {
+        "captcha.travel": [
+            'a[href="/i-am-not-a-bot?new_page=true"]',
+            'a:has-text("I\'m a person! Promise!")',
+            '//a[contains(text(), "I\'m a person!")]',
+            '//a[contains(@href, "i-am-not-a-bot")]',
+        ],
+        "captcha.travel_click": [
+            'a[href="/i-am-not-a-bot?new_page=true"]',
+            'a:has-text("I\'m a person! Promise!")',
+            '//a[contains(@href, "i-am-not-a-bot")]',
+        ],
+        "captcha.combat": [
+            'a[href="/i-am-not-a-bot"][class*="btn-primary"]',
+            'a:has-text("Press here to verify")',
+            '//a[contains(text(), "Press here to verify")]',
+            '//a[@href="/i-am-not-a-bot" and contains(@class, "btn-primary")]',
+            'a[href="/i-am-not-a-bot"][target="_blank"]',
+        ],
+        "captcha.combat_click": [
+            'a[href="/i-am-not-a-bot"][target="_blank"]',
+            'a:has-text("Press here to verify")',
+            '//a[contains(text(), "Press here to verify")]',
+            '//a[@href="/i-am-not-a-bot" and contains(@class, "btn-primary")]',
+        ],
+        # Close button (X) of the combat captcha popup
+        "captcha.popup_close": [
+            'path[stroke-linecap="round"][stroke-linejoin="round"][d="M6 18L18 6M6 6l12 12"]',
+            'button[aria-label="Close"]',
+            "button.swal2-close",
+            ".swal2-close",
+            '//button[contains(@aria-label, "Close")]',
+            '//path[@d="M6 18L18 6M6 6l12 12"]/..',  # Parent of the path element
+            '//path[@d="M6 18L18 6M6 6l12 12"]/../..',  # Grandparent of the path element
+        ],
+        "captcha.success": [
+            'h2.swal2-title:has-text("Success!")',
+            '#swal2-title:has-text("Success!")',
+            '.swal2-title:has-text("Success!")',
+            '//h2[contains(text(), "Success!")]',
+        ],
+    }
+
     def __init__(self, config: dict[str, Any]):
         """Initialize Captcha System"""
         self.config = config
         self.is_initialized = False
+        self.web_engine = None  # injected by initialize_systems (event-tracked page)
         self.captcha_tab = None
         self.main_tab = None
+        self.selectors = get_selector_registry()
+        for group, selectors in self.SELECTORS.items():
+            self.selectors.register(group, selectors)
         logger.info("🔒 Captcha System created")
 
     async def initialize(self) -> bool:
@@ -46,8 +104,15 @@ class CaptchaSystem:
             logger.error(f"❌ Failed to initialize Captcha System: {e}")
             return False
 
-    async def is_captcha_present(self) -> bool:
-        """Check if any type of captcha is present on current page"""
+    async def is_captcha_present(self, state: PageState | None = None) -> bool:
+        """Check if any type of captcha is present on current page
+
+        Args:
+            state: Optional page snapshot - when given, no extra page queries are made
+        """
+        if state is not None:
+            return state.captcha_present
+
         try:
             # Check for regular travel page captcha
             if await self._is_travel_captcha_present():
@@ -66,33 +131,16 @@ class CaptchaSystem:
     async def _is_travel_captcha_present(self) -> bool:
         """Check if travel page captcha button is present"""
         try:
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
                 return False
 
             # Look for the regular travel captcha button
-            captcha_selectors = [
-                'a[href="/i-am-not-a-bot?new_page=true"]',
-                'a:has-text("I\'m a person! Promise!")',
-                '//a[contains(text(), "I\'m a person!")]',
-                '//a[contains(@href, "i-am-not-a-bot")]',
-            ]
-
-            for selector in captcha_selectors:
-                try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
-
-                    if element and await element.is_visible():
-                        logger.debug(f"🔒 Travel captcha button found using selector: {selector}")
-                        return True
-                except Exception as e:
-                    logger.debug(f"Travel captcha selector {selector} failed: {e}")
-                    continue
+            if await self.selectors.detect(page, "captcha.travel"):
+                logger.debug("🔒 Travel captcha button found")
+                return True
 
             return False
 
@@ -103,34 +151,16 @@ class CaptchaSystem:
     async def _is_combat_captcha_present(self) -> bool:
         """Check if combat page captcha popup is present"""
         try:
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
                 return False
 
             # Look for the combat captcha popup button
-            combat_captcha_selectors = [
-                'a[href="/i-am-not-a-bot"][class*="btn-primary"]',
-                'a:has-text("Press here to verify")',
-                '//a[contains(text(), "Press here to verify")]',
-                '//a[@href="/i-am-not-a-bot" and contains(@class, "btn-primary")]',
-                'a[href="/i-am-not-a-bot"][target="_blank"]',
-            ]
-
-            for selector in combat_captcha_selectors:
-                try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
-
-                    if element and await element.is_visible():
-                        logger.debug(f"🔒 Combat captcha popup found using selector: {selector}")
-                        return True
-                except Exception as e:
-                    logger.debug(f"Combat captcha selector {selector} failed: {e}")
-                    continue
+            if await self.selectors.detect(page, "captcha.combat"):
+                logger.debug("🔒 Combat captcha popup found")
+                return True
 
             return False
 
@@ -169,7 +199,7 @@ class CaptchaSystem:
         logger.warning("🔒 COMBAT CAPTCHA DETECTED! Immediately forcing return to travel page...")
 
         try:
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
@@ -209,7 +239,7 @@ class CaptchaSystem:
             logger.error(f"❌ Error handling combat captcha: {e}")
             # Fallback: try to click browser back button
             try:
-                engine = await get_web_engine()
+                engine = self.web_engine or await get_web_engine()
                 page = await engine.get_page()
                 if page:
                     await page.go_back()
@@ -245,7 +275,7 @@ class CaptchaSystem:
     async def _click_combat_captcha_button(self) -> bool:
         """Click the 'Press here to verify' button in combat popup"""
         try:
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
@@ -255,29 +285,12 @@ class CaptchaSystem:
             self.main_tab = page
 
             # Find and click the combat captcha button
-            combat_captcha_selectors = [
-                'a[href="/i-am-not-a-bot"][target="_blank"]',
-                'a:has-text("Press here to verify")',
-                '//a[contains(text(), "Press here to verify")]',
-                '//a[@href="/i-am-not-a-bot" and contains(@class, "btn-primary")]',
-            ]
-
-            for selector in combat_captcha_selectors:
-                try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
-
-                    if element and await element.is_visible():
-                        logger.info("🔒 Clicking combat captcha button...")
-                        await element.click()
-                        await asyncio.sleep(2)  # Wait for new tab to open
-                        return True
-
-                except Exception as e:
-                    logger.debug(f"Failed to click combat captcha with selector {selector}: {e}")
-                    continue
+            element = await self.selectors.find_first(page, "captcha.combat_click")
+            if element:
+                logger.info("🔒 Clicking combat captcha button...")
+                await element.click()
+                await asyncio.sleep(2)  # Wait for new tab to open
+                return True
 
             return False
 
@@ -288,39 +301,32 @@ class CaptchaSystem:
     async def _close_combat_captcha_popup(self) -> bool:
         """Close the combat captcha popup by clicking the X button"""
         try:
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
                 return False
 
             # Look for the close button (X) in the popup
-            close_button_selectors = [
-                'path[stroke-linecap="round"][stroke-linejoin="round"][d="M6 18L18 6M6 6l12 12"]',
-                'button[aria-label="Close"]',
-                "button.swal2-close",
-                ".swal2-close",
-                '//button[contains(@aria-label, "Close")]',
-                '//path[@d="M6 18L18 6M6 6l12 12"]/..',  # Parent of the path element
-                '//path[@d="M6 18L18 6M6 6l12 12"]/../..',  # Grandparent of the path element
-            ]
-
-            for selector in close_button_selectors:
+            for selector in self.selectors.ordered("captcha.popup_close"):
+                start = time.perf_counter()
                 try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
+                    element = engine.locator(to_playwright_selector(selector), page).first
+                    visible = await element.is_visible()
 
-                    if element and await element.is_visible():
+                    if visible:
                         logger.info("🔒 Closing combat captcha popup...")
                         await element.click()
                         await asyncio.sleep(1)  # Wait for popup to close
 
-                        # Verify popup is closed
-                        if not await self._is_combat_captcha_present():
-                            logger.success("✅ Combat captcha popup closed successfully")
-                            return True
+                    # Only a click that actually closed the popup counts as a hit
+                    closed = visible and not await self._is_combat_captcha_present()
+                    self.selectors.record(
+                        "captcha.popup_close", selector, closed, time.perf_counter() - start
+                    )
+                    if closed:
+                        logger.success("✅ Combat captcha popup closed successfully")
+                        return True
 
                 except Exception as e:
                     logger.debug(f"Failed to close popup with selector {selector}: {e}")
@@ -344,13 +350,18 @@ class CaptchaSystem:
             logger.error(f"Error closing combat captcha popup: {e}")
             return False
 
-    async def wait_for_resolution(self, timeout: int = 600) -> bool:
+    async def wait_for_resolution(
+        self, timeout: int = 600, deadline: Deadline | None = None
+    ) -> bool:
         """
         Handle complete captcha resolution flow:
         1. Click the captcha button to open new tab
         2. Wait for user to solve captcha manually
         3. Detect success popup
         4. Close captcha tab and return to main tab
+
+        The manual wait is capped by `deadline` (defaults to the cycle deadline)
+        and ends immediately when the bot task is cancelled.
         """
         try:
             logger.warning("🔒 CAPTCHA DETECTED! Starting resolution process...")
@@ -367,7 +378,7 @@ class CaptchaSystem:
 
             # Step 3: Wait for user to solve captcha (monitor success popup)
             logger.info("🧑‍💻 Please solve the captcha manually in the new tab...")
-            if not await self._wait_for_captcha_success(timeout):
+            if not await self._wait_for_captcha_success(time_left(timeout, deadline)):
                 logger.error("❌ Captcha resolution timeout or failed")
                 return False
 
@@ -384,7 +395,7 @@ class CaptchaSystem:
     async def _click_captcha_button(self) -> bool:
         """Click the captcha button to open new tab (simulate middle click)"""
         try:
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
@@ -394,20 +405,16 @@ class CaptchaSystem:
             self.main_tab = page
 
             # Find and click the captcha button
-            captcha_selectors = [
-                'a[href="/i-am-not-a-bot?new_page=true"]',
-                'a:has-text("I\'m a person! Promise!")',
-                '//a[contains(@href, "i-am-not-a-bot")]',
-            ]
-
-            for selector in captcha_selectors:
+            for selector in self.selectors.ordered("captcha.travel_click"):
+                start = time.perf_counter()
                 try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
+                    element = engine.locator(to_playwright_selector(selector), page).first
+                    visible = await element.is_visible()
+                    self.selectors.record(
+                        "captcha.travel_click", selector, visible, time.perf_counter() - start
+                    )
 
-                    if element and await element.is_visible():
+                    if visible:
                         logger.info("🔒 Clicking captcha button with middle click (new tab)...")
 
                         # Method 1: Try to get href and open in new tab directly
@@ -465,7 +472,7 @@ class CaptchaSystem:
     async def _wait_for_captcha_tab(self) -> bool:
         """Wait for captcha tab to open and store reference"""
         try:
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             context = await engine.get_context()
 
             if not context:
@@ -510,26 +517,9 @@ class CaptchaSystem:
             while (asyncio.get_event_loop().time() - start_time) < timeout:
                 try:
                     # Check for success popup
-                    success_selectors = [
-                        'h2.swal2-title:has-text("Success!")',
-                        '#swal2-title:has-text("Success!")',
-                        '.swal2-title:has-text("Success!")',
-                        '//h2[contains(text(), "Success!")]',
-                    ]
-
-                    for selector in success_selectors:
-                        try:
-                            if selector.startswith("//"):
-                                element = await self.captcha_tab.query_selector(f"xpath={selector}")
-                            else:
-                                element = await self.captcha_tab.query_selector(selector)
-
-                            if element and await element.is_visible():
-                                logger.success("🎉 Success popup detected! Captcha solved!")
-                                return True
-
-                        except Exception:
-                            continue
+                    if await self.selectors.detect(self.captcha_tab, "captcha.success"):
+                        logger.success("🎉 Success popup detected! Captcha solved!")
+                        return True
 
                     # Log progress every 30 seconds
                     elapsed = asyncio.get_event_loop().time() - start_time
@@ -595,7 +585,7 @@ class CaptchaSystem:
             logger.info("👣 Forcing step after captcha to refresh page...")
 
             # Get web engine
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
@@ -641,7 +631,7 @@ class CaptchaSystem:
 
         # Close any open captcha tabs if they exist
         try:
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             if engine and engine.browser:
                 contexts = engine.browser.contexts
                 for context in contexts:
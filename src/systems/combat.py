@@ -26,33 +26,127 @@ from loguru import logger
 
 # Robust import mechanism for both direct execution and module import
 try:
-    from ..automation.web_engine import get_web_engine
+    from ..automation.combat_state import (
+        COMBAT_EVENT_ATTACK,
+        COMBAT_EVENT_DEFEATED,
+        COMBAT_EVENT_LEAVE,
+        COMBAT_EVENT_TIMEOUT,
+        CombatEvent,
+        CombatState,
+    )
+    from ..automation.page_state import PageState
+    from ..automation.selectors import get_selector_registry, to_playwright_selector
+    from ..automation.web_engine import (
+        get_web_engine,
+        prefetch_page_state,
+        read_combat_state,
+        wait_for_combat_event,
+    )
+    from ..core.tuner import ACTION_ATTACK, get_timing_tuner
 except ImportError:
     try:
-        from automation.web_engine import get_web_engine
+        from automation.combat_state import (
+            COMBAT_EVENT_ATTACK,
+            COMBAT_EVENT_DEFEATED,
+            COMBAT_EVENT_LEAVE,
+            COMBAT_EVENT_TIMEOUT,
+            CombatEvent,
+            CombatState,
+        )
+        from automation.page_state import PageState
+        from automation.selectors import get_selector_registry, to_playwright_selector
+        from automation.web_engine import (
+            get_web_engine,
+            prefetch_page_state,
+            read_combat_state,
+            wait_for_combat_event,
+        )
+        from core.tuner import ACTION_ATTACK, get_timing_tuner
     except ImportError:
-        from src.automation.web_engine import get_web_engine
+        from src.automation.combat_state import (
+            COMBAT_EVENT_ATTACK,
+            COMBAT_EVENT_DEFEATED,
+            COMBAT_EVENT_LEAVE,
+            COMBAT_EVENT_TIMEOUT,
+            CombatEvent,
+            CombatState,
+        )
+        from src.automation.page_state import PageState
+        from src.automation.selectors import get_selector_registry, to_playwright_selector
+        from src.automation.web_engine import (
+            get_web_engine,
+            prefetch_page_state,
+            read_combat_state,
+            wait_for_combat_event,
+        )
+        from src.core.tuner import ACTION_ATTACK, get_timing_tuner
 
 
 class CombatSystem:
     """Modern combat system for SimpleMMO Bot"""
 
+    # Fallback selector lists (ordered at runtime by the selector registry)
+    SELECTORS = {
+        "combat.attack_travel": [
+            'a:has-text("Attack")',
+            'button:has-text("Attack")',
+            '//a[contains(text(), "Attack")]',
+            '//button[contains(text(), "Attack")]',
+            '//a[@href and contains(@href, "/npcs/attack/")]',
+            '//a[@class and contains(@class, "action-button") and contains(text(), "Attack")]',
+        ],
+        "combat.attack_page": [
+            '//button[contains(text(), "Attack") and @x-on:click]',
+            'button:has-text("Attack")',
+            '//button[@x-on:click="attack(false);"]',
+            '//button[contains(@class, "bg-indigo-600") and contains(text(), "Attack")]',
+        ],
+        "combat.enemy_hp": [
+            # Most specific selector for enemy HP element
+            'div[x-text="format_number(enemy.current_hp)"]',
+            '//div[@x-text="format_number(enemy.current_hp)"]',
+        ],
+        "combat.leave_check": [
+            'button:has-text("Leave")',
+            '//button[contains(text(), "Leave")]',
+            '//button[@x-on:click="is_loading = true"]',
+            '//button[contains(@class, "bg-gray-100") and contains(text(), "Leave")]',
+        ],
+        "combat.leave_click": [
+            'button:has-text("Leave")',
+            '//button[contains(text(), "Leave")]',
+            '//button[@x-on:click="is_loading = true"]',
+            '//button[contains(@class, "bg-gray-100") and contains(text(), "Leave")]',
+            'button[class*="bg-gray"]',  # Additional selector for styling
+        ],
+    }
+
     def __init__(self, config: dict[str, Any]):
         """Initialize Combat System"""
         self.config = config
         self.is_initialized = False
+        self.web_engine = None  # injected by initialize_systems (event-tracked page)
         self.auto_combat = config.get("auto_combat", True)
         self.last_combat_time = 0
         self.combat_cooldown = 2.0  # seconds
         self.attack_delay = 0.1  # ultra-fast delay for faster combat
         self.max_wait_time = 3.0  # reduced timeout for faster response
         self.button_check_interval = 0.02  # ultra-fast button detection
+        self.auto_tune = config.get("auto_tune_timing", True)  # retune from observed timings
+        self.tuner = get_timing_tuner()
         self.combat_stats = {
             "battles_won": 0,
             "battles_lost": 0,
             "total_attacks": 0,
             "enemies_defeated": 0,
+            "interrupted": 0,
         }
+        self.last_interrupt: str | None = None  # captcha/death that stopped the last fight
+        self.last_combat_state: CombatState | None = None
+        self.last_combat_event: CombatEvent | None = None
+        self.selectors = get_selector_registry()
+        for group, selectors in self.SELECTORS.items():
+            self.selectors.register(group, selectors)
         logger.info("⚔️ Combat System created")
 
     async def initialize(self) -> bool:
@@ -79,35 +173,27 @@ class CombatSystem:
             self.button_check_interval = kwargs["button_check_interval"]
             logger.info(f"⚙️ Button check interval set to {self.button_check_interval}s")
 
-    async def is_combat_available(self) -> bool:
-        """Check if combat is available on current page (travel page) - ULTRA FAST"""
+    async def is_combat_available(self, state: PageState | None = None) -> bool:
+        """Check if combat is available on current page (travel page) - ULTRA FAST
+
+        Args:
+            state: Optional page snapshot - when given, no extra page queries are made
+        """
         try:
             if not self.auto_combat:
                 return False
 
-            engine = await get_web_engine()
+            if state is not None:
+                return state.attack_available
+
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
                 return False
 
-            # Ultra-fast single check with the most common selector
-            try:
-                element = await page.query_selector('a:has-text("Attack")')
-                if element and await element.is_visible() and await element.is_enabled():
-                    return True
-            except Exception:
-                pass
-
-            # Quick fallback check
-            try:
-                element = await page.query_selector('button:has-text("Attack")')
-                if element and await element.is_visible() and await element.is_enabled():
-                    return True
-            except Exception:
-                pass
-
-            return False
+            # Ultra-fast check: the whole attack selector list in one round trip
+            return await self.selectors.detect(page, "combat.attack_travel", enabled=True)
 
         except Exception as e:
             logger.debug(f"Error checking combat availability: {e}")
@@ -178,7 +264,25 @@ class CombatSystem:
         return attack_count, enemy_hp
 
     async def start_combat(self) -> bool:
-        """Start complete combat process"""
+        """Start complete combat process (stopped at once by a captcha or death)"""
+        self.last_interrupt = None
+        try:
+            engine = self.web_engine or await get_web_engine()
+            acted, reason = await engine.run_interruptible(self._run_combat())
+        except Exception as e:
+            logger.error(f"❌ Error during combat: {e}")
+            return False
+
+        if reason is not None:
+            # Back to the runner's priority order (captcha / healing come first)
+            self.last_interrupt = reason
+            self.combat_stats["interrupted"] += 1
+            self.last_combat_time = time.time()
+            return False
+        return acted
+
+    async def _run_combat(self) -> bool:
+        """Combat process body: enter, attack until the enemy is defeated, leave"""
         try:
             # Check cooldown
             current_time = time.time()
@@ -188,7 +292,7 @@ class CombatSystem:
 
             logger.info("⚔️ Starting combat process...")
 
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
@@ -234,16 +338,26 @@ class CombatSystem:
                 # Perform the attack
                 if await self._perform_single_attack(page):
                     self.combat_stats["total_attacks"] += 1
-                    logger.debug(
-                        f"✅ Attack {attack_count} completed"
-                    )  # Ultra-fast HP check immediately after attack
-                    await asyncio.sleep(0.1)  # Minimal wait for game update
-
-                    # Get updated HP
-                    new_enemy_hp = await self._get_enemy_hp_percentage(page)
+                    logger.debug(f"✅ Attack {attack_count} completed")
+
+                    # The waiter already resolved with an HP snapshot - no extra reads needed
+                    event = self.last_combat_event
+                    self.last_combat_event = None
+                    state = event.state if event else None
+                    if state and state.enemy_hp_percentage is not None:
+                        new_enemy_hp = 0.0 if state.enemy_defeated else state.enemy_hp_percentage
+                    else:
+                        await asyncio.sleep(0.1)  # Minimal wait for game update
+                        new_enemy_hp = await self._get_enemy_hp_percentage(page)
                     logger.info(f"🎯 Enemy HP: {new_enemy_hp}%")
 
-                    if new_enemy_hp <= 0:
+                    # Same snapshot also carries the player HP
+                    if self.last_combat_state and self.last_combat_state.player_dead:
+                        logger.warning("💀 Player HP reached 0 - stopping combat")
+                        self.combat_stats["battles_lost"] += 1
+                        break
+
+                    if new_enemy_hp <= 0 or (event and event.event == COMBAT_EVENT_DEFEATED):
                         logger.success("💀 Enemy defeated (HP = 0)!")
                         self.combat_stats["enemies_defeated"] += 1
                         enemy_hp = 0.0  # Update enemy_hp to reflect defeat
@@ -252,6 +366,17 @@ class CombatSystem:
 
                     enemy_hp = new_enemy_hp
 
+                    if event and event.event == COMBAT_EVENT_LEAVE:
+                        logger.info("🚪 Combat ended - Leave button found")
+                        break
+
+                    if event and event.event == COMBAT_EVENT_ATTACK:
+                        # Attack button is ready again - cadence limited only by the game
+                        await asyncio.sleep(self.attack_delay)
+                        continue
+
+                    # Waiter timed out or was unavailable - fall back to polling
+
                     # Wait a bit more for attack button to become available again
                     # (it might be temporarily disabled due to cooldown)
                     attack_button_available = False
@@ -319,6 +444,10 @@ class CombatSystem:
             self.last_combat_time = current_time
             logger.success(f"✅ Combat completed: {attack_count} attacks, enemy HP: {enemy_hp}%")
 
+            # Poll/timeout settings follow the observed attack cycle times
+            if self.auto_tune:
+                await self.tuner.apply(self, ACTION_ATTACK, self.config.get("timing_floors"))
+
             return attack_count > 0
 
         except Exception as e:
@@ -328,29 +457,10 @@ class CombatSystem:
     async def _find_attack_button_on_travel(self, page) -> Any | None:
         """Find attack button on travel page."""
         try:
-            attack_selectors = [
-                'a:has-text("Attack")',
-                'button:has-text("Attack")',
-                '//a[contains(text(), "Attack")]',
-                '//button[contains(text(), "Attack")]',
-                '//a[@href and contains(@href, "/npcs/attack/")]',
-                '//a[@class and contains(@class, "action-button") and contains(text(), "Attack")]',
-            ]
-
-            for selector in attack_selectors:
-                try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
-
-                    if element and await element.is_visible() and await element.is_enabled():
-                        logger.debug("Found attack button on travel page")
-                        return element
-                except Exception:
-                    continue
-
-            return None
+            element = await self.selectors.find_first(page, "combat.attack_travel", enabled=True)
+            if element:
+                logger.debug("Found attack button on travel page")
+            return element
         except Exception:
             return None
 
@@ -362,81 +472,82 @@ class CombatSystem:
         except Exception:
             return False
 
+    async def get_combat_state(self, page) -> CombatState | None:
+        """Read enemy and player HP from the combat page's Alpine data (one round trip)."""
+        combat_state = await read_combat_state(page)
+        if combat_state:
+            self.last_combat_state = combat_state
+        return combat_state
+
     async def _get_enemy_hp_percentage(self, page) -> float:
         """Get enemy HP percentage from combat page."""
         try:
-            # Primary method: Look for enemy HP bar with specific selector
+            # Primary method: HP straight from the Alpine component state (no parsing)
+            combat_state = await self.get_combat_state(page)
+            if combat_state and combat_state.enemy_hp_percentage is not None:
+                percentage = 0.0 if combat_state.enemy_defeated else combat_state.enemy_hp_percentage
+                if combat_state.enemy_current_hp is not None:
+                    current_hp = int(combat_state.enemy_current_hp)
+                    logger.debug(f"💀 Enemy HP: {current_hp} ({percentage:.1f}%)")
+                else:
+                    logger.debug(f"💀 Enemy HP: {percentage:.1f}%")
+                return percentage
+
+            # Fallback: Look for enemy HP bar with specific selector
             # Based on: <div x-text="format_number(enemy.current_hp)" :style="'width:'+enemy.hp_percentage+'%'" ...>276</div>
-            enemy_hp_selectors = [
-                # Most specific selector for enemy HP element
-                'div[x-text="format_number(enemy.current_hp)"]',
-                '//div[@x-text="format_number(enemy.current_hp)"]',
+            try:
+                element = await self.selectors.find_first(page, "combat.enemy_hp", visible=False)
+                if element:
+                    # Get HP percentage from style width
+                    style = await element.get_attribute("style")
+                    if style and "width:" in style:
+                        # Extract width percentage from style like "width:13%"
+                        width_part = style.split("width:")[1].split(";")[0].strip()
+                        if "%" in width_part:
+                            percentage = float(width_part.replace("%", ""))
+
+                            # Get the actual HP number from text content for validation
+                            text_content = await element.text_content()
+                            if text_content and text_content.strip():
+                                current_hp = text_content.strip()
+                                logger.debug(f"💀 Enemy HP: {current_hp} ({percentage:.1f}%)")
+                            else:
+                                logger.debug(f"💀 Enemy HP: {percentage:.1f}%")
+
+                            return percentage
+            except Exception as e:
+                logger.debug(f"Enemy HP lookup failed: {e}")
+
+            # Fallback method: Look for red HP bars (but be careful about player vs enemy)
+            fallback_selectors = [
+                '//div[contains(@class, "from-red-500") and contains(@class, "to-red-400") and contains(@style, "width")]',
+                'div[class*="from-red-500"][class*="to-red-400"][style*="width"]',
             ]
 
-            for selector in enemy_hp_selectors:
+            engine = self.web_engine or await get_web_engine()
+            for selector in fallback_selectors:
                 try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
+                    bars = engine.locator(to_playwright_selector(selector), page)
 
-                    if element:
-                        # Get HP percentage from style width
+                    # If there are multiple red bars, try to find the enemy one
+                    for i, element in enumerate(await bars.all()):
                         style = await element.get_attribute("style")
                         if style and "width:" in style:
-                            # Extract width percentage from style like "width:13%"
                             width_part = style.split("width:")[1].split(";")[0].strip()
                             if "%" in width_part:
                                 percentage = float(width_part.replace("%", ""))
 
-                                # Get the actual HP number from text content for validation
+                                # Try to identify if this is enemy HP by checking surrounding context
                                 text_content = await element.text_content()
-                                if text_content and text_content.strip():
-                                    current_hp = text_content.strip()
-                                    logger.debug(f"💀 Enemy HP: {current_hp} ({percentage:.1f}%)")
-                                else:
-                                    logger.debug(f"💀 Enemy HP: {percentage:.1f}%")
-
-                                return percentage
-                except Exception as e:
-                    logger.debug(f"Enemy HP selector {selector} failed: {e}")
-                    continue
-
-            # Fallback method: Look for red HP bars (but be careful about player vs enemy)
-            fallback_selectors = [
-                '//div[contains(@class, "from-red-500") and contains(@class, "to-red-400") and contains(@style, "width")]',
-                'div[class*="from-red-500"][class*="to-red-400"][style*="width"]',
-            ]
+                                if text_content:
+                                    logger.debug(
+                                        f"💀 HP bar #{i} content: {text_content} ({percentage:.1f}%)"
+                                    )
 
-            for selector in fallback_selectors:
-                try:
-                    if selector.startswith("//"):
-                        elements = await page.query_selector_all(f"xpath={selector}")
-                    else:
-                        elements = await page.query_selector_all(selector)
-
-                    # If there are multiple red bars, try to find the enemy one
-                    for i, element in enumerate(elements):
-                        if element:
-                            style = await element.get_attribute("style")
-                            if style and "width:" in style:
-                                width_part = style.split("width:")[1].split(";")[0].strip()
-                                if "%" in width_part:
-                                    percentage = float(width_part.replace("%", ""))
-
-                                    # Try to identify if this is enemy HP by checking surrounding context
-                                    text_content = await element.text_content()
-                                    if text_content:
-                                        logger.debug(
-                                            f"💀 HP bar #{i} content: {text_content} ({percentage:.1f}%)"
-                                        )
-
-                                        # If this is a lower percentage, it's more likely the enemy
-                                        if percentage < 100:
-                                            logger.debug(
-                                                f"� Enemy HP (fallback): {percentage:.1f}%"
-                                            )
-                                            return percentage
+                                    # If this is a lower percentage, it's more likely the enemy
+                                    if percentage < 100:
+                                        logger.debug(f"� Enemy HP (fallback): {percentage:.1f}%")
+                                        return percentage
 
                 except Exception as e:
                     logger.debug(f"Fallback HP selector {selector} failed: {e}")
@@ -464,11 +575,21 @@ class CombatSystem:
                 return False
 
             # Click the button
+            clicked_at = time.monotonic()
             await attack_button.click()
             logger.debug("Clicked attack button")
 
-            # Ultra-fast wait for button to complete action
-            await self._wait_for_attack_completion(page)
+            # Wait in the page for the next combat condition (one round trip)
+            self.last_combat_event = await self.wait_for_combat_event(page)
+            if self.last_combat_event is not None:
+                self.tuner.record(
+                    ACTION_ATTACK,
+                    time.monotonic() - clicked_at,
+                    ok=self.last_combat_event.event != COMBAT_EVENT_TIMEOUT,
+                )
+            else:
+                # Waiter unavailable - fall back to polling the button
+                await self._wait_for_attack_completion(page)
 
             return True
 
@@ -476,63 +597,41 @@ class CombatSystem:
             logger.debug(f"Error in single attack: {e}")
             return False
 
+    async def wait_for_combat_event(self, page, armed: bool = True) -> CombatEvent | None:
+        """Wait until attack is ready again, the enemy is defeated or Leave appears.
+
+        Args:
+            page: Combat page
+            armed: True right after an attack click (the button must finish its cooldown)
+        """
+        event = await wait_for_combat_event(
+            page,
+            timeout=self.max_wait_time,
+            polling=self.button_check_interval,
+            armed=armed,
+        )
+        if event and event.state:
+            self.last_combat_state = event.state
+        return event
+
     async def _find_attack_button_on_page(self, page) -> Any | None:
         """Find the 'Attack' button on combat page."""
         try:
-            attack_selectors = [
-                '//button[contains(text(), "Attack") and @x-on:click]',
-                'button:has-text("Attack")',
-                '//button[@x-on:click="attack(false);"]',
-                '//button[contains(@class, "bg-indigo-600") and contains(text(), "Attack")]',
-            ]
-
-            for selector in attack_selectors:
-                try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
-
-                    if element and await element.is_visible() and await element.is_enabled():
-                        return element
-                except Exception:
-                    continue
-
-            return None
+            return await self.selectors.find_first(page, "combat.attack_page", enabled=True)
         except Exception:
             return None
 
     async def _is_attack_button_available(self, page) -> bool:
         """Check if attack button is still available (not replaced by Leave button)."""
         try:
-            attack_button = await self._find_attack_button_on_page(page)
-            return attack_button is not None
+            return await self.selectors.detect(page, "combat.attack_page", enabled=True)
         except Exception:
             return False
 
     async def _is_leave_button_available(self, page) -> bool:
         """Check if leave button is available (combat ended)."""
         try:
-            leave_selectors = [
-                'button:has-text("Leave")',
-                '//button[contains(text(), "Leave")]',
-                '//button[@x-on:click="is_loading = true"]',
-                '//button[contains(@class, "bg-gray-100") and contains(text(), "Leave")]',
-            ]
-
-            for selector in leave_selectors:
-                try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
-
-                    if element and await element.is_visible():
-                        return True
-                except Exception:
-                    continue
-
-            return False
+            return await self.selectors.detect(page, "combat.leave_check")
         except Exception:
             return False
 
@@ -586,32 +685,20 @@ class CombatSystem:
             # Increased attempts and reduced wait for ultra-fast detection
             max_attempts = 20  # Increased from 8 to 20 attempts
             for attempt in range(max_attempts):
-                leave_selectors = [
-                    'button:has-text("Leave")',
-                    '//button[contains(text(), "Leave")]',
-                    '//button[@x-on:click="is_loading = true"]',
-                    '//button[contains(@class, "bg-gray-100") and contains(text(), "Leave")]',
-                    'button[class*="bg-gray"]',  # Additional selector for styling
-                ]
-
-                for selector in leave_selectors:
-                    try:
-                        if selector.startswith("//"):
-                            element = await page.query_selector(f"xpath={selector}")
-                        else:
-                            element = await page.query_selector(selector)
-
-                        if element and await element.is_visible():
-                            logger.success(f"✅ Found leave button on attempt {attempt + 1}!")
-                            await element.click()
-                            logger.success("🚪 Clicked leave button successfully")
-                            await asyncio.sleep(1.0)  # Wait for potential navigation
-
-                            # ✅ CRITICAL FIX: Ensure we return to travel page
-                            await self._ensure_back_to_travel(page)
-                            return True
-                    except Exception:
-                        continue
+                try:
+                    element = await self.selectors.find_first(page, "combat.leave_click")
+                    if element:
+                        logger.success(f"✅ Found leave button on attempt {attempt + 1}!")
+                        await element.click()
+                        logger.success("🚪 Clicked leave button successfully")
+                        prefetch_page_state(1.0)  # Read the travel page state meanwhile
+                        await asyncio.sleep(1.0)  # Wait for potential navigation
+
+                        # ✅ CRITICAL FIX: Ensure we return to travel page
+                        await self._ensure_back_to_travel(page)
+                        return True
+                except Exception as e:
+                    logger.debug(f"Leave button click failed: {e}")
 
                 # If not found, wait less time and try again
                 if attempt < max_attempts - 1:
@@ -683,7 +770,7 @@ class CombatSystem:
     async def get_combat_info(self) -> dict[str, Any]:
         """Get combat information"""
         try:
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
@@ -716,7 +803,7 @@ class CombatSystem:
     async def get_enemy_hp(self) -> float:
         """Get current enemy HP percentage"""
         try:
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
@@ -737,6 +824,8 @@ class CombatSystem:
     async def reset_state(self):
         """Reset combat system state to initial values"""
         logger.info("🔄 Resetting combat system state...")
+        self.last_combat_state = None
+        self.last_interrupt = None
 
         # Reset combat statistics
         self.combat_stats = {
@@ -744,6 +833,7 @@ class CombatSystem:
             "battles_lost": 0,
             "total_attacks": 0,
             "enemies_defeated": 0,
+            "interrupted": 0,
         }
 
         # Reset timing
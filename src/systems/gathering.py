@@ -12,23 +12,107 @@ from typing import Any
 
 from loguru import logger
 
+BUTTON_LOOKUP_TIMEOUT_MS = 100  # how long a locator check waits for a missing button
+GATHER_ARM_TIME = 1.0  # seconds for the gather button to go disabled after a click
+
 # Robust import mechanism for both direct execution and module import
 try:
-    from ..automation.web_engine import get_web_engine
+    from ..automation.page_state import PageState
+    from ..automation.selectors import get_selector_registry
+    from ..automation.web_engine import (
+        BUTTON_CYCLE_DETACHED,
+        BUTTON_CYCLE_ENABLED,
+        BUTTON_CYCLE_TIMEOUT,
+        GATHER_PROGRESS_BINDING,
+        BulkGatherResult,
+        abort_bulk_gather,
+        get_web_engine,
+        prefetch_page_state,
+        run_bulk_gather,
+        wait_for_button_cycle,
+    )
+    from ..core.tuner import ACTION_GATHER, get_timing_tuner
 except ImportError:
     try:
-        from automation.web_engine import get_web_engine
+        from automation.page_state import PageState
+        from automation.selectors import get_selector_registry
+        from automation.web_engine import (
+            BUTTON_CYCLE_DETACHED,
+            BUTTON_CYCLE_ENABLED,
+            BUTTON_CYCLE_TIMEOUT,
+            GATHER_PROGRESS_BINDING,
+            BulkGatherResult,
+            abort_bulk_gather,
+            get_web_engine,
+            prefetch_page_state,
+            run_bulk_gather,
+            wait_for_button_cycle,
+        )
+        from core.tuner import ACTION_GATHER, get_timing_tuner
     except ImportError:
-        from src.automation.web_engine import get_web_engine
+        from src.automation.page_state import PageState
+        from src.automation.selectors import get_selector_registry
+        from src.automation.web_engine import (
+            BUTTON_CYCLE_DETACHED,
+            BUTTON_CYCLE_ENABLED,
+            BUTTON_CYCLE_TIMEOUT,
+            GATHER_PROGRESS_BINDING,
+            BulkGatherResult,
+            abort_bulk_gather,
+            get_web_engine,
+            prefetch_page_state,
+            run_bulk_gather,
+            wait_for_button_cycle,
+        )
+        from src.core.tuner import ACTION_GATHER, get_timing_tuner
 
 
 class GatheringSystem:
     """Modern gathering system for SimpleMMO Bot"""
 
+    # Fallback selector lists (ordered at runtime by the selector registry)
+    SELECTORS = {
+        # Ultra-fast checks for most common gathering types (no XPath for speed)
+        "gathering.quick": [
+            'button:has-text("Mine")',
+            'button:has-text("Chop")',
+            'button:has-text("Salvage")',
+            'button:has-text("Catch")',
+        ],
+        "gathering.type_button": [
+            'button:has-text("Chop")',
+            'button:has-text("Mine")',
+            'button:has-text("Salvage")',
+            'button:has-text("Catch")',
+            '//button[contains(text(), "Chop")]',
+            '//button[contains(text(), "Mine")]',
+            '//button[contains(text(), "Salvage")]',
+            '//button[contains(text(), "Catch")]',
+        ],
+        "gathering.available_amount": [
+            '//div[@class="text-gray-500 font-semibold mr-4 text-xs sm:text-sm" and @x-text="available_amount"]',
+            '//div[contains(@class, "text-gray-500") and contains(@x-text, "available_amount")]',
+            'div[x-text="available_amount"]',
+        ],
+        "gathering.gather_button": [
+            '//button[@id="crafting_button" and .//span[text()="Press here to gather"]]',
+            '//button[.//span[contains(text(),"Press here to gather")]]',
+            'button:has-text("Press here to gather")',
+            '#crafting_button',
+        ],
+        "gathering.close_button": [
+            '//button[.//span[text()="Press here to close"]]',
+            'button:has-text("Press here to close")',
+            '//button[@x-on:click="close()"]',
+            '//button[contains(@class, "bg-gray-200") and .//span[text()="Press here to close"]]',
+        ],
+    }
+
     def __init__(self, config: dict[str, Any]):
         """Initialize Gathering System"""
         self.config = config
         self.is_initialized = False
+        self.web_engine = None  # injected by initialize_systems (event-tracked page)
         self.auto_gather = config.get("auto_gather", True)
         self.gather_types = ["chop", "mine", "salvage", "catch"]
         self.last_gather_time = 0
@@ -36,6 +120,15 @@ class GatheringSystem:
         self.gather_delay = 0.5  # delay between gather clicks (optimized)
         self.max_wait_time = 5.0  # increased timeout for better detection
         self.button_check_interval = 0.05  # intervalo para verificar botão (optimized)
+        self.bulk_gather = config.get("bulk_gather", False)  # gather whole node in the page
+        self.gather_progress = {"done": 0, "total": 0}
+        self._abort_requested = False
+        self.last_interrupt: str | None = None  # captcha/death that stopped the last run
+        self.auto_tune = config.get("auto_tune_timing", True)  # retune from observed timings
+        self.tuner = get_timing_tuner()
+        self.selectors = get_selector_registry()
+        for group, selectors in self.SELECTORS.items():
+            self.selectors.register(group, selectors)
         logger.info("⛏️ Gathering System created")
 
     async def initialize(self) -> bool:
@@ -48,42 +141,51 @@ class GatheringSystem:
             logger.error(f"❌ Failed to initialize Gathering System: {e}")
             return False
 
-    async def is_gathering_available(self) -> bool:
-        """Check if gathering is available on current page (travel page) - ULTRA FAST"""
+    async def is_gathering_available(self, state: PageState | None = None) -> bool:
+        """Check if gathering is available on current page (travel page) - ULTRA FAST
+
+        Args:
+            state: Optional page snapshot - when given, no extra page queries are made
+        """
         try:
             if not self.auto_gather:
                 return False
 
-            engine = await get_web_engine()
+            if state is not None:
+                return state.gather_available
+
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
                 return False
 
-            # Ultra-fast checks for most common gathering types (no XPath for speed)
-            quick_selectors = [
-                'button:has-text("Mine")',
-                'button:has-text("Chop")',
-                'button:has-text("Salvage")',
-                'button:has-text("Catch")',
-            ]
-
-            for selector in quick_selectors:
-                try:
-                    element = await page.query_selector(selector)
-                    if element and await element.is_visible() and await element.is_enabled():
-                        return True
-                except Exception:
-                    continue
-
-            return False
+            return await self.selectors.detect(page, "gathering.quick", enabled=True)
 
         except Exception as e:
             logger.debug(f"Error checking gathering availability: {e}")
             return False
 
     async def start_gathering(self) -> bool:
-        """Start complete gathering process"""
+        """Start complete gathering process (stopped at once by a captcha or death)"""
+        self.last_interrupt = None
+        try:
+            engine = self.web_engine or await get_web_engine()
+            acted, reason = await engine.run_interruptible(self._run_gathering())
+        except Exception as e:
+            logger.error(f"❌ Error during gathering: {e}")
+            return False
+
+        if reason is not None:
+            # The in-page bulk run keeps clicking unless told to stop
+            await self.abort_gathering(engine.page)
+            self.last_interrupt = reason
+            self.last_gather_time = time.time()
+            return False
+        return acted
+
+    async def _run_gathering(self) -> bool:
+        """Gathering process body: enter the node, gather every item, close"""
         try:
             # Check cooldown
             current_time = time.time()
@@ -92,8 +194,9 @@ class GatheringSystem:
                 return False
 
             logger.info("⛏️ Starting gathering process...")
+            self._abort_requested = False
 
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
@@ -126,12 +229,39 @@ class GatheringSystem:
             if available_amount <= 0:
                 logger.warning("No materials available to gather")
                 await self._close_gathering_page(page)
-                return False            # Step 4: Perform gathering clicks
+                return False
+
+            # Step 4: Perform gathering clicks (button resolved once, reused for every item)
+            gather_button = await self._find_gather_button_on_page(page)
+            self.gather_progress = {"done": 0, "total": available_amount}
             success_count = 0
-            for i in range(available_amount):
+            first_item = 0
+
+            if self.bulk_gather and gather_button is not None:
+                result = await self._bulk_gather(page, gather_button, available_amount)
+                if result is not None:
+                    success_count = result.gathered
+                    first_item = available_amount
+                    if not result.completed and not result.aborted:
+                        # Button replaced or a cycle timed out - finish the node item by item
+                        remaining = await self._get_available_amount(page)
+                        first_item = max(0, available_amount - remaining)
+                        gather_button = None
+
+            for i in range(first_item, available_amount):
+                if self._abort_requested:
+                    logger.info("⏹️ Gathering aborted")
+                    break
+
                 logger.info(f"⛏️ Gathering {i + 1}/{available_amount}...")
 
-                if await self._perform_single_gather(page):
+                gathered = await self._perform_single_gather(page, gather_button)
+                if not gathered and gather_button is not None:
+                    # Button was re-rendered - resolve it again once
+                    gather_button = await self._find_gather_button_on_page(page)
+                    gathered = await self._perform_single_gather(page, gather_button)
+
+                if gathered:
                     success_count += 1
                     if i < available_amount - 1:  # Não fazer delay após o último
                         logger.debug(f"✅ Gather {i + 1} completed, waiting {self.gather_delay}s...")
@@ -147,41 +277,64 @@ class GatheringSystem:
             self.last_gather_time = current_time
             logger.success(f"✅ Gathering completed: {success_count}/{available_amount}")
 
+            # Poll/timeout settings follow the observed gather cycle times
+            if self.auto_tune:
+                await self.tuner.apply(self, ACTION_GATHER, self.config.get("timing_floors"))
+
             return success_count > 0
 
         except Exception as e:
             logger.error(f"❌ Error during gathering: {e}")
             return False
 
+    async def _bulk_gather(
+        self, page, gather_button: Any, amount: int
+    ) -> BulkGatherResult | None:
+        """Gather the whole node with one in-page run (progress streamed back)."""
+        engine = self.web_engine or await get_web_engine()
+        progress_ready = await engine.install_gather_progress(self._on_gather_progress)
+
+        logger.info(f"⛏️ Bulk gathering {amount} items in page...")
+        result = await run_bulk_gather(
+            gather_button,
+            count=amount,
+            delay=self.gather_delay,
+            timeout=self.max_wait_time,
+            polling=self.button_check_interval,
+            arm=GATHER_ARM_TIME,
+            binding=GATHER_PROGRESS_BINDING if progress_ready else None,
+        )
+        engine.gather_progress_callback = None
+
+        if result is None:
+            logger.debug("Bulk gather unavailable - gathering item by item")
+        else:
+            self.gather_progress = {"done": result.gathered, "total": amount}
+        return result
+
+    def _on_gather_progress(self, progress: dict[str, Any]) -> bool:
+        """Progress from the in-page runner - returning False stops it."""
+        self.gather_progress = {
+            "done": int(progress.get("done") or 0),
+            "total": int(progress.get("total") or 0),
+        }
+        logger.info(f"⛏️ Gathered {self.gather_progress['done']}/{self.gather_progress['total']}")
+        return not self._abort_requested
+
+    async def abort_gathering(self, page=None) -> None:
+        """Stop the current gathering run after the item in progress."""
+        self._abort_requested = True
+        if page is not None and self.bulk_gather:
+            await abort_bulk_gather(page)
+
     async def _find_gather_type_button(self, page) -> Any | None:
         """Find gathering type button on travel page (chop, mine, salvage, catch)."""
         try:
-            gather_selectors = [
-                'button:has-text("Chop")',
-                'button:has-text("Mine")',
-                'button:has-text("Salvage")',
-                'button:has-text("Catch")',
-                '//button[contains(text(), "Chop")]',
-                '//button[contains(text(), "Mine")]',
-                '//button[contains(text(), "Salvage")]',
-                '//button[contains(text(), "Catch")]',
-            ]
-
-            for selector in gather_selectors:
-                try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
-
-                    if element and await element.is_visible() and await element.is_enabled():
-                        button_text = await element.inner_text()
-                        logger.debug(f"Found gathering button: {button_text}")
-                        return element
-                except Exception:
-                    continue
-
-            return None
+            element = await self.selectors.find_first(page, "gathering.type_button", enabled=True)
+            if element:
+                button_text = await element.inner_text()
+                logger.debug(f"Found gathering button: {button_text}")
+            return element
         except Exception:
             return None
 
@@ -197,35 +350,27 @@ class GatheringSystem:
         """Get available amount from gathering page."""
         try:
             # Look for the available amount element
-            selectors = [
-                '//div[@class="text-gray-500 font-semibold mr-4 text-xs sm:text-sm" and @x-text="available_amount"]',
-                '//div[contains(@class, "text-gray-500") and contains(@x-text, "available_amount")]',
-                'div[x-text="available_amount"]',
-            ]
-
-            for selector in selectors:
-                try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
-
-                    if element:
-                        amount_text = await element.inner_text()
-                        amount = int(amount_text.strip())
-                        return amount
-                except Exception:
-                    continue
+            element = await self.selectors.find_first(
+                page, "gathering.available_amount", visible=False
+            )
+            if element:
+                amount_text = await element.inner_text()
+                return int(amount_text.strip())
 
             return 0
         except Exception:
             return 0
 
-    async def _perform_single_gather(self, page) -> bool:
-        """Perform a single gather click and wait for completion."""
+    async def _perform_single_gather(self, page, gather_button: Any | None = None) -> bool:
+        """Perform a single gather click and wait for completion.
+
+        Args:
+            page: Gathering page
+            gather_button: Button resolved earlier - looked up again only when not given
+        """
         try:
-            # Find gather button
-            gather_button = await self._find_gather_button_on_page(page)
+            if gather_button is None:
+                gather_button = await self._find_gather_button_on_page(page)
 
             if not gather_button:
                 logger.debug("Gather button not found")
@@ -235,8 +380,8 @@ class GatheringSystem:
             await gather_button.click()
             logger.debug("Clicked gather button")
 
-            # Wait for button to become disabled (loading state)
-            await self._wait_for_gather_completion(page)
+            # Wait for the disabled -> enabled edge of the same button
+            await self._wait_for_gather_completion(page, gather_button)
 
             return True
 
@@ -247,41 +392,57 @@ class GatheringSystem:
     async def _find_gather_button_on_page(self, page) -> Any | None:
         """Find the 'Press here to gather' button on gathering page."""
         try:
-            gather_selectors = [
-                '//button[@id="crafting_button" and .//span[text()="Press here to gather"]]',
-                '//button[.//span[contains(text(),"Press here to gather")]]',
-                'button:has-text("Press here to gather")',
-                '#crafting_button',
-            ]
-
-            for selector in gather_selectors:
-                try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
+            return await self.selectors.find_first(page, "gathering.gather_button", enabled=True)
+        except Exception:
+            return None
 
-                    if element and await element.is_visible() and await element.is_enabled():
-                        return element
-                except Exception:
-                    continue
+    async def _wait_for_gather_completion(self, page, gather_button: Any | None = None) -> bool:
+        """Wait for gather button to complete its action (one in-page wait per click).
+
+        Args:
+            page: Gathering page
+            gather_button: Locator of the clicked button (defaults to #crafting_button)
+        """
+        try:
+            if gather_button is None:
+                engine = self.web_engine or await get_web_engine()
+                gather_button = engine.locator("#crafting_button", page)
+
+            started = time.monotonic()
+            event = await wait_for_button_cycle(
+                gather_button,
+                timeout=self.max_wait_time,
+                polling=self.button_check_interval,
+                arm=GATHER_ARM_TIME,
+            )
+            if event in (BUTTON_CYCLE_ENABLED, BUTTON_CYCLE_TIMEOUT):
+                self.tuner.record(
+                    ACTION_GATHER, time.monotonic() - started, ok=event == BUTTON_CYCLE_ENABLED
+                )
+            if event is not None and event != BUTTON_CYCLE_DETACHED:
+                return True
+
+            # Waiter could not run or the button was replaced - poll #crafting_button
+            return await self._poll_gather_completion(page)
 
-            return None
         except Exception:
-            return None
+            return True
 
-    async def _wait_for_gather_completion(self, page) -> bool:
-        """Wait for gather button to complete its action (otimizado)."""
+    async def _poll_gather_completion(self, page) -> bool:
+        """Fallback: poll #crafting_button until it goes disabled and enabled again."""
         try:
             max_wait = self.max_wait_time
             start_time = time.time()
 
+            # Reusable locator (missing button -> short timeout instead of a leaked handle)
+            engine = self.web_engine or await get_web_engine()
+            gather_button = engine.locator("#crafting_button", page)
+
             # Primeira verificação rápida para ver se o botão ficou disabled
             initial_disabled = False
             for _ in range(10):  # Verifica por 1 segundo
                 try:
-                    gather_button = await page.query_selector('#crafting_button')
-                    if gather_button and await gather_button.is_disabled():
+                    if await gather_button.is_disabled(timeout=BUTTON_LOOKUP_TIMEOUT_MS):
                         initial_disabled = True
                         break
                     await asyncio.sleep(0.1)
@@ -296,9 +457,7 @@ class GatheringSystem:
             # Aguarda o botão voltar a ficar enabled
             while time.time() - start_time < max_wait:
                 try:
-                    gather_button = await page.query_selector('#crafting_button')
-
-                    if gather_button and not await gather_button.is_disabled():
+                    if not await gather_button.is_disabled(timeout=BUTTON_LOOKUP_TIMEOUT_MS):
                         # Botão voltou a ficar enabled
                         await asyncio.sleep(0.1)  # Pequena pausa para estabilidade
                         return True
@@ -319,28 +478,14 @@ class GatheringSystem:
             await asyncio.sleep(0.3)  # Reduzido para 0.3s
 
             # Look for close button
-            close_selectors = [
-                '//button[.//span[text()="Press here to close"]]',
-                'button:has-text("Press here to close")',
-                '//button[@x-on:click="close()"]',
-                '//button[contains(@class, "bg-gray-200") and .//span[text()="Press here to close"]]',
-            ]
-
-            for selector in close_selectors:
-                try:
-                    if selector.startswith("//"):
-                        element = await page.query_selector(f"xpath={selector}")
-                    else:
-                        element = await page.query_selector(selector)
-
-                    if element and await element.is_visible():
-                        await element.click()
-                        logger.debug("Clicked close button")
-                        # Aguarda 2 segundos para o carregamento
-                        await asyncio.sleep(2.0)
-                        return True
-                except Exception:
-                    continue
+            element = await self.selectors.find_first(page, "gathering.close_button")
+            if element:
+                await element.click()
+                logger.debug("Clicked close button")
+                # Aguarda 2 segundos para o carregamento (next page state read meanwhile)
+                prefetch_page_state(2.0)
+                await asyncio.sleep(2.0)
+                return True
 
             logger.debug("No close button found or already closed")
             return False
@@ -352,7 +497,7 @@ class GatheringSystem:
     async def get_gather_info(self) -> dict[str, Any]:
         """Get gathering information"""
         try:
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
@@ -384,7 +529,7 @@ class GatheringSystem:
     async def get_available_amount(self) -> int:
         """Get available amount of materials"""
         try:
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
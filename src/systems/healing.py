@@ -11,22 +11,42 @@ from loguru import logger
 
 # Robust import mechanism for both direct execution and module import
 try:
+    from ..automation.page_state import PageState
+    from ..automation.selectors import get_selector_registry
     from ..automation.web_engine import get_web_engine
 except ImportError:
     try:
+        from automation.page_state import PageState
+        from automation.selectors import get_selector_registry
         from automation.web_engine import get_web_engine
     except ImportError:
+        from src.automation.page_state import PageState
+        from src.automation.selectors import get_selector_registry
         from src.automation.web_engine import get_web_engine
 
 
 class HealingSystem:
     """Modern healing system for SimpleMMO Bot"""
 
+    # Fallback selector lists (ordered at runtime by the selector registry)
+    SELECTORS = {
+        # Death indicators
+        "healing.death": [
+            '//a[contains(text(), "How do I heal?")]',
+            '//div[contains(text(), "You have died")]',
+            '//button[contains(text(), "Heal Character")]',
+        ],
+    }
+
     def __init__(self, config: dict[str, Any]):
         """Initialize Healing System"""
         self.config = config
         self.is_initialized = False
+        self.web_engine = None  # injected by initialize_systems (event-tracked page)
         self.auto_heal = config.get("auto_heal", True)
+        self.selectors = get_selector_registry()
+        for group, selectors in self.SELECTORS.items():
+            self.selectors.register(group, selectors)
         logger.info("🩺 Healing System created")
 
     async def initialize(self) -> bool:
@@ -39,10 +59,21 @@ class HealingSystem:
             logger.error(f"❌ Failed to initialize Healing System: {e}")
             return False
 
-    async def check_health_status(self) -> dict[str, Any]:
-        """Check current health status"""
+    async def check_health_status(self, state: PageState | None = None) -> dict[str, Any]:
+        """Check current health status
+
+        Args:
+            state: Optional page snapshot - when given, no extra page queries are made
+        """
         try:
-            engine = await get_web_engine()
+            if state is not None:
+                return {
+                    "is_dead": state.is_dead,
+                    "hp_percentage": 0 if state.is_dead else 100,
+                    "needs_healing": state.is_dead,
+                }
+
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
@@ -65,18 +96,7 @@ class HealingSystem:
         """Check if character is dead"""
         try:
             # Look for death indicators
-            death_selectors = [
-                '//a[contains(text(), "How do I heal?")]',
-                '//div[contains(text(), "You have died")]',
-                '//button[contains(text(), "Heal Character")]',
-            ]
-
-            for selector in death_selectors:
-                element = await page.query_selector(f"xpath={selector}")
-                if element and await element.is_visible():
-                    return True
-
-            return False
+            return await self.selectors.detect(page, "healing.death")
         except Exception:
             return False
 
@@ -96,7 +116,7 @@ class HealingSystem:
 
             logger.info("💊 Performing healing...")
 
-            engine = await get_web_engine()
+            engine = self.web_engine or await get_web_engine()
             page = await engine.get_page()
 
             if not page:
@@ -107,9 +127,9 @@ class HealingSystem:
             await page.wait_for_load_state("networkidle")
 
             # Look for heal button
-            heal_button = await page.query_selector('button:has-text("Heal Character")')
+            heal_button = engine.locator('button:has-text("Heal Character")', page).first
 
-            if heal_button and await heal_button.is_visible():
+            if await heal_button.is_visible():
                 await heal_button.click()
                 await page.wait_for_load_state("networkidle")
 
@@ -24,15 +24,50 @@ MISSING_BUTTON_LOG_INTERVAL = 15  # seconds
 DEFAULT_STEP_TIMEOUT = 60.0  # seconds
 MAX_STEP_ATTEMPTS = 3
 POST_STEP_DELAY_RANGE = (0.5, 1.5)  # seconds
+STEP_BUTTON_SELECTOR = "button:has-text('Take a step')"
+STEP_LINK_SELECTOR = "a:has-text('Take a step')"
+ENABLED_CHECK_TIMEOUT_MS = 1000  # element is known to exist when this is checked
+STEP_READY_POLL_INTERVAL = 0.2  # in-page safety check while waiting for the step button
+STEP_POLL_INTERVAL = 0.2  # fallback polling interval when the in-page wait cannot run
 
 # Robust import mechanism for both direct execution and module import
 try:
-    from ..automation.web_engine import get_web_engine
+    from ..automation.page_state import PageState
+    from ..automation.selectors import get_selector_registry
+    from ..automation.web_engine import (
+        STEP_MISSING,
+        STEP_READY,
+        STEP_WAITING,
+        get_web_engine,
+        prefetch_page_state,
+        wait_for_step_ready,
+    )
+    from ..utils.deadlines import Deadline, current_deadline, time_left
 except ImportError:
     try:
-        from automation.web_engine import get_web_engine
+        from automation.page_state import PageState
+        from automation.selectors import get_selector_registry
+        from automation.web_engine import (
+            STEP_MISSING,
+            STEP_READY,
+            STEP_WAITING,
+            get_web_engine,
+            prefetch_page_state,
+            wait_for_step_ready,
+        )
+        from utils.deadlines import Deadline, current_deadline, time_left
     except ImportError:
-        from src.automation.web_engine import get_web_engine
+        from src.automation.page_state import PageState
+        from src.automation.selectors import get_selector_registry
+        from src.automation.web_engine import (
+            STEP_MISSING,
+            STEP_READY,
+            STEP_WAITING,
+            get_web_engine,
+            prefetch_page_state,
+            wait_for_step_ready,
+        )
+        from src.utils.deadlines import Deadline, current_deadline, time_left
 
 
 class StepSystem:
@@ -70,21 +105,29 @@ class StepSystem:
             # Primary button selectors
             "button:has-text('Take a step')",
             "button:text('Take a step')",
-            "button:contains('Take a step')",
-            "button:contains('step')",
+            "button:has-text('step')",
             # Input button selectors
             "input[type='submit'][value*='Take a step']",
             "input[type='button'][value*='Take a step']",
             # Link selectors (fallback)
             "a:has-text('Take a step')",
-            "a:contains('Take a step')",
             "a:text('Take a step')",
-            "a:contains('step')",
+            "a:has-text('step')",
             # Generic selectors
             "[onclick*='step']",
             ".step-button",
             "#step-btn",
         ]
+        # Primary fast selectors
+        self.fast_step_selectors = [
+            "button:has-text('Take a step')",
+            "a:has-text('Take a step')",
+        ]
+
+        # Both lists are tried in ranked order (most frequent winner first)
+        self.selectors = get_selector_registry()
+        self.selectors.register("steps.all", self.step_selectors)
+        self.selectors.register("steps.fast", self.fast_step_selectors)
 
         logger.info("👣 Step System initialized with modern Playwright")
 
@@ -105,31 +148,38 @@ class StepSystem:
             logger.error(f"❌ Failed to initialize Step System: {e}")
             return False
 
-    async def is_step_available(self) -> bool:
-        """Check if step is available on current page - Ultra-fast detection"""
+    async def is_step_available(self, state: PageState | None = None) -> bool:
+        """Check if step is available on current page - Ultra-fast detection
+
+        Args:
+            state: Optional page snapshot - when given, no extra page queries are made
+        """
+        if state is not None:
+            return state.step_available
+
         if not self.web_engine or not self.web_engine.page:
             return False
 
         try:
-            # Use the fastest selector first
-            element = await self.web_engine.page.query_selector("button:has-text('Take a step')")
-            if element:
-                is_visible = await element.is_visible()
-                is_enabled = await element.is_enabled()
-                return is_visible and is_enabled
-
-            # Quick fallback check
-            element = await self.web_engine.page.query_selector("a:has-text('Take a step')")
-            if element:
-                is_visible = await element.is_visible()
-                is_enabled = await element.is_enabled()
-                return is_visible and is_enabled
-            else:
+            element = await self._find_step_element()
+            if not element:
                 return False
+
+            is_visible = await element.is_visible()
+            is_enabled = await element.is_enabled(timeout=ENABLED_CHECK_TIMEOUT_MS)
+            return is_visible and is_enabled
         except Exception as e:
             logger.debug(f"Error checking step availability: {e}")
             return False
 
+    async def _find_step_element(self) -> Any | None:
+        """Get a locator for the step button (or the link fallback) if it exists"""
+        for selector in (STEP_BUTTON_SELECTOR, STEP_LINK_SELECTOR):
+            element = self.web_engine.locator(selector).first
+            if await element.count():
+                return element
+        return None
+
     async def _check_button_disabled_styling(self, element) -> bool:
         """Check if button has disabled styling"""
         classes = await element.get_attribute("class") or ""
@@ -147,17 +197,14 @@ class StepSystem:
         Returns:
             (button_found, is_fully_available, is_disabled_by_styling)
         """
-        # Try button first
-        element = await self.web_engine.page.query_selector("button:has-text('Take a step')")
-        if not element:
-            # Try link fallback
-            element = await self.web_engine.page.query_selector("a:has-text('Take a step')")
+        # Try button first, then link fallback
+        element = await self._find_step_element()
 
         if not element:
             return False, False, False
 
         is_visible = await element.is_visible()
-        is_enabled = await element.is_enabled()
+        is_enabled = await element.is_enabled(timeout=ENABLED_CHECK_TIMEOUT_MS)
 
         if not (is_visible and is_enabled):
             return True, False, False
@@ -197,19 +244,25 @@ class StepSystem:
 
         return True, last_log_time
 
-    async def wait_for_step_button(self, timeout: float = DEFAULT_STEP_TIMEOUT) -> bool:
+    async def wait_for_step_button(
+        self, timeout: float = DEFAULT_STEP_TIMEOUT, deadline: Deadline | None = None
+    ) -> bool:
         """
         Wait for step button to become available (enabled) - INDEFINITE WAITING MODE
 
         This method waits for the 'Take a step' button to be both visible and enabled.
         It will wait indefinitely while the button exists but is disabled (opacity styling).
         Only returns False if the button completely disappears or there's an error.
+        The wait itself runs inside the page, so a long cooldown costs one pending
+        call instead of a query every 200ms.
 
         Args:
             timeout: Maximum time to wait if button is completely missing
+            deadline: Hard limit of the whole wait (defaults to the cycle deadline)
 
         Returns:
-            True if button becomes available, False only if button disappears or error
+            True if button becomes available, False if it disappears, on error
+            or when the deadline passes
         """
         if not self.web_engine or not self.web_engine.page:
             return False
@@ -219,10 +272,39 @@ class StepSystem:
                 "⏳ Waiting for step button to become available (will wait indefinitely while disabled)..."
             )
 
-            start_time = asyncio.get_event_loop().time()
+            loop = asyncio.get_event_loop()
+            start_time = loop.time()
             last_log_time = 0  # Track when we last logged to reduce spam
+            deadline = deadline or current_deadline()
 
             while True:
+                if deadline and deadline.expired:
+                    logger.debug("⏰ Step button wait stopped by the cycle deadline")
+                    return False
+
+                # Block inside the page until the button is ready (one pending call)
+                event = await wait_for_step_ready(
+                    self.web_engine.page,
+                    missing_timeout=time_left(
+                        max(0.0, timeout - (loop.time() - start_time)), deadline
+                    ),
+                    timeout=time_left(DISABLED_BUTTON_LOG_INTERVAL, deadline),
+                    polling=STEP_READY_POLL_INTERVAL,
+                )
+
+                if event == STEP_READY:
+                    logger.success("✅ Step button is available and enabled!")
+                    return True
+                if event == STEP_MISSING:
+                    logger.warning(f"⏰ Step button not found after {timeout}s timeout")
+                    return False
+                if event == STEP_WAITING:
+                    last_log_time = await self._handle_disabled_button_wait(
+                        start_time, last_log_time
+                    )
+                    continue
+
+                # In-page wait unavailable (e.g. navigation) - one polling round
                 (
                     button_found,
                     is_fully_available,
@@ -248,13 +330,13 @@ class StepSystem:
                         return False
 
                 # Wait a bit before checking again (optimized for responsiveness)
-                await asyncio.sleep(0.2)
+                await asyncio.sleep(STEP_POLL_INTERVAL)
 
         except Exception as e:
             logger.error(f"❌ Error waiting for step button: {e}")
             return False
 
-    async def take_step(self, fast_mode: bool = True) -> bool:
+    async def take_step(self, fast_mode: bool = True, state: PageState | None = None) -> bool:
         """
         Take a step - Main function with intelligent waiting
 
@@ -263,6 +345,7 @@ class StepSystem:
 
         Args:
             fast_mode: If True, use minimal delays (for rapid automation, default=True)
+            state: Optional page snapshot used for the quick availability check
         """
         if not self.web_engine or not self.web_engine.page:
             logger.warning("👣 Web engine not available for step")
@@ -271,8 +354,8 @@ class StepSystem:
         try:
             logger.debug("👣 Attempting to take step with smart waiting...")
 
-            # Quick check first
-            if await self.is_step_available():
+            # Quick check first (uses snapshot when provided - no re-query)
+            if await self.is_step_available(state):
                 logger.debug("👣 Step immediately available")
                 return await self._take_step_internal(fast_mode)
 
@@ -340,40 +423,23 @@ class StepSystem:
     async def _take_step_fast(self) -> bool:
         """Fast step taking - optimized for speed"""
         try:
-            # Primary fast selectors
-            fast_selectors = [
-                "button:has-text('Take a step')",
-                "button:contains('Take a step')",
-                "a:has-text('Take a step')",
-            ]
-
-            for selector in fast_selectors:
-                try:
-                    element = await self.web_engine.page.query_selector(selector)
-                    if element:
-                        is_visible = await element.is_visible()
-                        is_enabled = await element.is_enabled()
-
-                        if is_visible and is_enabled:
-                            # Scroll less aggressively to keep player view stable
-                            await element.scroll_into_view_if_needed()
-                            await asyncio.sleep(0.1)  # Brief pause after scroll
-
-                            # Minimal delay for human-like behavior
-                            delay = random.uniform(
-                                self.fast_step_delay_min, self.fast_step_delay_max
-                            )
-                            await asyncio.sleep(delay)
-
-                            await element.click(force=True)  # Force click to avoid extra scrolling
-                            # Removed debug log for successful fast step to reduce spam
-                            return True
-
-                except Exception:
-                    # Removed debug log for failed selectors to reduce spam
-                    continue
+            element = await self.selectors.find_first(
+                self.web_engine.page, "steps.fast", self.fast_step_selectors, enabled=True
+            )
+            if not element:
+                return False
 
-            return False
+            # Scroll less aggressively to keep player view stable
+            await element.scroll_into_view_if_needed()
+            await asyncio.sleep(0.1)  # Brief pause after scroll
+
+            # Minimal delay for human-like behavior
+            delay = random.uniform(self.fast_step_delay_min, self.fast_step_delay_max)
+            await asyncio.sleep(delay)
+
+            await element.click(force=True)  # Force click to avoid extra scrolling
+            # Removed debug log for successful fast step to reduce spam
+            return True
 
         except Exception as e:
             logger.debug(f"Fast step strategy failed: {e}")
@@ -384,38 +450,28 @@ class StepSystem:
         try:
             logger.debug("👣 Using comprehensive step detection...")
 
-            for i, selector in enumerate(self.step_selectors):
-                try:
-                    element = await self.web_engine.page.query_selector(selector)
-                    if element:
-                        is_visible = await element.is_visible()
-                        is_enabled = await element.is_enabled()
-
-                        if is_visible and is_enabled:
-                            # Get element text for logging
-                            try:
-                                text = await element.inner_text()
-                                text = text.strip()[:30] if text else "N/A"
-                            except Exception:
-                                text = "N/A"
-
-                            logger.debug(
-                                f"👣 Found step element {i + 1}: '{text}' using {selector}"
-                            )
-
-                            # Human-like delay
-                            delay = random.uniform(self.step_delay_min, self.step_delay_max)
-                            await asyncio.sleep(delay)
-
-                            await element.click()
-                            logger.info(f"👣 Step taken using comprehensive selector: {selector}")
-                            return True
+            element = await self.selectors.find_first(
+                self.web_engine.page, "steps.all", self.step_selectors, enabled=True
+            )
+            if not element:
+                return False
 
-                except Exception as e:
-                    logger.debug(f"Comprehensive selector {selector} failed: {e}")
-                    continue
+            # Get element text for logging
+            try:
+                text = await element.inner_text()
+                text = text.strip()[:30] if text else "N/A"
+            except Exception:
+                text = "N/A"
 
-            return False
+            logger.debug(f"👣 Found step element: '{text}'")
+
+            # Human-like delay
+            delay = random.uniform(self.step_delay_min, self.step_delay_max)
+            await asyncio.sleep(delay)
+
+            await element.click()
+            logger.info("👣 Step taken using comprehensive selector")
+            return True
 
         except Exception as e:
             logger.debug(f"Comprehensive step strategy failed: {e}")
@@ -426,11 +482,9 @@ class StepSystem:
         try:
             logger.debug("👣 Using original-style step detection...")
 
-            # Get all potential step elements
-            buttons = await self.web_engine.page.query_selector_all(
-                "button:has-text('Take a step')"
-            )
-            links = await self.web_engine.page.query_selector_all("a:has-text('Take a step')")
+            # Get all potential step elements (locators, no remote handles)
+            buttons = await self.web_engine.locator(STEP_BUTTON_SELECTOR).all()
+            links = await self.web_engine.locator(STEP_LINK_SELECTOR).all()
 
             all_elements = buttons + links
             logger.debug(f"👣 Found {len(all_elements)} potential step elements")
@@ -485,12 +539,11 @@ class StepSystem:
             logger.success("👣 Step completed successfully")
 
             # Post-step delay (reduced for automation efficiency)
-            if not fast_mode:
-                post_delay = random.uniform(0.3, 0.8)  # Reduced from 0.5-1.5s
-                await asyncio.sleep(post_delay)
-            else:
-                # Minimal delay in fast mode for automation
-                await asyncio.sleep(0.1)
+            post_delay = random.uniform(0.3, 0.8) if not fast_mode else 0.1  # Reduced from 0.5-1.5s
+
+            # Read the next page state while the delay runs
+            prefetch_page_state(post_delay)
+            await asyncio.sleep(post_delay)
 
             return True
 
@@ -620,12 +673,10 @@ class StepSystem:
 
         try:
             # Count all potential step elements
-            buttons = await self.web_engine.page.query_selector_all(
-                "button:has-text('Take a step')"
-            )
-            links = await self.web_engine.page.query_selector_all("a:has-text('Take a step')")
+            buttons = await self.web_engine.locator(STEP_BUTTON_SELECTOR).count()
+            links = await self.web_engine.locator(STEP_LINK_SELECTOR).count()
 
-            total = len(buttons) + len(links)
+            total = buttons + links
             logger.debug(f"👣 Found {total} step buttons/links")
             return total
 
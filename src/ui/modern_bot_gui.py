@@ -33,6 +33,9 @@ try:
 except ImportError:
     pass
 
+# The bot task is cancelled on stop, so the thread ends within one page call
+STOP_JOIN_TIMEOUT = 2.0
+
 
 class ModernBotGUI:
     """
@@ -488,7 +491,7 @@ class ModernBotGUI:
 
         if self.bot_runner:
             self.paused = not self.paused
-            self.bot_runner.paused = self.paused
+            self.bot_runner.request_pause(self.paused)
 
             if self.paused:
                 self.pause_btn.configure(text="▶️ Resume")
@@ -510,14 +513,14 @@ class ModernBotGUI:
             # Set running to False first
             self.running = False
 
-            # Stop the bot runner
+            # Stop the bot runner (cancels the call in flight on the bot loop)
             if self.bot_runner:
-                self.bot_runner.running = False
+                self.bot_runner.request_stop()
 
             # Wait for thread to finish (with timeout)
             if self.bot_thread and self.bot_thread.is_alive():
                 logger.info("🔄 Waiting for bot thread to finish...")
-                self.bot_thread.join(timeout=5.0)
+                self.bot_thread.join(timeout=STOP_JOIN_TIMEOUT)
                 if self.bot_thread.is_alive():
                     logger.warning("⚠️ Bot thread still running after timeout")
 
@@ -618,12 +621,15 @@ class ModernBotGUI:
         """Run bot in async context"""
         try:
             asyncio.run(self._bot_runner_loop())
+        except asyncio.CancelledError:
+            logger.info("🛑 Bot task cancelled")
         except Exception as e:
             logger.error(f"Bot runner error: {e}")
             self.running = False
 
     async def _bot_runner_loop(self):
         """Main bot runner loop"""
+        self.bot_runner.bind_current_task()
         try:
             success = await self.bot_runner.initialize()
             if not success:
@@ -636,27 +642,36 @@ class ModernBotGUI:
 
         logger.info("Bot runner loop started")
 
-        while self.running:
-            if not self.paused:
-                try:
-                    results = await self.bot_runner.run_cycle()
-
-                    # Check if context was destroyed (navigation crash)
-                    if results.get("context_destroyed"):
-                        logger.error("🚨 Bot detected page navigation crash!")
-                        self._handle_bot_crash("Page navigation detected - context destroyed")
-                        break
-
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if "execution context was destroyed" in error_msg:
-                        logger.error("🚨 Bot crashed due to page navigation!")
-                        self._handle_bot_crash("Execution context destroyed")
-                        break
-                    else:
-                        logger.error(f"Error in bot cycle: {e}")
-
-            await asyncio.sleep(0.1)
+        try:
+            while self.running:
+                if not self.paused:
+                    try:
+                        results = await self.bot_runner.run_cycle()
+
+                        # Check if context was destroyed (navigation crash)
+                        if results.get("context_destroyed"):
+                            logger.error("🚨 Bot detected page navigation crash!")
+                            self._handle_bot_crash("Page navigation detected - context destroyed")
+                            break
+
+                    except Exception as e:
+                        error_msg = str(e).lower()
+                        if "execution context was destroyed" in error_msg:
+                            if await self.bot_runner.recover_page():
+                                continue
+                            logger.error("🚨 Bot crashed due to page navigation!")
+                            self._handle_bot_crash("Execution context destroyed")
+                            break
+                        else:
+                            logger.error(f"Error in bot cycle: {e}")
+
+                    # Wake on the next pushed page change instead of a blind 0.1s poll
+                    await self.bot_runner.wait_for_page_event()
+                else:
+                    await asyncio.sleep(0.1)
+        finally:
+            # Keep cooldowns, pending quests and tuner samples for the next start
+            self.bot_runner.save_checkpoint()
 
     def _update_button_states(self):
         """Update button states based on bot status"""
@@ -5,5 +5,6 @@ Módulo responsável por utilitários e funções auxiliares.
 Contém helpers, validadores, formatadores e outras utilidades.
 """
 
-# Placeholder para futuras utilidades
-__all__ = []
+from .deadlines import Deadline, cancel_threadsafe, current_deadline, deadline_scope, time_left
+
+__all__ = ["Deadline", "cancel_threadsafe", "current_deadline", "deadline_scope", "time_left"]
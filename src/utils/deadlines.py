@@ -0,0 +1,104 @@
+"""
+⏳ Deadlines for SimpleMMO Bot
+
+Time limits and cancellation helpers for long-running system calls.
+BotRunner opens a deadline scope around every cycle; waits inside the
+systems cap their own timeouts by the time left, so no call outlives the
+cycle that started it. Stopping the bot cancels the running task from the
+GUI thread instead of waiting for those waits to run out.
+"""
+
+import asyncio
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Point in time (time.monotonic) by which a call must be done"""
+
+    at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Deadline `seconds` from now"""
+        return cls(time.monotonic() + max(0.0, seconds))
+
+    def remaining(self) -> float:
+        """Seconds left (0 once expired)"""
+        return max(0.0, self.at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """True once the deadline has passed"""
+        return time.monotonic() >= self.at
+
+    def cap(self, timeout: float) -> float:
+        """A timeout shortened to the time left"""
+        return min(timeout, self.remaining())
+
+
+def _shared_deadline_var() -> ContextVar:
+    """The deadline ContextVar shared by every copy of this module
+
+    Modules import this as utils.deadlines or src.utils.deadlines depending on
+    how they were loaded; both names must see the same deadline.
+    """
+    for name in ("utils.deadlines", "src.utils.deadlines"):
+        var = getattr(sys.modules.get(name), "_current_deadline", None)
+        if var is not None:
+            return var
+    return ContextVar("deadline", default=None)
+
+
+# Deadline of the running cycle (inherited by tasks created inside it)
+_current_deadline: ContextVar[Deadline | None] = _shared_deadline_var()
+
+
+def current_deadline() -> Deadline | None:
+    """Deadline of the enclosing scope, if any"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(seconds: float | None) -> Iterator[Deadline | None]:
+    """Run a block under a deadline (never extends an enclosing one)
+
+    Args:
+        seconds: Time limit of the block; None keeps the enclosing deadline
+    """
+    parent = _current_deadline.get()
+    deadline = Deadline.after(seconds) if seconds is not None else parent
+    if parent is not None and deadline is not None and parent.at < deadline.at:
+        deadline = parent
+
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def time_left(timeout: float, deadline: Deadline | None = None) -> float:
+    """A timeout capped by the given deadline, or by the enclosing one"""
+    deadline = deadline or _current_deadline.get()
+    return deadline.cap(timeout) if deadline else timeout
+
+
+def cancel_threadsafe(
+    loop: asyncio.AbstractEventLoop | None, task: asyncio.Future | None
+) -> bool:
+    """Cancel a task running on another thread's event loop
+
+    Returns:
+        True if the cancellation was scheduled
+    """
+    if loop is None or task is None or loop.is_closed() or task.done():
+        return False
+
+    loop.call_soon_threadsafe(task.cancel)
+    return True
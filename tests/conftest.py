@@ -0,0 +1,41 @@
+"""
+🧪 Shared Test Fixtures
+
+- make_runner: BotRunner factory with a mocked web engine
+"""
+
+from collections.abc import Awaitable, Callable
+from unittest.mock import MagicMock
+
+import pytest
+from src.core.bot_runner import BotRunner
+
+TRAVEL_URL = "https://web.simple-mmo.com/travel"
+
+
+@pytest.fixture
+def make_runner() -> Callable[..., BotRunner]:
+    """Factory of BotRunners with a mocked engine
+
+    Args (of the factory):
+        config: BotRunner configuration
+        cycle: Replaces _run_cycle (e.g. a cycle that never finishes)
+        **systems: Runner attributes to set (combat=..., gathering=...)
+    """
+
+    def factory(
+        config: dict | None = None,
+        cycle: Callable[[], Awaitable[dict]] | None = None,
+        **systems,
+    ) -> BotRunner:
+        runner = BotRunner(dict(config or {}))
+        runner.web_engine = MagicMock()
+        runner.web_engine.get_resource_stats.return_value = {"page_calls": 0}
+        runner.web_engine.current_url = TRAVEL_URL
+        if cycle is not None:
+            runner._run_cycle = cycle
+        for name, system in systems.items():
+            setattr(runner, name, system)
+        return runner
+
+    return factory
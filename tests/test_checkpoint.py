@@ -0,0 +1,139 @@
+"""
+🧪 Test Session Checkpoint
+
+Tests warm-starting the bot across stop/start and process restarts:
+- Cooldowns, pending quests and tuner samples survive a restart
+- Tuned timings are pushed to the systems on restore, also after a reset
+- Statistics start fresh in every new session
+- Stale, corrupt or outdated checkpoints are ignored
+- Periodic saves follow the configured interval
+"""
+
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+from src.core.bot_runner import BotRunner
+from src.core.checkpoint import CHECKPOINT_VERSION, SessionCheckpoint
+from src.core.tuner import ACTION_ATTACK, get_timing_tuner
+from src.systems.combat import CombatSystem
+
+
+@pytest.fixture
+def session_runner(make_runner):
+    """Factory of BotRunners with the checkpointed attributes of their systems"""
+    return lambda: make_runner(
+        combat=SimpleNamespace(last_combat_time=0, attack_delay=0.1),
+        gathering=SimpleNamespace(last_gather_time=0),
+        quest_automation=SimpleNamespace(current_quest_points=0, pending_quests=0),
+    )
+
+
+@pytest.mark.asyncio
+async def test_restart_resumes_session(tmp_path, session_runner):
+    """Test a new runner picks up where the previous process stopped"""
+    path = tmp_path / "checkpoint.json"
+    old = session_runner()
+    old.cycles = 42
+    old.stats["combat_wins"] = 7
+    old.combat.last_combat_time = time.time()
+    old.gathering.last_gather_time = time.time() - 1
+    old.quest_automation.pending_quests = 2
+    get_timing_tuner().samples.clear()
+    for _ in range(10):
+        get_timing_tuner().record(ACTION_ATTACK, 0.3)
+    assert SessionCheckpoint(path).save(old) is True
+
+    get_timing_tuner().samples.clear()
+    new = session_runner()
+    checkpoint = SessionCheckpoint(path)
+    assert await checkpoint.restore(new) is True
+
+    assert new.combat.last_combat_time == old.combat.last_combat_time
+    assert new.gathering.last_gather_time == old.gathering.last_gather_time
+    assert new.quest_automation.pending_quests == 2
+
+    # Statistics are not warm-start data
+    assert new.cycles == 0
+    assert new.stats["combat_wins"] == 0
+    assert get_timing_tuner().percentile(ACTION_ATTACK, 50) == 0.3
+    assert checkpoint.get_stats()["checkpoint_restored"] == 1
+    get_timing_tuner().samples.clear()
+
+
+@pytest.mark.asyncio
+async def test_unusable_checkpoints_are_ignored(tmp_path, session_runner):
+    """Test missing, corrupt, outdated and stale files start a fresh session"""
+    path = tmp_path / "checkpoint.json"
+    checkpoint = SessionCheckpoint(path, max_age=60.0)
+    runner = session_runner()
+
+    assert await checkpoint.restore(runner) is False
+
+    path.write_text("{not json", encoding="utf-8")
+    assert await checkpoint.restore(runner) is False
+
+    path.write_text(json.dumps({"version": CHECKPOINT_VERSION + 1}), encoding="utf-8")
+    assert await checkpoint.restore(runner) is False
+
+    stale = {
+        "version": CHECKPOINT_VERSION,
+        "saved_at": time.time() - 120,
+        "systems": {"combat": {"last_combat_time": 123.0}},
+    }
+    path.write_text(json.dumps(stale), encoding="utf-8")
+    assert await checkpoint.restore(runner) is False
+    assert runner.combat.last_combat_time == 0
+
+
+@pytest.mark.asyncio
+async def test_restored_timings_reach_the_systems(tmp_path, session_runner):
+    """Test the tuned timings are applied to combat on restore and survive reset_state"""
+    path = tmp_path / "checkpoint.json"
+    old = session_runner()
+    old.combat.last_combat_time = time.time()
+    get_timing_tuner().samples.clear()
+    for seconds in (0.4, 0.5, 0.5, 0.6, 0.6, 0.7, 0.8, 1.2):
+        get_timing_tuner().record(ACTION_ATTACK, seconds)
+    assert SessionCheckpoint(path).save(old) is True
+    get_timing_tuner().samples.clear()
+
+    new = BotRunner({})
+    new.checkpoint = SessionCheckpoint(path)
+    new.combat = CombatSystem({})
+    assert new.combat.max_wait_time != 1.8
+
+    assert await new.checkpoint.restore(new) is True
+    assert new.combat.max_wait_time == 1.8  # p99 * margin, straight from the samples
+    assert new.combat.last_combat_time == old.combat.last_combat_time
+
+    await new.reset_state()
+    assert new.combat.last_combat_time == old.combat.last_combat_time
+    assert new.combat.max_wait_time == 1.8
+    get_timing_tuner().samples.clear()
+
+
+def test_periodic_save_interval(tmp_path, session_runner):
+    """Test maybe_save only writes once the interval elapsed"""
+    path = tmp_path / "checkpoint.json"
+    checkpoint = SessionCheckpoint(path, interval=3600.0)
+    runner = session_runner()
+
+    assert checkpoint.maybe_save(runner) is False
+    assert not path.exists()
+
+    checkpoint.interval = 0.0
+    assert checkpoint.maybe_save(runner) is True
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert saved["systems"]["combat"] == {"last_combat_time": 0}
+    assert "runner" not in saved
+
+
+@pytest.mark.asyncio
+async def test_checkpoint_can_be_disabled():
+    """Test checkpoint_enabled=False never touches the disk"""
+    runner = BotRunner({"checkpoint_enabled": False})
+
+    assert runner.save_checkpoint() is False
+    assert await runner.checkpoint.restore(runner) is False
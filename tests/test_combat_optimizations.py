@@ -8,7 +8,7 @@ Tests the optimized combat system with:
 """
 
 import time
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from loguru import logger
@@ -89,8 +89,9 @@ async def test_mock_combat_flow():
     )  # Simulates button disable/enable cycle
     mock_attack_button.click = AsyncMock()
 
-    # Configure mock page to return attack button
+    # Configure mock page to return attack button (systems query through locators)
     mock_page.query_selector.return_value = mock_attack_button
+    mock_page.locator = MagicMock(return_value=MagicMock(first=mock_attack_button))
 
     # Test combat system
     config = {"auto_combat": True}
@@ -124,8 +125,10 @@ async def test_hp_based_leave_detection():
     mock_hp_element = AsyncMock()
     mock_hp_element.get_attribute = AsyncMock(return_value="width:50%")  # 50% HP
     mock_hp_element.text_content = AsyncMock(return_value="150")
+    mock_hp_element.count = AsyncMock(return_value=1)
 
     mock_page.query_selector.return_value = mock_hp_element
+    mock_page.locator = MagicMock(return_value=MagicMock(first=mock_hp_element))
 
     config = {"auto_combat": True}
     combat_system = CombatSystem(config)
@@ -0,0 +1,136 @@
+"""
+🧪 Test Combat State Reader
+
+Tests reading combat HP from the Alpine component state:
+- Payload parsing and defeat detection
+- One evaluate per HP check (no style/text parsing round trips)
+- DOM selectors are only used when the Alpine data is unavailable
+- Waiting for the next combat condition in a single in-page evaluate
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation.combat_state import (
+    COMBAT_EVENT_ATTACK,
+    COMBAT_EVENT_DEFEATED,
+    COMBAT_EVENT_TIMEOUT,
+    SOURCE_DOM,
+    CombatEvent,
+    CombatState,
+)
+from src.automation.web_engine import read_combat_state, wait_for_combat_event
+from src.systems.combat import CombatSystem
+
+
+def test_combat_state_from_payload():
+    """Test payload parsing and derived flags"""
+    state = CombatState.from_payload(
+        {
+            "source": "alpine",
+            "enemy_hp_percentage": 0.4,
+            "enemy_current_hp": 0,
+            "enemy_max_hp": 250,
+            "player_hp_percentage": 73,
+        }
+    )
+
+    assert state.enemy_defeated is True  # current HP wins over a rounded percentage
+    assert state.player_dead is False
+    assert state.enemy_max_hp == 250.0
+    assert state.player_current_hp is None
+
+
+def test_unknown_hp_is_not_defeat():
+    """Test missing values never count as a kill"""
+    state = CombatState.from_payload({"source": SOURCE_DOM, "enemy_hp_percentage": None})
+
+    assert state.enemy_defeated is False
+    assert state.player_dead is False
+
+
+@pytest.mark.asyncio
+async def test_read_combat_state_single_evaluate():
+    """Test the whole HP snapshot costs one round trip"""
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value={"enemy_hp_percentage": 13, "enemy_current_hp": 276})
+
+    state = await read_combat_state(page)
+
+    assert state.enemy_hp_percentage == 13.0
+    assert page.evaluate.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_enemy_hp_uses_alpine_state():
+    """Test the combat system reads HP without touching DOM selectors"""
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value={"enemy_hp_percentage": 42.5, "enemy_current_hp": 85})
+    page.locator = MagicMock()
+
+    combat = CombatSystem({"auto_combat": True})
+    hp = await combat._get_enemy_hp_percentage(page)
+
+    assert hp == 42.5
+    assert page.evaluate.await_count == 1
+    page.locator.assert_not_called()
+    assert combat.last_combat_state.enemy_current_hp == 85.0
+
+
+def test_combat_event_from_payload():
+    """Test waiter payload parsing"""
+    event = CombatEvent.from_payload({"event": "defeated", "state": {"enemy_current_hp": 0}})
+
+    assert event.event == COMBAT_EVENT_DEFEATED
+    assert event.state.enemy_defeated is True
+    assert CombatEvent.from_payload({}).event == COMBAT_EVENT_TIMEOUT
+
+
+@pytest.mark.asyncio
+async def test_wait_for_combat_event_single_evaluate():
+    """Test the whole wait is one evaluate with timings passed in milliseconds"""
+    page = MagicMock()
+    page.evaluate = AsyncMock(
+        return_value={"event": "attack", "state": {"enemy_hp_percentage": 60}}
+    )
+
+    event = await wait_for_combat_event(page, timeout=3.0, polling=0.001)
+
+    assert event.event == COMBAT_EVENT_ATTACK
+    assert event.state.enemy_hp_percentage == 60.0
+    assert page.evaluate.await_count == 1
+    args = page.evaluate.await_args.args[1]
+    assert args["timeout"] == 3000
+    assert args["polling"] == 10  # clamped
+    assert args["armed"] is True
+
+
+@pytest.mark.asyncio
+async def test_wait_for_combat_event_interrupted():
+    """Test navigation during the wait returns None instead of raising"""
+    page = MagicMock()
+    page.evaluate = AsyncMock(side_effect=Exception("Execution context was destroyed"))
+
+    assert await wait_for_combat_event(page, timeout=1.0, polling=0.02) is None
+
+
+@pytest.mark.asyncio
+async def test_attack_uses_waiter_instead_of_polling():
+    """Test an attack click is followed by one wait, not a button polling loop"""
+    page = MagicMock()
+    page.evaluate = AsyncMock(
+        return_value={"event": "attack", "state": {"enemy_hp_percentage": 30}}
+    )
+    button = MagicMock()
+    button.click = AsyncMock()
+
+    combat = CombatSystem({"auto_combat": True})
+    combat._find_attack_button_on_page = AsyncMock(return_value=button)
+    combat._wait_for_attack_completion = AsyncMock()
+
+    assert await combat._perform_single_attack(page) is True
+
+    button.click.assert_awaited_once()
+    combat._wait_for_attack_completion.assert_not_awaited()
+    assert combat.last_combat_event.event == COMBAT_EVENT_ATTACK
+    assert combat.last_combat_state.enemy_hp_percentage == 30.0
@@ -0,0 +1,138 @@
+"""
+🧪 Test Deadlines and Cancellation
+
+Tests stopping long-running system calls promptly:
+- Deadline scopes nest and never extend an enclosing deadline
+- Waits are capped by the cycle deadline
+- Stop from another thread cancels the running bot task within one call
+- Pause interrupts the cycle in flight without stopping the loop
+- Quests yield when their time slice is used up and resume next cycle
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation import quest_automation as quest_module
+from src.automation.quest_automation import QuestAutomation
+from src.systems.steps import StepSystem
+from src.utils.deadlines import Deadline, current_deadline, deadline_scope, time_left
+
+
+async def hang() -> dict:
+    """Cycle that blocks until cancelled"""
+    await asyncio.sleep(600)
+    return {}
+
+
+def test_deadline_scopes_nest():
+    """Test an inner scope cannot outlive the outer one"""
+    assert current_deadline() is None
+    with deadline_scope(1.0) as outer:
+        with deadline_scope(60.0) as inner:
+            assert inner is outer
+        with deadline_scope(0.1) as inner:
+            assert inner.at < outer.at
+        assert current_deadline() is outer
+    assert current_deadline() is None
+
+
+def test_time_left_caps_timeouts():
+    """Test timeouts are shortened to the remaining time"""
+    assert time_left(30.0) == 30.0
+    assert time_left(30.0, Deadline.after(1.0)) <= 1.0
+    assert time_left(30.0, Deadline(time.monotonic() - 1)) == 0.0
+    with deadline_scope(2.0):
+        assert time_left(30.0) <= 2.0
+
+
+@pytest.mark.asyncio
+async def test_step_wait_respects_deadline():
+    """Test the otherwise indefinite step wait ends at the deadline"""
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value={"event": "waiting"})
+    steps = StepSystem({})
+    steps.web_engine = MagicMock()
+    steps.web_engine.page = page
+
+    with deadline_scope(0.0):
+        assert await steps.wait_for_step_button(timeout=60.0) is False
+    page.evaluate.assert_not_awaited()
+
+    assert await steps.wait_for_step_button(timeout=60.0, deadline=Deadline.after(0.0)) is False
+
+
+@pytest.mark.asyncio
+async def test_request_stop_cancels_running_cycle(make_runner):
+    """Test stop from the GUI thread cancels the bot task right away"""
+    runner = make_runner(cycle=hang)
+    runner.running = True
+
+    async def bot_loop():
+        runner.bind_current_task()
+        await runner.run_cycle()
+
+    task = asyncio.create_task(bot_loop())
+    await asyncio.sleep(0.01)
+
+    started = time.monotonic()
+    threading.Thread(target=runner.request_stop).start()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert time.monotonic() - started < 0.5
+    assert runner.running is False
+
+
+@pytest.mark.asyncio
+async def test_request_pause_interrupts_cycle(make_runner):
+    """Test pausing ends the cycle in flight but keeps the bot task alive"""
+    runner = make_runner(cycle=hang)
+
+    async def bot_loop():
+        runner.bind_current_task()
+        return await runner.run_cycle()
+
+    task = asyncio.create_task(bot_loop())
+    await asyncio.sleep(0.01)
+    threading.Thread(target=runner.request_pause, args=(True,)).start()
+
+    results = await asyncio.wait_for(task, timeout=1.0)
+
+    assert results == {"interrupted": True}
+    assert runner.paused is True
+    assert runner.pacer.stats["active_cycles"] == 0
+
+
+@pytest.mark.asyncio
+async def test_quests_yield_and_resume(monkeypatch):
+    """Test an expired time slice leaves the remaining quests for the next cycle"""
+    monkeypatch.setattr(quest_module.asyncio, "sleep", AsyncMock())
+    travel = AsyncMock(return_value=True)
+    monkeypatch.setattr(quest_module, "navigate_to_travel", travel)
+
+    quests = QuestAutomation()
+    quests.navigate_to_quests = AsyncMock(return_value=True)
+    quests.get_quest_points = AsyncMock(return_value=(10, 10))
+    quests.switch_to_not_completed_tab = AsyncMock(return_value=True)
+    quests.get_available_quests = AsyncMock(
+        return_value=[{"name": f"Quest {i}"} for i in range(5)]
+    )
+    quests.click_quest = AsyncMock(return_value=True)
+    quests.perform_quest = AsyncMock(return_value=True)
+    quests.close_popups = AsyncMock(return_value=True)
+
+    # Slice runs out after the first quest
+    results = await quests.execute_quests_cycle(3, deadline=Deadline(time.monotonic() - 1))
+    assert results["yielded"] is True
+    assert results["quests_successful"] == 1
+    assert quests.pending_quests == 2
+    travel.assert_awaited_once()
+
+    # Next cycle finishes the remaining quests only
+    results = await quests.execute_quests_cycle(3)
+    assert results["yielded"] is False
+    assert results["quests_successful"] == 2
+    assert quests.pending_quests == 0
@@ -0,0 +1,132 @@
+"""
+🧪 Test Gather Completion Waiter
+
+Tests the in-page disabled -> enabled edge waiter:
+- One Locator.evaluate per gather click (no polling round trips)
+- The gather button is resolved once per node, not once per item
+- Polling fallback when the waiter cannot run
+- Opt-in bulk mode: one evaluate per node, progress binding and abort
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation.web_engine import (
+    BUTTON_CYCLE_ENABLED,
+    BUTTON_CYCLE_IDLE,
+    GATHER_PROGRESS_BINDING,
+    WebAutomationEngine,
+    run_bulk_gather,
+    wait_for_button_cycle,
+)
+from src.systems.gathering import GatheringSystem
+
+
+def make_button(result):
+    """Create a mocked Locator whose in-page wait resolves with the given result"""
+    button = MagicMock()
+    button.click = AsyncMock()
+    button.evaluate = AsyncMock(return_value=result)
+    return button
+
+
+@pytest.mark.asyncio
+async def test_button_cycle_single_evaluate():
+    """Test the edge wait is one evaluate with timings passed in milliseconds"""
+    button = make_button({"event": "enabled", "disabled_seen": True})
+
+    event = await wait_for_button_cycle(button, timeout=5.0, polling=0.05, arm=1.0)
+
+    assert event == BUTTON_CYCLE_ENABLED
+    assert button.evaluate.await_count == 1
+    args = button.evaluate.await_args.args[1]
+    assert args == {"timeout": 5000, "polling": 50, "arm": 1000}
+
+
+@pytest.mark.asyncio
+async def test_button_cycle_interrupted():
+    """Test a failed evaluate returns None so callers can fall back"""
+    button = MagicMock()
+    button.evaluate = AsyncMock(side_effect=Exception("Execution context was destroyed"))
+
+    assert await wait_for_button_cycle(button, timeout=1.0, polling=0.05) is None
+
+
+@pytest.mark.asyncio
+async def test_gather_completion_does_not_poll():
+    """Test a resolved edge finishes the wait without polling the page"""
+    page = MagicMock()
+    gathering = GatheringSystem({"auto_gather": True})
+    gathering._poll_gather_completion = AsyncMock()
+
+    button = make_button({"event": BUTTON_CYCLE_IDLE})
+    assert await gathering._wait_for_gather_completion(page, button) is True
+
+    gathering._poll_gather_completion.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_gather_completion_falls_back_to_polling():
+    """Test the polling loop is used when the waiter cannot run"""
+    page = MagicMock()
+    gathering = GatheringSystem({"auto_gather": True})
+    gathering._poll_gather_completion = AsyncMock(return_value=True)
+
+    button = make_button(None)
+    assert await gathering._wait_for_gather_completion(page, button) is True
+
+    gathering._poll_gather_completion.assert_awaited_once_with(page)
+
+
+@pytest.mark.asyncio
+async def test_gather_button_resolved_once_per_node():
+    """Test N gathers cost one button lookup and one wait each"""
+    page = MagicMock()
+    button = make_button({"event": BUTTON_CYCLE_ENABLED})
+    gathering = GatheringSystem({"auto_gather": True})
+    gathering._find_gather_button_on_page = AsyncMock(return_value=button)
+
+    for _ in range(3):
+        assert await gathering._perform_single_gather(page, button) is True
+
+    gathering._find_gather_button_on_page.assert_not_awaited()
+    assert button.click.await_count == 3
+    assert button.evaluate.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_gather_single_evaluate():
+    """Test a whole node is one evaluate with gather_delay passed to the page"""
+    button = make_button({"gathered": 5, "total": 5, "aborted": False, "event": "enabled"})
+
+    result = await run_bulk_gather(button, count=5, delay=0.5, timeout=5.0, polling=0.05)
+
+    assert result.completed is True
+    assert button.evaluate.await_count == 1
+    args = button.evaluate.await_args.args[1]
+    assert args["count"] == 5
+    assert args["delay"] == 500
+    assert args["binding"] == GATHER_PROGRESS_BINDING
+
+
+def test_progress_callback_aborts_runner():
+    """Test the progress binding asks the page to stop once an abort is requested"""
+    engine = WebAutomationEngine()
+    gathering = GatheringSystem({"auto_gather": True, "bulk_gather": True})
+    engine.gather_progress_callback = gathering._on_gather_progress
+
+    assert engine._on_gather_progress({"done": 1, "total": 4}) is True
+    assert gathering.gather_progress == {"done": 1, "total": 4}
+
+    gathering._abort_requested = True
+    assert engine._on_gather_progress({"done": 2, "total": 4}) is False
+
+
+@pytest.mark.asyncio
+async def test_bulk_mode_is_opt_in():
+    """Test bulk gathering stays off unless configured"""
+    assert GatheringSystem({"auto_gather": True}).bulk_gather is False
+
+    gathering = GatheringSystem({"auto_gather": True, "bulk_gather": True})
+    await gathering.abort_gathering()
+    assert gathering._abort_requested is True
@@ -0,0 +1,109 @@
+"""
+🧪 Test Action Interrupts
+
+Tests stopping long actions when a captcha or death appears:
+- A pushed page state cancels the action in flight
+- Polling fallback when the page does not push changes
+- Combat and gathering return to the runner with the interrupt reason
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import pytest
+from src.automation.page_events import PageEventBus
+from src.automation.page_state import INTERRUPT_CAPTCHA, INTERRUPT_DEATH, PageState
+from src.automation.web_engine import WebAutomationEngine
+from src.systems import combat as combat_module
+from src.systems import gathering as gathering_module
+from src.systems.combat import CombatSystem
+from src.systems.gathering import GatheringSystem
+
+
+async def hang() -> bool:
+    """Long action that only ends when cancelled"""
+    await asyncio.sleep(600)
+    return True
+
+
+def test_interrupt_reason():
+    """Test captcha wins over death and a normal page keeps going"""
+    assert PageState(combat_captcha=True, is_dead=True).interrupt_reason == INTERRUPT_CAPTCHA
+    assert PageState(is_dead=True).interrupt_reason == INTERRUPT_DEATH
+    assert PageState(attack_available=True).interrupt_reason is None
+
+
+@pytest.mark.asyncio
+async def test_pushed_captcha_cancels_action():
+    """Test the action is cancelled as soon as a captcha state is pushed"""
+    bus = PageEventBus()
+    loop = asyncio.get_running_loop()
+    loop.call_later(0.02, bus.publish, {"url": "", "combat_captcha": True})
+
+    started = time.monotonic()
+    result, reason = await bus.run_until_interrupt(hang())
+
+    assert (result, reason) == (None, INTERRUPT_CAPTCHA)
+    assert time.monotonic() - started < 0.5
+    assert bus.stats["interrupts"] == 1
+    assert bus._watchers == []
+
+
+@pytest.mark.asyncio
+async def test_finished_action_is_not_interrupted():
+    """Test a normal result passes through and later pushes are ignored"""
+    bus = PageEventBus()
+
+    assert await bus.run_until_interrupt(asyncio.sleep(0, result=True)) == (True, None)
+    bus.publish({"url": "", "is_dead": True})
+    assert bus.stats["interrupts"] == 0
+
+
+@pytest.mark.asyncio
+async def test_polling_fallback_detects_death():
+    """Test the state is polled while the page does not push changes"""
+    bus = PageEventBus()
+    poll = AsyncMock(side_effect=[PageState(), PageState(is_dead=True)])
+
+    result, reason = await bus.run_until_interrupt(hang(), poll=poll, poll_interval=0.01)
+
+    assert reason == INTERRUPT_DEATH
+    assert poll.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_combat_interrupted_by_captcha(monkeypatch):
+    """Test combat stops and reports the captcha instead of running out its timeouts"""
+    engine = WebAutomationEngine()
+    engine.page_events.active = True
+    monkeypatch.setattr(combat_module, "get_web_engine", AsyncMock(return_value=engine))
+    combat = CombatSystem({})
+    combat._run_combat = hang
+
+    asyncio.get_running_loop().call_later(
+        0.02, engine.page_events.publish, {"url": "", "combat_captcha": True}
+    )
+
+    assert await combat.start_combat() is False
+    assert combat.last_interrupt == INTERRUPT_CAPTCHA
+    assert combat.combat_stats["interrupted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_gathering_interrupted_by_death(monkeypatch):
+    """Test gathering stops the in-page run when the player dies"""
+    engine = WebAutomationEngine()
+    engine.page_events.active = True
+    monkeypatch.setattr(gathering_module, "get_web_engine", AsyncMock(return_value=engine))
+    gathering = GatheringSystem({})
+    gathering._run_gathering = hang
+    gathering.abort_gathering = AsyncMock()
+
+    asyncio.get_running_loop().call_later(
+        0.02, engine.page_events.publish, {"url": "", "is_dead": True}
+    )
+
+    assert await gathering.start_gathering() is False
+    assert gathering.last_interrupt == INTERRUPT_DEATH
+    gathering.abort_gathering.assert_awaited_once()
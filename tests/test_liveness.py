@@ -0,0 +1,131 @@
+"""
+🧪 Test Event-Driven Page Liveness
+
+Tests tracking page liveness from Playwright events:
+- The per-cycle destroyed check costs no round trip
+- close/crash/disconnected invalidate the cached page
+- Main frame navigations away from the game request one navigation check
+- Re-attaching to the same page never registers its listeners twice
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation.web_engine import WebAutomationEngine
+
+TRAVEL_URL = "https://web.simple-mmo.com/travel"
+
+
+def make_engine() -> tuple[WebAutomationEngine, dict]:
+    """Engine with a mocked page/browser that records the registered listeners"""
+    handlers: dict = {}
+    page = MagicMock()
+    page.url = TRAVEL_URL
+    page.is_closed.return_value = False
+    page.evaluate = AsyncMock(return_value="complete")
+    page.on.side_effect = lambda event, handler: handlers.setdefault(event, handler)
+    browser = MagicMock()
+    browser.on.side_effect = lambda event, handler: handlers.setdefault(event, handler)
+
+    engine = WebAutomationEngine()
+    engine.page = page
+    engine.context = MagicMock()
+    engine.browser = browser
+    assert engine.install_liveness_listeners() is True
+    return engine, handlers
+
+
+def main_frame(url: str) -> MagicMock:
+    """Main frame navigated to url"""
+    return MagicMock(url=url, parent_frame=None)
+
+
+@pytest.mark.asyncio
+async def test_destroyed_check_is_free():
+    """Test the hot-path check answers from events without evaluating in the page"""
+    engine, handlers = make_engine()
+
+    assert set(handlers) == {"close", "crash", "framenavigated", "disconnected"}
+    assert await engine.is_context_destroyed() is False
+    engine.page.evaluate.assert_not_awaited()
+
+    # Listeners are added once per page
+    engine.install_liveness_listeners()
+    assert engine.page.on.call_count == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("event", ["close", "crash"])
+async def test_page_lost_events(event):
+    """Test close/crash of the bot page invalidate the cached reference"""
+    engine, handlers = make_engine()
+    page = engine.page
+
+    handlers[event](page)
+
+    assert await engine.is_context_destroyed() is True
+    assert await engine.get_page() is None
+    page.evaluate.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_other_tab_closing_is_ignored():
+    """Test closing another tab (e.g. the captcha tab) keeps the bot page alive"""
+    engine, handlers = make_engine()
+
+    handlers["close"](MagicMock())
+
+    assert await engine.is_context_destroyed() is False
+    assert await engine.get_page() is engine.page
+
+
+@pytest.mark.asyncio
+async def test_browser_disconnected():
+    """Test a lost CDP connection marks the page as lost"""
+    engine, handlers = make_engine()
+
+    handlers["disconnected"](engine.browser)
+
+    assert engine.page_lost_reason == "browser disconnected"
+    assert await engine.is_context_destroyed() is True
+
+
+@pytest.mark.asyncio
+async def test_navigation_check_only_after_leaving_game():
+    """Test only main frame navigations off the game request a navigation check"""
+    engine, handlers = make_engine()
+
+    handlers["framenavigated"](main_frame("https://web.simple-mmo.com/npcs/attack/1"))
+    assert engine.consume_navigation_check() is False
+
+    handlers["framenavigated"](MagicMock(url="https://ads.example.com", parent_frame=MagicMock()))
+    assert engine.consume_navigation_check() is False
+    assert engine.current_url == "https://web.simple-mmo.com/npcs/attack/1"
+
+    handlers["framenavigated"](main_frame("http://localhost:8000/"))
+    assert engine.consume_navigation_check() is True
+    assert engine.consume_navigation_check() is False
+    assert await engine.is_context_destroyed() is False
+
+
+@pytest.mark.asyncio
+async def test_reattached_page_listeners_not_duplicated():
+    """Test recovery re-picking the same tab replaces its listeners instead of adding more"""
+    engine, _ = make_engine()
+    page = engine.page
+    engine.install_step_listener()
+    engine.add_navigation_listener(MagicMock())
+
+    engine._reset_page_tracking()  # what every recovery attempt does first
+    engine.install_step_listener()
+    engine.install_liveness_listeners()
+
+    removed = {call.args[0] for call in page.remove_listener.call_args_list}
+    assert removed == {"response", "close", "crash", "framenavigated"}
+    assert page.on.call_count == 8  # 4 added, removed, added again
+    assert len(engine._page_listeners) == 4
+
+
+    # A cleaned up runner stops receiving navigations
+    engine.remove_navigation_listener(engine._navigation_listeners[0])
+    assert engine._navigation_listeners == []
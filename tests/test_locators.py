@@ -0,0 +1,104 @@
+"""
+🧪 Test Locator Cache and Handle Accounting
+
+Tests the handle-free query path:
+- Locators are compiled once per page and reused
+- Scoped handles are disposed and counted
+- Handles returned to callers stay counted until they are disposed
+- The engine reports live remote objects in its stats
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation import web_engine
+from src.automation.web_engine import LocatorCache, WebAutomationEngine, scoped_handles
+
+
+def test_locator_cache_reuses_locators():
+    """Test the same selector returns the same Locator on the same page"""
+    cache = LocatorCache()
+    page = MagicMock()
+
+    first = cache.get(page, "#crafting_button")
+    second = cache.get(page, "#crafting_button")
+
+    assert first is second
+    assert page.locator.call_count == 1
+    assert len(cache) == 1
+
+
+def test_locator_cache_resets_on_new_page():
+    """Test locators of a replaced page are not reused"""
+    cache = LocatorCache()
+    old_page = MagicMock()
+    new_page = MagicMock()
+
+    cache.get(old_page, "#crafting_button")
+    cache.get(new_page, "#crafting_button")
+
+    assert new_page.locator.call_count == 1
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_scoped_handles_are_disposed():
+    """Test handles tracked in a scope are disposed on exit, even after errors"""
+    before = dict(web_engine.handle_stats)
+    handles = [MagicMock(dispose=AsyncMock()) for _ in range(2)]
+    disposers = [handle.dispose for handle in handles]
+
+    with pytest.raises(RuntimeError):
+        async with scoped_handles() as scope:
+            scope.track(handles)
+            assert web_engine.handle_stats["live_handles"] == before["live_handles"] + 2
+            raise RuntimeError("boom")
+
+    assert all(dispose.await_count == 1 for dispose in disposers)
+    assert web_engine.handle_stats["live_handles"] == before["live_handles"]
+    assert web_engine.handle_stats["handles_disposed"] == before["handles_disposed"] + 2
+
+
+@pytest.mark.asyncio
+async def test_escaped_handles_stay_live():
+    """Test handles handed out by the find helpers are counted until disposed"""
+    before = dict(web_engine.handle_stats)
+    returned = MagicMock(dispose=AsyncMock())
+    returned.is_visible = AsyncMock(return_value=True)
+    returned.is_enabled = AsyncMock(return_value=True)
+    hidden = MagicMock(dispose=AsyncMock())
+    hidden.is_visible = AsyncMock(return_value=False)
+    page = MagicMock()
+    page.query_selector = AsyncMock(side_effect=[hidden, returned])
+    engine = WebAutomationEngine()
+
+    element = await engine._find_single_valid_element(page, ["#hidden", "#visible"])
+
+    # The hidden handle was disposed in the scope, the returned one escaped it
+    assert element is returned
+    assert web_engine.handle_stats["handles_created"] == before["handles_created"] + 2
+    assert web_engine.handle_stats["live_handles"] == before["live_handles"] + 1
+
+    engine.page = page
+    page.is_closed.return_value = False
+    page.query_selector = AsyncMock(return_value=MagicMock(dispose=AsyncMock()))
+    leaked = await engine.find_element("#crafting_button")
+    assert web_engine.handle_stats["live_handles"] == before["live_handles"] + 2
+
+    await element.dispose()
+    await leaked.dispose()
+    await leaked.dispose()  # disposing twice is counted once
+    assert web_engine.handle_stats["live_handles"] == before["live_handles"]
+    assert web_engine.handle_stats["handles_disposed"] == before["handles_disposed"] + 3
+
+
+def test_engine_resource_stats():
+    """Test the engine exposes handle and locator counts"""
+    engine = WebAutomationEngine()
+    engine.page = MagicMock()
+
+    engine.locator("button:has-text('Take a step')")
+    stats = engine.get_resource_stats()
+
+    assert stats["cached_locators"] == 1
+    assert "live_handles" in stats
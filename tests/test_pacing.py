@@ -0,0 +1,90 @@
+"""
+🧪 Test Loop Pacing
+
+Tests the adaptive delay between bot cycles:
+- Exponential backoff while idle, capped at the ceiling
+- Zero delay right after an action or a pushed page change
+- CPU time and round trip reporting
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.core.bot_runner import paced_wait
+from src.core.pacing import LoopPacer
+
+
+def test_idle_backoff_is_exponential_and_capped():
+    """Test idle cycles back off after the grace period, up to max_delay"""
+    pacer = LoopPacer(base_delay=0.1, max_delay=0.5, backoff=2.0, idle_cycles_before_backoff=2)
+
+    delays = []
+    for _ in range(6):
+        pacer.record_cycle(acted=False)
+        delays.append(pacer.next_delay())
+
+    assert delays == pytest.approx([0.1, 0.1, 0.2, 0.4, 0.5, 0.5])
+
+
+def test_action_and_wake_drop_delay_to_zero():
+    """Test the next cycle runs immediately after an action or a page change"""
+    pacer = LoopPacer(idle_cycles_before_backoff=0)
+    for _ in range(5):
+        pacer.record_cycle(acted=False)
+    assert pacer.next_delay() > 0
+
+    pacer.record_cycle(acted=True)
+    assert pacer.next_delay() == 0.0
+
+    pacer.record_cycle(acted=False)
+    pacer.wake()
+    assert pacer.next_delay() == 0.0
+    assert pacer.idle_streak == 0
+
+
+def test_delay_capped_by_next_due_system():
+    """Test the wait never outlasts a system coming off cooldown"""
+    pacer = LoopPacer(base_delay=1.0, max_delay=1.0)
+    pacer.record_cycle(acted=False)
+
+    assert pacer.next_delay(until=0.25) == 0.25
+    assert pacer.next_delay(until=-1.0) == 0.0
+
+
+def test_stats_report_cpu_and_rpcs():
+    """Test loop CPU time and round trips are reported"""
+    pacer = LoopPacer()
+    pacer.record_cycle(acted=False, cpu_seconds=0.002, rpcs=3)
+    pacer.record_cycle(acted=True, cpu_seconds=0.004, rpcs=5)
+
+    stats = pacer.get_stats()
+    assert stats["loop_cycles"] == 2
+    assert stats["loop_cpu_ms_per_cycle"] == pytest.approx(3.0)
+    assert stats["rpcs_per_minute"] > 0
+
+
+@pytest.mark.asyncio
+async def test_paced_wait_skips_sleep_after_action():
+    """Test no wait is issued when the previous cycle acted"""
+    web_engine = MagicMock()
+    web_engine.page_events.active = True
+    web_engine.wait_for_page_change = AsyncMock(return_value=False)
+    pacer = LoopPacer()
+    pacer.record_cycle(acted=True)
+
+    assert await paced_wait(web_engine, pacer) is False
+    web_engine.wait_for_page_change.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_paced_wait_wakes_on_page_change():
+    """Test a pushed page change resets the backoff"""
+    web_engine = MagicMock()
+    web_engine.page_events.active = True
+    web_engine.wait_for_page_change = AsyncMock(return_value=True)
+    pacer = LoopPacer(idle_cycles_before_backoff=0)
+    for _ in range(4):
+        pacer.record_cycle(acted=False)
+
+    assert await paced_wait(web_engine, pacer) is True
+    assert pacer.next_delay() == 0.0
@@ -0,0 +1,103 @@
+"""
+🧪 Test Page Event Bus
+
+Tests the MutationObserver push path:
+- Pushed snapshots wake the waiting loop immediately
+- Timeouts are counted when the page is quiet
+- Stale pushes from a previous document are ignored
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation.page_events import PageEventBus
+from src.automation.web_engine import WebAutomationEngine
+
+TRAVEL_URL = "https://web.simple-mmo.com/travel"
+
+
+@pytest.mark.asyncio
+async def test_publish_wakes_waiter():
+    """Test a pushed change wakes the waiter before the timeout"""
+    bus = PageEventBus()
+
+    async def push_later():
+        await asyncio.sleep(0.01)
+        bus.publish({"url": TRAVEL_URL, "step_available": True})
+
+    task = asyncio.create_task(push_later())
+    woke = await bus.wait_for_change(timeout=2.0)
+    await task
+
+    assert woke is True
+    assert bus.stats["wakeups"] == 1
+    state = bus.pop_state()
+    assert state is not None
+    assert state.step_available is True
+    assert bus.pop_state() is None  # consumed
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_when_quiet():
+    """Test the waiter returns False when nothing changed"""
+    bus = PageEventBus()
+
+    woke = await bus.wait_for_change(timeout=0.01)
+
+    assert woke is False
+    assert bus.stats["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pending_push_returns_immediately():
+    """Test a push that arrived during an action is not lost"""
+    bus = PageEventBus()
+    bus.publish({"url": TRAVEL_URL})
+
+    assert await bus.wait_for_change(timeout=5.0) is True
+
+
+@pytest.mark.asyncio
+async def test_engine_ignores_push_from_previous_document():
+    """Test pushed state is only used when it matches the current URL"""
+    engine = WebAutomationEngine()
+    engine.page = MagicMock()
+    engine.page.url = "https://web.simple-mmo.com/npcs/attack/1"
+
+    engine.page_events.publish({"url": TRAVEL_URL})
+    assert engine.pop_pushed_state() is None
+
+    engine.page.url = TRAVEL_URL
+    engine.page_events.publish({"url": TRAVEL_URL, "attack_available": True})
+    state = engine.pop_pushed_state()
+    assert state is not None
+    assert state.attack_available is True
+
+
+@pytest.mark.asyncio
+async def test_install_observer_exposes_binding_once():
+    """Test the binding and init script are registered once per context"""
+    engine = WebAutomationEngine()
+    engine.page = MagicMock()
+    engine.page.is_closed.return_value = False
+    engine.page.url = TRAVEL_URL
+    engine.page.evaluate = AsyncMock()
+    engine.context = MagicMock()
+    engine.context.expose_function = AsyncMock()
+    engine.context.add_init_script = AsyncMock()
+
+    assert await engine.install_page_observer() is True
+    assert await engine.install_page_observer() is True
+
+    assert engine.context.expose_function.await_count == 1
+    assert engine.page_events.active is True
+
+
+@pytest.mark.asyncio
+async def test_wait_for_page_change_falls_back_to_sleep():
+    """Test polling fallback when the observer could not be installed"""
+    engine = WebAutomationEngine()
+
+    assert engine.page_events.active is False
+    assert await engine.wait_for_page_change(0.01) is False
@@ -0,0 +1,123 @@
+"""
+🧪 Test Page State Snapshot
+
+Tests the single round trip PageState API:
+- URL route classification
+- Payload parsing into typed PageState
+- Systems deciding from the snapshot without extra page queries
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation.page_state import (
+    ROUTE_COMBAT,
+    ROUTE_GATHER,
+    ROUTE_OTHER,
+    ROUTE_TRAVEL,
+    PageState,
+    route_from_url,
+)
+from src.automation.web_engine import WebAutomationEngine
+from src.systems.captcha import CaptchaSystem
+from src.systems.combat import CombatSystem
+from src.systems.gathering import GatheringSystem
+from src.systems.healing import HealingSystem
+from src.systems.steps import StepSystem
+
+
+def test_route_from_url():
+    """Test URL to route classification"""
+    assert route_from_url("https://web.simple-mmo.com/travel") == ROUTE_TRAVEL
+    assert route_from_url("https://web.simple-mmo.com/npcs/attack/123?new_page=true") == ROUTE_COMBAT
+    assert route_from_url("https://web.simple-mmo.com/crafting/material/gather/9") == ROUTE_GATHER
+    assert route_from_url("") == ROUTE_OTHER
+    assert route_from_url(None) == ROUTE_OTHER
+
+
+def test_page_state_from_payload():
+    """Test payload parsing and derived properties"""
+    state = PageState.from_payload(
+        {
+            "url": "https://web.simple-mmo.com/travel",
+            "travel_captcha": False,
+            "combat_captcha": True,
+            "step_found": True,
+            "step_available": True,
+            "step_disabled_styling": True,
+            "available_amount": "3",
+        }
+    )
+
+    assert state.route == ROUTE_TRAVEL
+    assert state.captcha_present is True
+    assert state.step_available is True
+    assert state.step_ready is False  # cooldown styling still applied
+    assert state.available_amount == 3
+    assert state.gather_available is False
+
+
+@pytest.mark.asyncio
+async def test_get_page_state_single_evaluate():
+    """Test the engine returns a PageState from a single evaluate call"""
+    engine = WebAutomationEngine()
+    page = MagicMock()
+    page.is_closed.return_value = False
+    page.url = "https://web.simple-mmo.com/travel"
+    page.evaluate = AsyncMock(return_value={"url": page.url, "attack_available": True})
+    engine.page = page
+
+    state = await engine.get_page_state()
+
+    assert state is not None
+    assert state.attack_available is True
+    assert page.evaluate.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_page_state_installs_missing_helper():
+    """Test the helper is re-installed when the document lost it"""
+    engine = WebAutomationEngine()
+    page = MagicMock()
+    page.is_closed.return_value = False
+    page.url = "https://web.simple-mmo.com/travel"
+    page.evaluate = AsyncMock(side_effect=[None, None, {"url": page.url, "step_available": True}])
+    engine.page = page
+
+    state = await engine.get_page_state()
+
+    assert state is not None
+    assert state.step_available is True
+    assert page.evaluate.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_systems_decide_from_snapshot():
+    """Test every system answers from the snapshot without touching the page"""
+    config = {"auto_gather": True, "auto_combat": True, "auto_heal": True}
+    state = PageState(
+        url="https://web.simple-mmo.com/travel",
+        route=ROUTE_TRAVEL,
+        gather_available=True,
+        attack_available=True,
+        step_available=True,
+        is_dead=True,
+    )
+
+    assert await CaptchaSystem(config).is_captcha_present(state) is False
+    assert await GatheringSystem(config).is_gathering_available(state) is True
+    assert await CombatSystem(config).is_combat_available(state) is True
+    assert await StepSystem(config).is_step_available(state) is True
+
+    health = await HealingSystem(config).check_health_status(state)
+    assert health["needs_healing"] is True
+
+
+@pytest.mark.asyncio
+async def test_auto_flags_still_respected_with_snapshot():
+    """Test disabled systems stay disabled even when the snapshot says available"""
+    config = {"auto_gather": False, "auto_combat": False}
+    state = PageState(gather_available=True, attack_available=True)
+
+    assert await GatheringSystem(config).is_gathering_available(state) is False
+    assert await CombatSystem(config).is_combat_available(state) is False
@@ -0,0 +1,107 @@
+"""
+🧪 Test Page State Prefetch
+
+Tests reading the next PageState during post-action settle delays:
+- A prefetched snapshot is used by the next cycle without another round trip
+- Stale or navigated-away snapshots are discarded
+- Pushed states win over prefetched ones
+- The module helper is a no-op without a running engine
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation.page_state import PageState
+from src.automation.web_engine import WebAutomationEngine, WebEngineManager, prefetch_page_state
+
+TRAVEL_URL = "https://web.simple-mmo.com/travel"
+
+
+def _engine(url: str = TRAVEL_URL) -> WebAutomationEngine:
+    """Engine with a mocked page returning a travel snapshot"""
+    engine = WebAutomationEngine()
+    page = MagicMock()
+    page.is_closed.return_value = False
+    page.url = url
+    page.evaluate = AsyncMock(return_value={"url": url, "step_available": True})
+    engine.page = page
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_prefetched_state_is_used():
+    """Test the next cycle takes the prefetched snapshot without another evaluate"""
+    engine = _engine()
+
+    assert engine.prefetch_page_state(0.0) is True
+    await asyncio.sleep(0)
+    state = await engine.next_page_state()
+
+    assert state is not None
+    assert state.step_available is True
+    assert engine.page.evaluate.await_count == 1
+    assert engine.prefetch_stats["prefetch_used"] == 1
+
+
+@pytest.mark.asyncio
+async def test_prefetch_starts_one_round_trip_before_the_delay_ends():
+    """Test the read is scheduled so it finishes as the settle delay ends"""
+    engine = _engine()
+    engine.state_latency = 0.05
+
+    engine.prefetch_page_state(0.2)
+    await asyncio.sleep(0.1)
+    assert engine.page.evaluate.await_count == 0
+
+    await asyncio.sleep(0.1)
+    assert engine.page.evaluate.await_count == 1
+    assert await engine.take_prefetched_state() is not None
+
+
+@pytest.mark.asyncio
+async def test_prefetch_discarded_after_navigation():
+    """Test a snapshot of another URL is not used"""
+    engine = _engine()
+
+    engine.prefetch_page_state(0.0)
+    await asyncio.sleep(0)
+    engine.page.url = "https://web.simple-mmo.com/npcs/attack/1"
+
+    assert await engine.take_prefetched_state() is None
+    assert engine.prefetch_stats["prefetch_discarded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pushed_state_wins_over_prefetch():
+    """Test a state pushed by the observer replaces the pending prefetch"""
+    engine = _engine()
+    pushed = PageState(url=TRAVEL_URL, attack_available=True)
+    engine.pop_pushed_state = MagicMock(return_value=pushed)
+
+    engine.prefetch_page_state(1.0)
+    state = await engine.next_page_state()
+
+    assert state is pushed
+    assert engine._prefetch_task is None
+    assert engine.prefetch_stats["prefetch_discarded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_prefetch_disabled():
+    """Test nothing is prefetched when disabled in the config"""
+    engine = _engine()
+    engine.prefetch_enabled = False
+
+    assert engine.prefetch_page_state(0.0) is False
+    assert engine._prefetch_task is None
+
+
+def test_module_prefetch_without_engine():
+    """Test systems can request a prefetch without a running engine"""
+    original = WebEngineManager._instance
+    WebEngineManager._instance = None
+    try:
+        assert prefetch_page_state(1.0) is False
+    finally:
+        WebEngineManager._instance = original
@@ -0,0 +1,145 @@
+"""
+🧪 Test Page Recovery
+
+Tests re-attaching after the game page was lost:
+- The existing SimpleMMO tab is picked again on a live connection
+- A dropped CDP connection is re-established and the travel tab recreated
+- Failed attempts are reported, recovery time is measured
+- BotRunner resumes with its scheduler instead of stopping
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation import web_engine as web_engine_module
+from src.automation.web_engine import WebAutomationEngine
+from src.core.bot_runner import BotRunner
+
+TRAVEL_URL = "https://web.simple-mmo.com/travel"
+
+
+def make_page(url: str, closed: bool = False) -> MagicMock:
+    """Mocked tab at url"""
+    page = MagicMock()
+    page.url = url
+    page.is_closed.return_value = closed
+
+    async def goto(target, **kwargs):
+        page.url = target
+
+    page.goto = AsyncMock(side_effect=goto)
+    page.evaluate = AsyncMock(return_value="complete")
+    page.close = AsyncMock()
+    return page
+
+
+def make_engine(pages: list, connected: bool = True) -> WebAutomationEngine:
+    """Engine whose page was lost, with a browser exposing the given tabs"""
+    engine = WebAutomationEngine()
+    context = MagicMock()
+    context.pages = pages
+    context.new_page = AsyncMock(side_effect=lambda: make_page("about:blank"))
+    browser = MagicMock()
+    browser.is_connected.return_value = connected
+    browser.contexts = [context]
+    engine.browser = browser
+    engine.page = None
+    engine.page_lost_reason = "page crashed"
+    engine.install_page_helpers = AsyncMock(side_effect=engine.install_liveness_listeners)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_reattach_picks_game_tab():
+    """Test the live SimpleMMO tab is reused without navigating"""
+    game = make_page(TRAVEL_URL)
+    engine = make_engine(
+        [make_page("https://web.simple-mmo.com/i-am-not-a-bot"), make_page(TRAVEL_URL, True), game]
+    )
+
+    assert await engine.recover() is True
+
+    assert engine.page is game
+    game.goto.assert_not_awaited()
+    assert engine.page_lost_reason is None
+    assert engine.recovery_stats["recoveries"] == 1
+    assert engine.get_resource_stats()["last_recovery_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_reconnects_and_recreates_travel_tab():
+    """Test a dropped connection is re-established and a travel tab opened"""
+    engine = make_engine([make_page("https://example.com")], connected=False)
+    new_browser = engine.browser
+    engine.browser = MagicMock()
+    engine.browser.is_connected.return_value = False
+    engine.playwright = MagicMock()
+    engine.playwright.chromium.connect_over_cdp = AsyncMock(return_value=new_browser)
+
+    assert await engine.recover() is True
+
+    engine.playwright.chromium.connect_over_cdp.assert_awaited_once()
+    assert engine.browser is new_browser
+    assert engine.page.url == TRAVEL_URL
+
+
+@pytest.mark.asyncio
+async def test_crashed_tab_is_not_reused():
+    """Test a crashed travel tab - the only candidate - is closed and replaced"""
+    crashed = make_page(TRAVEL_URL)
+    crashed.evaluate = AsyncMock(side_effect=Exception("Target crashed"))
+    engine = make_engine([crashed])
+    engine.page = crashed
+    engine._mark_page_lost("page crashed", crashed)
+
+    assert await engine.recover() is True
+
+    crashed.close.assert_awaited_once()
+    assert engine.page is not crashed
+    assert engine.page.url == TRAVEL_URL
+    engine.page.evaluate.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_unresponsive_tab_fails_the_attempt(monkeypatch):
+    """Test a tab failing the liveness round trip is never reported as recovered"""
+    monkeypatch.setattr(web_engine_module, "RECOVERY_BACKOFF", 0.0)
+    dead = make_page(TRAVEL_URL)
+    dead.evaluate = AsyncMock(side_effect=Exception("Target crashed"))
+    engine = make_engine([dead])
+    engine.browser.contexts[0].new_page = AsyncMock(return_value=dead)
+
+    assert await engine.recover(attempts=2) is False
+    assert engine.recovery_stats["recovery_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_recovery_is_reported(monkeypatch):
+    """Test every attempt failing ends in a reported failure"""
+    monkeypatch.setattr(web_engine_module, "RECOVERY_BACKOFF", 0.0)
+    engine = make_engine([])
+    engine.browser.contexts[0].new_page = AsyncMock(side_effect=Exception("Target closed"))
+
+    assert await engine.recover(attempts=2) is False
+    assert engine.recovery_stats["recovery_failures"] == 1
+    assert engine.browser.contexts[0].new_page.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_runner_resumes_after_recovery():
+    """Test the cycle re-attaches instead of stopping the bot"""
+    runner = BotRunner({})
+    runner.running = True
+    runner.web_engine = MagicMock()
+    runner.web_engine.get_resource_stats.return_value = {}
+    runner.web_engine.is_context_destroyed = AsyncMock(return_value=True)
+    runner.web_engine.recover = AsyncMock(return_value=True)
+    scheduler = runner.scheduler = MagicMock()
+
+    results = await runner.run_cycle()
+
+    assert results == {"recovered": True}
+    assert runner.running is True
+    assert runner.scheduler is scheduler
+    scheduler.refresh.assert_called_once()
+    runner.web_engine.handle_context_destruction.assert_not_called()
@@ -0,0 +1,169 @@
+"""
+🧪 Test Route State Machine
+
+Tests dispatching only the detectors relevant on the current page:
+- Each route allows its own subset of the scheduled actions
+- Navigation events drive the transitions, timed per route pair
+- The scheduler keeps filtered actions due for a later cycle
+- BotRunner leaves an idle page after a grace period (never the captcha page)
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation.page_state import ROUTE_COMBAT, ROUTE_TRAVEL, PageState
+from src.automation.web_engine import WebAutomationEngine
+from src.core import bot_runner as bot_runner_module
+from src.core.bot_runner import BotRunner
+from src.core.route_machine import RouteMachine
+from src.core.scheduler import ActionScheduler
+
+TRAVEL_URL = "https://web.simple-mmo.com/travel"
+ATTACK_URL = "https://web.simple-mmo.com/npcs/attack/abc123"
+
+
+def test_routes_allow_only_their_actions():
+    """Test combat pages skip gathering/step and unknown pages run everything"""
+    routes = RouteMachine()
+    assert routes.actions is None
+
+    routes.on_navigated(ATTACK_URL)
+    assert routes.route == ROUTE_COMBAT
+    assert routes.actions == {"captcha", "combat", "healing"}
+    assert routes.is_restricted is True
+
+    routes.on_navigated("https://web.simple-mmo.com/i-am-not-a-bot?new_page=true")
+    assert routes.actions == {"captcha"}
+
+    routes.on_navigated(TRAVEL_URL)
+    assert "step" in routes.actions
+    assert routes.is_restricted is False
+
+
+def test_transition_timing_per_route_pair():
+    """Test time spent before leaving a route is recorded per (from, to) pair"""
+    now = [0.0]
+    routes = RouteMachine(clock=lambda: now[0])
+    routes.transition(ROUTE_TRAVEL)
+
+    for _ in range(2):
+        now[0] += 1.0
+        assert routes.on_navigated(ATTACK_URL) is True
+        assert routes.on_navigated(ATTACK_URL) is False
+        now[0] += 3.0
+        routes.on_navigated(TRAVEL_URL)
+
+    stats = routes.get_stats()
+    assert stats["route_travel_to_combat_count"] == 2
+    assert stats["route_travel_to_combat_avg_ms"] == 1000.0
+    assert stats["route_combat_to_travel_avg_ms"] == 3000.0
+
+
+def test_navigation_events_drive_transitions():
+    """Test main frame navigations reach the route machine"""
+    engine = WebAutomationEngine()
+    routes = RouteMachine()
+    engine.add_navigation_listener(routes.on_navigated)
+
+    engine._on_frame_navigated(MagicMock(url=ATTACK_URL, parent_frame=None))
+
+    assert routes.route == ROUTE_COMBAT
+
+
+@pytest.mark.asyncio
+async def test_scheduler_only_runs_allowed_actions():
+    """Test filtered actions are not evaluated but stay due"""
+    scheduler = ActionScheduler(clock=lambda: 100.0)
+    step = AsyncMock(return_value=False)
+    combat = AsyncMock(return_value=False)
+    scheduler.register("combat", combat, priority=20)
+    scheduler.register("step", step, priority=40)
+
+    assert await scheduler.run_once(None, only={"captcha", "combat"}) == {"combat": False}
+    step.assert_not_awaited()
+
+    assert await scheduler.run_once(None) == {"combat": False, "step": False}
+    step.assert_awaited_once()
+
+
+def test_idle_route_left_after_grace_period():
+    """Test a route page is only left after staying idle, and the captcha page never"""
+    now = [0.0]
+    routes = RouteMachine(clock=lambda: now[0], leave_after=10.0)
+    routes.on_navigated(ATTACK_URL)
+
+    assert routes.should_leave(acted=False) is False
+    now[0] += 5.0
+    assert routes.should_leave(acted=True) is False  # combat resumed after its cooldown
+    now[0] += 9.0
+    assert routes.should_leave(acted=False) is False
+    now[0] += 10.0
+    assert routes.should_leave(acted=False) is True
+
+    routes.on_navigated("https://web.simple-mmo.com/i-am-not-a-bot")
+    routes.should_leave(acted=False)
+    now[0] += 600.0
+    assert routes.should_leave(acted=False) is False
+
+
+@pytest.mark.asyncio
+async def test_runner_leaves_idle_page():
+    """Test a combat page without a fight to run sends the bot back to travel after the grace"""
+    runner = BotRunner({"route_leave_after": 0.0})
+    runner.web_engine = MagicMock()
+    runner.web_engine.get_resource_stats.return_value = {}
+    runner.web_engine.is_context_destroyed = AsyncMock(return_value=False)
+    runner.web_engine.pop_step_outcome.return_value = None
+    runner.web_engine.next_page_state = AsyncMock(
+        return_value=PageState(url=ATTACK_URL, route=ROUTE_COMBAT)
+    )
+    runner.scheduler = MagicMock()
+    runner.scheduler.run_once = AsyncMock(return_value={"combat": False})
+    runner.steps = MagicMock()
+    runner.steps.navigate_to_travel = AsyncMock(return_value=True)
+
+    results = await runner.run_cycle()
+
+    assert "error" not in results
+    assert runner.scheduler.run_once.await_args.kwargs["only"] == {"captcha", "combat", "healing"}
+    runner.steps.navigate_to_travel.assert_awaited_once()
+
+    # Default grace: one idle cycle is not enough
+    runner.routes.leave_after = 60.0
+    await runner.run_cycle()
+    runner.steps.navigate_to_travel.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_missing_page_state_skips_dispatch(monkeypatch):
+    """Test a failed page read skips the cycle instead of crashing the loop"""
+    runner = BotRunner({})
+    runner.web_engine = MagicMock()
+    runner.web_engine.get_resource_stats.return_value = {}
+    runner.web_engine.is_context_destroyed = AsyncMock(return_value=False)
+    runner.web_engine.pop_step_outcome.return_value = None
+    runner.web_engine.next_page_state = AsyncMock(return_value=None)
+    runner.scheduler = MagicMock()
+    runner.scheduler.run_once = AsyncMock(return_value={})
+
+    assert await runner.run_cycle() == {}
+    runner.scheduler.run_once.assert_not_awaited()
+
+    # Standalone loop: keeps going until stopped
+    scheduler = MagicMock()
+    scheduler.run_once = AsyncMock(return_value={})
+    monkeypatch.setattr(bot_runner_module, "build_action_scheduler", lambda *args: scheduler)
+    monkeypatch.setattr(
+        bot_runner_module, "paced_wait", AsyncMock(side_effect=[True, KeyboardInterrupt])
+    )
+    cleanup = AsyncMock()
+    monkeypatch.setattr(bot_runner_module, "_cleanup_systems", cleanup)
+    engine = runner.web_engine
+    engine.next_page_state = AsyncMock(return_value=None)
+    engine.pop_step_outcome.return_value = None
+
+    await bot_runner_module.run_bot_loop(engine, *[MagicMock()] * 5)
+
+    assert engine.next_page_state.await_count == 2
+    scheduler.run_once.assert_not_awaited()
+    cleanup.assert_awaited_once()
@@ -0,0 +1,160 @@
+"""
+🧪 Test Action Scheduler
+
+Tests the cooldown-aware priority scheduler:
+- Systems on cooldown or disabled are skipped without being evaluated
+- Priority order and stop-on-success semantics of the old if-chain
+- Per-system counters for get_stats()
+- Per-system time budgets: deadline scope per run and overrun counters
+- An interrupted action (captcha/death) ends the cycle
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.core.bot_runner import build_action_scheduler
+from src.core.scheduler import ActionScheduler
+from src.utils.deadlines import current_deadline
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_cooldown_skips_evaluation():
+    """Test an action is not evaluated before its next eligible time"""
+    clock = FakeClock()
+    ready_at = {"combat": clock.now + 2.0}
+    handler = AsyncMock(return_value=False)
+    scheduler = ActionScheduler(clock=clock)
+    scheduler.register("combat", handler, next_eligible=lambda: ready_at["combat"])
+
+    await scheduler.run_once()
+    handler.assert_not_awaited()
+    assert scheduler.next_wakeup() == clock.now + 2.0
+
+    clock.now += 2.0
+    await scheduler.run_once()
+    handler.assert_awaited_once()
+
+    stats = scheduler.get_stats()
+    assert stats["scheduler_combat_skipped"] == 1
+    assert stats["scheduler_combat_evaluated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_priority_and_stop_on_success():
+    """Test higher priority runs first and a successful action ends the cycle"""
+    calls = []
+
+    def make_handler(name, acted):
+        async def handler(state):
+            calls.append(name)
+            return acted
+
+        return handler
+
+    scheduler = ActionScheduler()
+    scheduler.register("step", make_handler("step", True), priority=40, stop_on_success=False)
+    scheduler.register("quest", make_handler("quest", False), priority=50)
+    scheduler.register("captcha", make_handler("captcha", False), priority=0)
+
+    results = await scheduler.run_once()
+    assert calls == ["captcha", "step", "quest"]
+    assert results == {"captcha": False, "step": True, "quest": False}
+
+    calls.clear()
+    scheduler.register("gathering", make_handler("gathering", True), priority=10)
+    await scheduler.run_once()
+    assert calls == ["captcha", "gathering"]
+
+
+@pytest.mark.asyncio
+async def test_readiness_predicate_skips_disabled_systems():
+    """Test a disabled system costs no evaluation"""
+    handler = AsyncMock(return_value=True)
+    scheduler = ActionScheduler()
+    scheduler.register("gathering", handler, is_ready=lambda: False)
+
+    assert await scheduler.run_once() == {}
+    handler.assert_not_awaited()
+    assert scheduler.get_stats()["scheduler_gathering_skipped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_system_cooldowns_are_registered():
+    """Test the bot's systems are skipped while their own cooldown runs"""
+    gathering = MagicMock(
+        auto_gather=True, last_gather_time=0, gather_cooldown=2.0, last_interrupt=None
+    )
+    combat = MagicMock(auto_combat=True, combat_cooldown=2.0, last_interrupt=None)
+    combat.last_combat_time = 10**12  # just fought
+    combat.is_combat_available = AsyncMock(return_value=True)
+    gathering.is_gathering_available = AsyncMock(return_value=False)
+    captcha = MagicMock()
+    captcha.is_captcha_present = AsyncMock(return_value=False)
+    healing = MagicMock(auto_heal=False)
+    steps = MagicMock()
+    steps.is_step_available = AsyncMock(return_value=False)
+
+    scheduler = build_action_scheduler(gathering, healing, steps, combat, captcha)
+    results = await scheduler.run_once()
+
+    assert "combat" not in results
+    combat.is_combat_available.assert_not_awaited()
+    assert results == {"captcha": False, "gathering": False, "step": False}
+
+
+@pytest.mark.asyncio
+async def test_budget_overruns_are_counted():
+    """Test each run gets its budget as deadline and overruns are reported per system"""
+    seen = {}
+
+    async def quest(state):
+        seen["deadline"] = current_deadline()
+        await asyncio.sleep(0.05)
+        return True
+
+    scheduler = ActionScheduler()
+    scheduler.register("quest", quest, budget=0.01)
+    scheduler.register("step", AsyncMock(return_value=False), priority=0, budget=10.0)
+
+    await scheduler.run_once()
+
+    assert seen["deadline"] is not None
+    assert current_deadline() is None
+    stats = scheduler.get_stats()
+    assert stats["scheduler_quest_overruns"] == 1
+    assert stats["scheduler_quest_overrun_ms"] >= 30
+    assert stats["scheduler_step_overruns"] == 0
+
+
+@pytest.mark.asyncio
+async def test_interrupted_action_ends_cycle():
+    """Test lower priority systems do not run on the stale snapshot after an interrupt"""
+    combat = MagicMock(last_interrupt="captcha")
+    step = AsyncMock(return_value=True)
+    scheduler = ActionScheduler()
+    scheduler.register(
+        "combat",
+        AsyncMock(return_value=False),
+        priority=20,
+        interrupted=lambda: combat.last_interrupt,
+    )
+    scheduler.register("step", step, priority=40)
+
+    assert await scheduler.run_once() == {"combat": False}
+    step.assert_not_awaited()
+    assert scheduler.get_stats()["scheduler_combat_interrupted"] == 1
+
+    # Step stays due and runs on the next cycle
+    combat.last_interrupt = None
+    assert await scheduler.run_once() == {"combat": False, "step": True}
@@ -0,0 +1,194 @@
+"""
+🧪 Test Adaptive Selector Registry
+
+Tests the selector ranking used by every fallback selector list:
+- Winning selectors move to the front of their group
+- Rankings survive a restart (persisted to disk)
+- find_first records hits/misses and returns the first visible element
+- Whole lists are resolved with one in-page sweep (single round trip)
+- Invalid selectors are dropped once instead of failing every cycle
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation.selectors import SelectorRegistry, to_playwright_selector, validate_selector
+from src.automation.web_engine import compile_selector, match_selector_list
+
+GROUP = "test.group"
+SELECTORS = ['button:has-text("A")', '//button[contains(text(), "B")]', "#c"]
+
+
+def test_to_playwright_selector():
+    """Test bare XPath is prefixed and CSS is untouched"""
+    assert to_playwright_selector("//a") == "xpath=//a"
+    assert to_playwright_selector("#c") == "#c"
+
+
+def test_declared_order_without_history(tmp_path):
+    """Test a cold registry keeps the declared order"""
+    registry = SelectorRegistry(tmp_path / "ranking.json")
+    registry.register(GROUP, SELECTORS)
+
+    assert registry.ordered(GROUP) == SELECTORS
+
+
+def test_winner_moves_first(tmp_path):
+    """Test the selector that usually wins is tried first"""
+    registry = SelectorRegistry(tmp_path / "ranking.json")
+    registry.register(GROUP, SELECTORS)
+
+    for _ in range(3):
+        registry.record(GROUP, SELECTORS[0], False, 0.01)
+        registry.record(GROUP, SELECTORS[1], False, 0.01)
+        registry.record(GROUP, SELECTORS[2], True, 0.01)
+
+    assert registry.ordered(GROUP)[0] == "#c"
+
+
+def test_ranking_persists_between_sessions(tmp_path):
+    """Test a warm start hits on the first query"""
+    path = tmp_path / "ranking.json"
+    registry = SelectorRegistry(path)
+    registry.register(GROUP, SELECTORS)
+    registry.record(GROUP, SELECTORS[2], True, 0.01)
+    registry.save()
+
+    warm = SelectorRegistry(path)
+    assert warm.ordered(GROUP, SELECTORS)[0] == "#c"
+
+
+def test_corrupt_ranking_file_is_ignored(tmp_path):
+    """Test a broken ranking file does not break startup"""
+    path = tmp_path / "ranking.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    registry = SelectorRegistry(path)
+    assert registry.ordered(GROUP, SELECTORS) == SELECTORS
+
+
+@pytest.mark.asyncio
+async def test_find_first_records_outcomes(tmp_path):
+    """Test misses and hits are recorded and the first visible element is returned"""
+    registry = SelectorRegistry(tmp_path / "ranking.json")
+    registry.register(GROUP, SELECTORS)
+
+    missing = MagicMock()
+    missing.first.is_visible = AsyncMock(return_value=False)
+    element = MagicMock()
+    element.first.is_visible = AsyncMock(return_value=True)
+    page = MagicMock()
+    page.locator.side_effect = [missing, element]
+
+    found = await registry.find_first(page, GROUP)
+
+    assert found is element.first
+    page.locator.assert_called_with('xpath=//button[contains(text(), "B")]')
+    stats = registry.get_stats()[GROUP]
+    assert stats[SELECTORS[0]]["misses"] == 1
+    assert stats[SELECTORS[1]]["hits"] == 1
+    assert registry.ordered(GROUP)[0] == SELECTORS[1]
+
+
+def test_compile_selector():
+    """Test Playwright selectors are translated into in-page queries"""
+    assert compile_selector('a:has-text("Attack")') == {"kind": "text", "query": "a", "text": "attack"}
+    assert compile_selector("button:text('Take a step')")["text"] == "take a step"
+    assert compile_selector('a:has-text("I\'m a person!")')["text"] == "i'm a person!"
+    assert compile_selector("//a[@href]") == {"kind": "xpath", "query": "//a[@href]", "text": ""}
+    assert compile_selector("xpath=//b")["query"] == "//b"
+    assert compile_selector("#crafting_button")["kind"] == "css"
+
+
+@pytest.mark.asyncio
+async def test_match_selector_list_single_round_trip():
+    """Test a whole list is evaluated with one page.evaluate call"""
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value={"index": 1, "visible": True, "enabled": False, "errors": [0]})
+
+    sweep = await match_selector_list(page, SELECTORS, mark=True)
+
+    assert page.evaluate.await_count == 1
+    assert sweep.found is True
+    assert sweep.selector == SELECTORS[1]
+    assert sweep.enabled is False
+    assert sweep.errors == (0,)
+    assert sweep.marker.startswith("[data-bot-match=")
+
+
+@pytest.mark.asyncio
+async def test_detect_uses_sweep(tmp_path):
+    """Test presence checks cost one round trip and still update the ranking"""
+    registry = SelectorRegistry(tmp_path / "ranking.json")
+    registry.register(GROUP, SELECTORS)
+
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value={"index": 2, "visible": True, "enabled": True, "errors": []})
+    page.query_selector = AsyncMock()
+
+    assert await registry.detect(page, GROUP) is True
+    page.query_selector.assert_not_awaited()
+    assert registry.ordered(GROUP)[0] == "#c"
+
+
+@pytest.mark.asyncio
+async def test_find_first_returns_marker_locator(tmp_path):
+    """Test the swept element is returned as a Locator on its marker"""
+    registry = SelectorRegistry(tmp_path / "ranking.json")
+    registry.register(GROUP, SELECTORS)
+
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value={"index": 0, "visible": True, "enabled": True, "errors": []})
+    page.query_selector = AsyncMock()
+
+    assert await registry.find_first(page, GROUP) is page.locator.return_value
+    assert page.evaluate.await_count == 1
+    page.query_selector.assert_not_awaited()  # no ElementHandle created
+    assert page.locator.call_args.args[0].startswith("[data-bot-match=")
+
+
+def test_static_validation_rejects_known_bad_selectors():
+    """Test jQuery pseudo-classes and pasted class lists are rejected up front"""
+    assert validate_selector("button:contains('Take a step')") is not None
+    assert validate_selector("px-3 py-2 font-medium text-sm rounded-md") is not None
+    assert validate_selector("div span") is None
+    assert validate_selector(".px-3.py-2") is None
+    assert validate_selector('//a[contains(text(), "x")]') is None
+
+
+def test_invalid_selectors_are_never_ranked(tmp_path):
+    """Test dropped selectors are filtered from registered and explicit lists"""
+    registry = SelectorRegistry(tmp_path / "ranking.json")
+    selectors = ["a:contains('step')", "#c"]
+    registry.register(GROUP, selectors)
+
+    assert registry.ordered(GROUP) == ["#c"]
+    assert registry.ordered(GROUP, selectors) == ["#c"]
+    assert "a:contains('step')" in registry.get_invalid_selectors()
+
+
+@pytest.mark.asyncio
+async def test_validate_drops_selectors_rejected_by_browser(tmp_path):
+    """Test the in-page syntax check runs once for all groups"""
+    registry = SelectorRegistry(tmp_path / "ranking.json")
+    registry.register(GROUP, SELECTORS)
+    registry.register("other.group", ["#c", "div[["])
+
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value=[3])  # unique selectors: A, B, #c, div[[
+
+    assert await registry.validate(page) == 1
+    assert page.evaluate.await_count == 1
+    assert registry.ordered("other.group") == ["#c"]
+
+
+def test_repeated_errors_disable_selector(tmp_path):
+    """Test a selector that keeps throwing stops being tried"""
+    registry = SelectorRegistry(tmp_path / "ranking.json")
+    registry.register(GROUP, SELECTORS)
+
+    for _ in range(3):
+        registry.record_error(GROUP, "#c", "boom")
+
+    assert "#c" not in registry.ordered(GROUP)
+    assert registry.get_stats()[GROUP]["#c"]["errors"] == 3
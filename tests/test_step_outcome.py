@@ -0,0 +1,123 @@
+"""
+🧪 Test Step Outcome
+
+Tests the network-driven travel state:
+- Recorded step responses parse into typed StepOutcome objects
+- The engine keeps outcomes of step responses only
+- The bot acts on the outcome without probing the page
+"""
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation.step_outcome import (
+    OUTCOME_NPC,
+    OUTCOME_TEXT,
+    StepOutcome,
+    is_step_response_url,
+)
+from src.automation.web_engine import WebAutomationEngine
+from src.core.bot_runner import handle_step_outcome
+from src.core.scheduler import ActionScheduler
+
+FIXTURES = Path(__file__).parent / "fixtures" / "step_responses"
+
+
+def load_fixture(path: Path) -> dict:
+    """Load a recorded step response"""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+@pytest.mark.parametrize("path", sorted(FIXTURES.glob("*.json")), ids=lambda p: p.stem)
+def test_recorded_payloads(path):
+    """Test every recorded step response parses into the expected outcome"""
+    fixture = load_fixture(path)
+    expected = fixture["expected"]
+
+    assert is_step_response_url(fixture["url"]) is True
+    outcome = StepOutcome.from_payload(fixture["payload"])
+
+    assert outcome.kind == expected["kind"]
+    assert outcome.wait_seconds == pytest.approx(expected["wait_seconds"])
+    assert outcome.target_url == expected["target_url"]
+
+
+def test_non_step_urls_are_ignored():
+    """Test only the travel step endpoint is recognised"""
+    assert is_step_response_url("https://web.simple-mmo.com/travel") is False
+    assert is_step_response_url("https://web.simple-mmo.com/api/user/stats") is False
+    assert is_step_response_url(None) is False
+
+
+def test_cooldown_remaining():
+    """Test the cooldown counts down from when the response was received"""
+    outcome = StepOutcome(kind=OUTCOME_TEXT, wait_seconds=4.0, received_at=time.monotonic() - 3)
+
+    assert 0.0 < outcome.cooldown_remaining <= 1.0
+    assert StepOutcome(kind=OUTCOME_TEXT).cooldown_remaining == 0.0
+
+
+@pytest.mark.asyncio
+async def test_engine_keeps_step_responses_only():
+    """Test the response listener parses step responses and wakes the loop"""
+    engine = WebAutomationEngine()
+    fixture = load_fixture(FIXTURES / "npc.json")
+
+    other = MagicMock()
+    other.url = "https://web.simple-mmo.com/api/user/stats"
+    other.json = AsyncMock(return_value={})
+    await engine._on_step_response(other)
+    assert engine.pop_step_outcome() is None
+    other.json.assert_not_awaited()
+
+    response = MagicMock()
+    response.url = fixture["url"]
+    response.ok = True
+    response.json = AsyncMock(return_value=fixture["payload"])
+    await engine._on_step_response(response)
+
+    outcome = engine.pop_step_outcome()
+    assert outcome.kind == OUTCOME_NPC
+    assert engine.pop_step_outcome() is None  # consumed
+    assert await engine.page_events.wait_for_change(timeout=0.01) is True
+
+
+@pytest.mark.asyncio
+async def test_npc_outcome_goes_straight_to_combat():
+    """Test an NPC step starts combat without availability probes"""
+    combat = MagicMock()
+    combat.auto_combat = True
+    combat.start_combat = AsyncMock(return_value=True)
+    combat.is_combat_available = AsyncMock()
+    outcome = StepOutcome.from_payload(load_fixture(FIXTURES / "npc.json")["payload"])
+
+    assert await handle_step_outcome(outcome, MagicMock(), combat) == "combat"
+    combat.is_combat_available.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_text_outcome_defers_step_until_cooldown_ends():
+    """Test a plain step holds the step action back instead of sleeping"""
+    now = [100.0]
+    scheduler = ActionScheduler(clock=lambda: now[0])
+    step = AsyncMock(return_value=True)
+    captcha = AsyncMock(return_value=False)
+    scheduler.register("captcha", captcha, priority=0)
+    scheduler.register("step", step, priority=40)
+    outcome = StepOutcome(kind=OUTCOME_TEXT, wait_seconds=5.0)
+
+    started = time.monotonic()
+    assert await handle_step_outcome(outcome, MagicMock(), MagicMock(), scheduler) is None
+    assert time.monotonic() - started < 0.5
+
+    # Captcha checks keep running during the cooldown, the step waits for it
+    assert await scheduler.run_once(None) == {"captcha": False}
+    assert scheduler.actions["step"].due_at == pytest.approx(105.0, abs=0.1)
+    scheduler.refresh()
+    assert await scheduler.run_once(None) == {"captcha": False}
+
+    now[0] += 5.0
+    assert await scheduler.run_once(None) == {"captcha": False, "step": True}
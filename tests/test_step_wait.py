@@ -0,0 +1,73 @@
+"""
+🧪 Test Step Readiness Waiter
+
+Tests waiting for the step button inside the page:
+- One pending evaluate instead of polling queries while on cooldown
+- The missing-button timeout is still respected
+- Polling fallback when the in-page wait cannot run
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.automation.web_engine import STEP_READY, wait_for_step_ready
+from src.systems.steps import StepSystem
+
+
+def make_step_system(page):
+    """Create a StepSystem bound to a mocked engine/page"""
+    steps = StepSystem({})
+    steps.web_engine = MagicMock()
+    steps.web_engine.page = page
+    steps._check_button_availability = AsyncMock(return_value=(True, True, False))
+    return steps
+
+
+@pytest.mark.asyncio
+async def test_step_ready_single_evaluate():
+    """Test the wait is one evaluate with timings passed in milliseconds"""
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value={"event": "ready", "found": True})
+
+    event = await wait_for_step_ready(page, missing_timeout=60.0, timeout=30.0, polling=0.2)
+
+    assert event == STEP_READY
+    args = page.evaluate.await_args.args[1]
+    assert args == {"missing": 60000, "timeout": 30000, "polling": 200}
+
+
+@pytest.mark.asyncio
+async def test_cooldown_costs_no_polling_queries():
+    """Test a long cooldown is waited out in the page without per-poll queries"""
+    page = MagicMock()
+    page.evaluate = AsyncMock(
+        side_effect=[{"event": "waiting"}, {"event": "waiting"}, {"event": "ready"}]
+    )
+    steps = make_step_system(page)
+
+    assert await steps.wait_for_step_button(timeout=60.0) is True
+
+    assert page.evaluate.await_count == 3
+    steps._check_button_availability.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_missing_button_gives_up():
+    """Test the missing-button timeout ends the wait"""
+    page = MagicMock()
+    page.evaluate = AsyncMock(return_value={"event": "missing", "found": False})
+    steps = make_step_system(page)
+
+    assert await steps.wait_for_step_button(timeout=0.5) is False
+    assert page.evaluate.await_args.args[1]["missing"] <= 500
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_polling():
+    """Test the polling check is used when the in-page wait cannot run"""
+    page = MagicMock()
+    page.evaluate = AsyncMock(side_effect=Exception("Execution context was destroyed"))
+    steps = make_step_system(page)
+
+    assert await steps.wait_for_step_button(timeout=1.0) is True
+    steps._check_button_availability.assert_awaited_once()
@@ -0,0 +1,104 @@
+"""
+🧪 Test Timing Tuner
+
+Tests online tuning of combat/gathering timings:
+- Polling interval and timeout follow the observed percentiles
+- Configured floors and ceilings are respected
+- Inter-action delays shrink while healthy and back off after timeouts
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from src.core.tuner import ACTION_ATTACK, ACTION_GATHER, TimingTuner
+from src.systems.gathering import GatheringSystem
+
+
+def make_tuner(samples, action=ACTION_ATTACK, **kwargs):
+    """Create a tuner fed with click-to-change durations"""
+    tuner = TimingTuner(min_samples=4, **kwargs)
+    for seconds in samples:
+        tuner.record(action, seconds)
+    return tuner
+
+
+def test_no_suggestion_before_enough_samples():
+    """Test nothing is retuned from a handful of observations"""
+    tuner = make_tuner([0.3, 0.3])
+
+    assert tuner.percentile(ACTION_ATTACK, 50) is None
+    assert tuner.suggest(ACTION_ATTACK, {"attack_delay": 0.1}) == {}
+
+
+def test_interval_and_timeout_follow_percentiles():
+    """Test polling follows the fast completions and the timeout the slow ones"""
+    tuner = make_tuner([0.4, 0.5, 0.5, 0.6, 0.6, 0.7, 0.8, 1.2])
+
+    suggestion = tuner.suggest(ACTION_ATTACK, {"attack_delay": 0.1})
+
+    assert suggestion["button_check_interval"] == pytest.approx(0.1)  # p10 / 4
+    assert suggestion["max_wait_time"] == pytest.approx(1.8)  # p99 * 1.5
+    assert suggestion["attack_delay"] == pytest.approx(0.09)
+
+
+def test_limits_are_respected():
+    """Test configured floors win over very fast observations"""
+    tuner = make_tuner([0.01] * 8, limits={"combat.button_check_interval": (0.05, 0.25)})
+
+    suggestion = tuner.suggest(ACTION_ATTACK, {})
+
+    assert suggestion["button_check_interval"] == 0.05
+    assert suggestion["max_wait_time"] == 1.0  # default floor
+
+
+def test_timeout_backs_off_delay():
+    """Test a timed out wait makes the inter-action delay longer again"""
+    tuner = make_tuner([0.5] * 8, action=ACTION_GATHER)
+    tuner.record(ACTION_GATHER, 5.0, ok=False)
+
+    suggestion = tuner.suggest(ACTION_GATHER, {"gather_delay": 0.2})
+
+    assert suggestion["gather_delay"] == pytest.approx(0.4)
+    assert tuner.stats[ACTION_GATHER]["timeouts"] == 1
+
+
+@pytest.mark.asyncio
+async def test_apply_uses_set_timing_config():
+    """Test retuning goes through the system's set_timing_config"""
+    tuner = make_tuner([0.4, 0.5, 0.5, 0.6, 0.6, 0.7, 0.8, 1.2], action=ACTION_GATHER)
+    gathering = GatheringSystem({"auto_gather": True})
+    gathering.set_timing_config = AsyncMock()
+
+    changed = await tuner.apply(
+        gathering, ACTION_GATHER, floors={"gathering.button_check_interval": 0.2}
+    )
+
+    gathering.set_timing_config.assert_awaited_once_with(**changed)
+    assert changed["button_check_interval"] == 0.2
+    assert changed["max_wait_time"] == pytest.approx(1.8)
+    # Floors of one call are not written into the shared limits
+    assert tuner.limits["gathering.button_check_interval"] == (0.02, 0.5)
+
+
+def test_attack_delay_keeps_a_floor():
+    """Test the attack delay stops shrinking above zero while attacks stay healthy"""
+    tuner = make_tuner([0.5] * 8)
+
+    delay = 0.1
+    for _ in range(50):
+        delay = tuner.suggest(ACTION_ATTACK, {"attack_delay": delay})["attack_delay"]
+
+    assert delay == 0.05
+
+
+@pytest.mark.asyncio
+async def test_gather_wait_records_cycle_time():
+    """Test the gather waiter feeds its click-to-enable time to the tuner"""
+    gathering = GatheringSystem({"auto_gather": True})
+    gathering.tuner = TimingTuner()
+    button = MagicMock()
+    button.evaluate = AsyncMock(return_value={"event": "enabled"})
+
+    await gathering._wait_for_gather_completion(MagicMock(), button)
+
+    assert gathering.tuner.stats[ACTION_GATHER]["samples"] == 1
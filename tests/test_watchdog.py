@@ -0,0 +1,84 @@
+"""
+🧪 Test Cycle Watchdog
+
+Tests making stalled cycles visible:
+- A cycle past the stall deadline is reported once with its await chain
+- The report carries the current URL and last PageState
+- Optionally the stalled cycle is cancelled and the loop keeps running
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from src.automation.page_state import PageState
+from src.core.watchdog import CycleWatchdog
+
+
+async def wait_for_step_button() -> bool:
+    """Stands in for a wait that never ends"""
+    await asyncio.sleep(600)
+    return True
+
+
+async def hung_cycle() -> dict:
+    """Cycle stuck in an inner wait"""
+    await wait_for_step_button()
+    return {}
+
+
+@pytest.fixture
+def stalled_runner(make_runner):
+    """Factory of BotRunners whose cycle hangs, with a fast watchdog"""
+
+    def factory(**config):
+        runner = make_runner({"stall_deadline": 0.05, **config}, cycle=hung_cycle)
+        runner.watchdog.check_interval = 0.01
+        runner.last_state = PageState(step_available=False)
+        return runner
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_stall_reported_once_with_stack(stalled_runner):
+    """Test a stalled cycle is logged once with where it is stuck"""
+    runner = stalled_runner()
+    cycle = asyncio.create_task(runner.run_cycle())
+    await asyncio.sleep(0.15)
+
+    report = runner.watchdog.last_report
+    assert runner.watchdog.stats["stalls"] == 1
+    assert any("wait_for_step_button" in frame for frame in report["stack"])
+    assert report["url"] == "https://web.simple-mmo.com/travel"
+    assert report["page_state"] is runner.last_state
+    assert not cycle.done()
+
+    cycle.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cycle
+    runner.watchdog.stop()
+
+
+@pytest.mark.asyncio
+async def test_stalled_cycle_cancelled(stalled_runner):
+    """Test cancel_stalled_cycles ends the cycle so the loop continues"""
+    runner = stalled_runner(cancel_stalled_cycles=True)
+
+    results = await asyncio.wait_for(runner.run_cycle(), timeout=1.0)
+
+    assert results == {"interrupted": True}
+    assert runner.get_stats()["watchdog_cancelled"] == 1
+    assert runner.pacer.stats["active_cycles"] == 0
+    runner.watchdog.stop()
+
+
+def test_cycle_within_deadline_is_quiet():
+    """Test a cycle finishing in time produces no report"""
+    watchdog = CycleWatchdog(stall_after=60.0)
+    watchdog.cycle_started(MagicMock())
+
+    assert watchdog.check() is None
+    watchdog.cycle_finished()
+    assert watchdog.check() is None
+    assert watchdog.stats["stalls"] == 0